@@ -0,0 +1,338 @@
+"""
+Swiss Horoscope - JSON API (ASGI)
+Backend for mobile clients: charts, fortunes and synastry over HTTP
+
+Run with any ASGI server, e.g.:
+
+    uvicorn api:app --host 0.0.0.0 --port 8000 --workers 4
+
+Swiss Ephemeris calls block, so every handler runs in a worker thread pool
+(size from $SWISS_HOROSCOPE_API_WORKERS) and the event loop only parses and
+writes HTTP. Natal charts go through the shared chart cache.
+
+Endpoints (all POST bodies are JSON; a "birth" object is
+{year, month, day, hour, minute, latitude, longitude, timezone}):
+
+    GET  /health
+    POST /chart             birth
+    POST /chart/svg         {birth, size} -> {svg}
+    POST /fortune/daily     {birth, lang}
+    POST /fortune/monthly   {birth, year, month, lang}
+    POST /fortune/yearly    {birth, year, lang}
+    POST /synastry          {person1: birth, person2: birth}
+    POST /batch             {requests: [{path, body}, ...]} -> [{status, body}, ...]
+
+Bad input values (unknown time zone, month 13, polar or NaN latitude, years the
+ephemeris does not cover) are answered with 400 {"error": ...}; in a batch each
+item fails on its own.
+"""
+
+import asyncio
+import json
+import math
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Tuple
+
+import pytz
+import swisseph as swe
+
+from core.swiss_eph import SwissEphemerisCalculator
+from core.chart_cache import get_chart_cache
+from core.wheel_data import calculate_synastry_aspects
+from core.fortune_reader import generate_detailed_daily_fortune, generate_monthly_outlook, generate_yearly_outlook
+from core.svg_chart import DEFAULT_SIZE, natal_chart_svg
+
+
+MAX_BODY_BYTES = 1 << 20
+MAX_BATCH = 256
+MAX_SVG_SIZE = 4096
+WORKERS = int(os.environ.get('SWISS_HOROSCOPE_API_WORKERS', min(32, (os.cpu_count() or 1) + 4)))
+
+BIRTH_FIELDS = ('year', 'month', 'day', 'hour', 'minute', 'latitude', 'longitude')
+
+# Years every endpoint can serve (local dates near year 1 overflow datetime, and the
+# Moshier fallback ephemeris stops at 3000)
+MIN_YEAR = 2
+MAX_YEAR = 2999
+
+# Errors from bad input values deep in the calculations, answered with a 400
+INPUT_ERRORS = (ValueError, KeyError, OverflowError, pytz.UnknownTimeZoneError, swe.Error)
+
+
+class APIError(Exception):
+    """Error returned to the client as {"error": message}"""
+    
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+# ============== Handlers (run in the worker pool) ==============
+
+_calculator = None
+
+
+def get_calculator() -> SwissEphemerisCalculator:
+    """Shared calculator (pyswisseph keeps its settings process-wide anyway)"""
+    global _calculator
+    if _calculator is None:
+        _calculator = SwissEphemerisCalculator(cache=get_chart_cache())
+    return _calculator
+
+
+def parse_birth(data: Dict) -> Dict:
+    """Validate a birth object into calculate_all keyword arguments"""
+    if not isinstance(data, dict):
+        raise APIError(400, "birth data must be an object")
+    missing = [f for f in BIRTH_FIELDS if f not in data]
+    if missing:
+        raise APIError(400, f"missing fields: {', '.join(missing)}")
+    try:
+        birth = {f: int(data[f]) for f in ('year', 'month', 'day', 'hour', 'minute')}
+        birth['latitude'] = float(data['latitude'])
+        birth['longitude'] = float(data['longitude'])
+    except (TypeError, ValueError, OverflowError):
+        raise APIError(400, "birth fields must be numbers") from None
+    _check_year(birth['year'], 'year')
+    if not (math.isfinite(birth['latitude']) and -90 < birth['latitude'] < 90):
+        raise APIError(400, "latitude must be between -90 and 90 (exclusive)")
+    if not (math.isfinite(birth['longitude']) and -180 <= birth['longitude'] <= 180):
+        raise APIError(400, "longitude must be between -180 and 180")
+    birth['timezone'] = _timezone(data.get('timezone', 'Asia/Bangkok'))
+    return birth
+
+
+def _check_year(year: int, name: str) -> int:
+    """Reject years outside MIN_YEAR..MAX_YEAR"""
+    if not MIN_YEAR <= year <= MAX_YEAR:
+        raise APIError(400, f"{name} must be between {MIN_YEAR} and {MAX_YEAR}")
+    return year
+
+
+def _timezone(name) -> str:
+    """A known IANA time zone name"""
+    name = str(name)
+    try:
+        pytz.timezone(name)
+    except pytz.UnknownTimeZoneError:
+        raise APIError(400, f"unknown timezone: {name}") from None
+    return name
+
+
+def natal_chart(data: Dict) -> Dict:
+    """calculate_all for a birth object"""
+    try:
+        return get_calculator().calculate_all(**parse_birth(data))
+    except (ValueError, OverflowError, swe.Error) as e:
+        # e.g. day out of range for month, or a date the ephemeris does not cover
+        raise APIError(400, str(e)) from None
+
+
+def _int_field(body: Dict, name: str) -> int:
+    """Required integer field of a request body"""
+    try:
+        return int(body[name])
+    except KeyError:
+        raise APIError(400, f"missing field: {name}") from None
+    except (TypeError, ValueError, OverflowError):
+        raise APIError(400, f"{name} must be a number") from None
+
+
+def handle_chart(body: Dict) -> Dict:
+    """Natal chart"""
+    return natal_chart(body)
+
+
+def handle_chart_svg(body: Dict) -> Dict:
+    """Natal chart wheel as an SVG document"""
+    chart = natal_chart(body.get('birth'))
+    size = _int_field(body, 'size') if 'size' in body else DEFAULT_SIZE
+    if not 64 <= size <= MAX_SVG_SIZE:
+        raise APIError(400, f"size must be between 64 and {MAX_SVG_SIZE}")
+    return {'svg': natal_chart_svg(chart['planets'], chart['houses'], chart['ascendant'],
+                                   chart['midheaven'], chart['aspects'], size=size)}
+
+
+def handle_daily(body: Dict) -> Dict:
+    """Daily fortune for a natal chart"""
+    chart = natal_chart(body.get('birth'))
+    return generate_detailed_daily_fortune(
+        chart['planets'], chart['houses'], chart['ascendant'],
+        chart['subject']['timezone'], body.get('lang', 'en')
+    )
+
+
+def handle_monthly(body: Dict) -> Dict:
+    """Monthly outlook for a natal chart"""
+    chart = natal_chart(body.get('birth'))
+    year = _check_year(_int_field(body, 'year'), 'year')
+    month = _int_field(body, 'month')
+    if not 1 <= month <= 12:
+        raise APIError(400, "month must be between 1 and 12")
+    return generate_monthly_outlook(
+        chart['planets'], chart['ascendant'], year, month,
+        chart['subject']['timezone'], body.get('lang', 'en')
+    )
+
+
+def handle_yearly(body: Dict) -> Dict:
+    """Yearly outlook for a natal chart"""
+    chart = natal_chart(body.get('birth'))
+    return generate_yearly_outlook(
+        chart['planets'], chart['ascendant'], _check_year(_int_field(body, 'year'), 'year'),
+        chart['subject']['timezone'], body.get('lang', 'en')
+    )
+
+
+def handle_synastry(body: Dict) -> Dict:
+    """Synastry aspects between two natal charts"""
+    if 'person1' not in body or 'person2' not in body:
+        raise APIError(400, "person1 and person2 are required")
+    chart1 = natal_chart(body['person1'])
+    chart2 = natal_chart(body['person2'])
+    return {'aspects': calculate_synastry_aspects(chart1['planets'], chart2['planets'])}
+
+
+ROUTES: Dict[str, Callable[[Dict], Dict]] = {
+    '/chart': handle_chart,
+    '/chart/svg': handle_chart_svg,
+    '/fortune/daily': handle_daily,
+    '/fortune/monthly': handle_monthly,
+    '/fortune/yearly': handle_yearly,
+    '/synastry': handle_synastry,
+}
+
+
+def run_handler(path: str, body) -> Tuple[int, bytes]:
+    """Call a route and encode its JSON response (status, payload)"""
+    handler = ROUTES.get(path)
+    if handler is None:
+        return 404, _encode({'error': f"unknown path {path}"})
+    if not isinstance(body, dict):
+        return 400, _encode({'error': "request body must be a JSON object"})
+    try:
+        return 200, _encode(handler(body))
+    except APIError as e:
+        return e.status, _encode({'error': e.message})
+    except INPUT_ERRORS as e:
+        # Checked inputs that still fail, e.g. a date out of range for the ephemeris
+        return 400, _encode({'error': f"invalid input: {e}"})
+
+
+def _encode(data) -> bytes:
+    """Compact UTF-8 JSON"""
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode()
+
+
+# ============== ASGI Application ==============
+
+class HoroscopeAPI:
+    """Minimal ASGI app: JSON routes dispatched to a thread pool"""
+    
+    def __init__(self, workers: int = WORKERS):
+        """Handlers run on ``workers`` threads"""
+        self.workers = workers
+        self.executor = None
+    
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'lifespan':
+            await self._lifespan(receive, send)
+            return
+        if scope['type'] != 'http':
+            return
+        
+        method, path = scope['method'], scope['path'].rstrip('/') or '/'
+        if path == '/health':
+            status, payload = 200, _encode({'status': 'ok'})
+        elif method != 'POST':
+            status, payload = 405, _encode({'error': "use POST"})
+        else:
+            try:
+                body = json.loads(await self._read_body(receive) or b'{}')
+            except APIError as e:
+                status, payload = e.status, _encode({'error': e.message})
+            except ValueError:
+                status, payload = 400, _encode({'error': "invalid JSON"})
+            else:
+                if path == '/batch':
+                    status, payload = await self._batch(body)
+                else:
+                    status, payload = await self._run(path, body)
+        
+        await send({
+            'type': 'http.response.start',
+            'status': status,
+            'headers': [(b'content-type', b'application/json'),
+                        (b'content-length', str(len(payload)).encode())]
+        })
+        await send({'type': 'http.response.body', 'body': payload})
+    
+    async def _lifespan(self, receive, send):
+        """Create the pool on startup, release it on shutdown"""
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                self._executor()
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                if self.executor is not None:
+                    self.executor.shutdown(wait=False)
+                    self.executor = None
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+    
+    def _executor(self) -> ThreadPoolExecutor:
+        """Worker pool, created on first use"""
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='horoscope')
+        return self.executor
+    
+    async def _read_body(self, receive) -> bytes:
+        """Full request body, bounded by MAX_BODY_BYTES"""
+        chunks, size = [], 0
+        while True:
+            message = await receive()
+            chunk = message.get('body', b'')
+            size += len(chunk)
+            if size > MAX_BODY_BYTES:
+                raise APIError(413, "request body too large")
+            chunks.append(chunk)
+            if not message.get('more_body'):
+                return b''.join(chunks)
+    
+    async def _run(self, path: str, body) -> Tuple[int, bytes]:
+        """One route call in the worker pool"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor(), run_handler, path, body)
+    
+    async def _batch(self, body) -> Tuple[int, bytes]:
+        """Run every sub-request concurrently in the pool; one response, in request order"""
+        requests = body.get('requests') if isinstance(body, dict) else None
+        if not isinstance(requests, list):
+            return 400, _encode({'error': "batch needs a 'requests' list"})
+        if len(requests) > MAX_BATCH:
+            return 413, _encode({'error': f"at most {MAX_BATCH} requests per batch"})
+        
+        jobs = []
+        for item in requests:
+            if isinstance(item, dict) and isinstance(item.get('path'), str):
+                jobs.append(self._run(item['path'].rstrip('/'), item.get('body', {})))
+            else:
+                jobs.append(self._invalid())
+        # A failing sub-request becomes its own 500 entry instead of failing the batch
+        results: List = await asyncio.gather(*jobs, return_exceptions=True)
+        results = [(500, _encode({'error': "internal error"})) if isinstance(r, BaseException) else r
+                   for r in results]
+        
+        # Sub-responses are already encoded; splice them instead of re-encoding
+        parts = [b'{"status":%d,"body":%s}' % (status, payload) for status, payload in results]
+        return 200, b'{"responses":[' + b','.join(parts) + b']}'
+    
+    async def _invalid(self) -> Tuple[int, bytes]:
+        """Error entry for a malformed batch item"""
+        return 400, _encode({'error': "batch items need a 'path' and a 'body'"})
+
+
+app = HoroscopeAPI()
@@ -3,20 +3,23 @@ Swiss Horoscope - Main Streamlit Application
 Precision-powered horoscope using Swiss Ephemeris (pyswisseph)
 """
 
+import os
+import pytz
 import streamlit as st
 from datetime import datetime
 from typing import Optional, Dict, List
-import matplotlib.pyplot as plt
 from core.swiss_eph import SwissEphemerisCalculator
-from core.chart_wheel import (
-    create_chart_wheel, chart_to_image,
-    get_current_transits, create_transit_overlay_chart,
-    create_synastry_chart
-)
+from core.chart_cache import get_chart_cache
+from core.image_cache import get_image_cache, image_key
+from core.wheel_data import get_current_transits
+from core.svg_chart import transit_overlay_svg, synastry_chart_svg
 from core.interactive_chart import create_interactive_chart_wheel
 from core.birth_chart_reading import generate_birth_chart_reading
 from core.fortune_reader import generate_detailed_daily_fortune, generate_monthly_outlook, generate_yearly_outlook
 
+# Wheel images: "svg" (vector, rendered without matplotlib) or "matplotlib" (PNG fallback)
+CHART_RENDERER = os.environ.get("SWISS_HOROSCOPE_CHART_RENDERER", "svg")
+
 
 # ============== Page Config ==============
 st.set_page_config(
@@ -232,6 +235,7 @@ LANG = {
         "lucky_day": "Lucky Day",
         "month_theme": "Monthly Theme",
         "highlights": "Highlights",
+        "key_dates": "Key Dates",
         "advice": "Advice",
         "major_transits": "Major Transits",
         "quarters": "Quarterly Overview",
@@ -320,6 +324,7 @@ LANG = {
         "lucky_day": "วันดี",
         "month_theme": "ธีมประจำเดือน",
         "highlights": "ไฮไลท์",
+        "key_dates": "วันสำคัญ",
         "advice": "คำแนะนำ",
         "major_transits": "ดาวเคราะห์หลัก",
         "quarters": "ภาพรวมไตรมาส",
@@ -679,11 +684,9 @@ def render_prediction_section(result: Dict, birth_data: Dict, lang: dict, lang_c
         st.subheader("📅 " + lang.get("daily_fortune", "Daily Fortune"))
         
         with st.spinner("Reading your daily fortune..."):
-            # Use detailed fortune generator
-            fortune = generate_detailed_daily_fortune(
-                planets, houses, asc, 
-                birth_data["timezone"], lang_code
-            )
+            # Use detailed fortune generator (cached per chart, local date and language)
+            today = datetime.now(pytz.timezone(birth_data["timezone"])).strftime("%Y-%m-%d")
+            fortune = cached_daily_fortune(birth_data, today, lang_code, result)
             
             # Overview with more detail
             overview_label = lang.get('today_overview', "Today's Overview")
@@ -721,6 +724,9 @@ def render_prediction_section(result: Dict, birth_data: Dict, lang: dict, lang_c
                     exact_indicator = "🎯" if asp.get('exactness') == 'exact' else ""
                     with st.expander(f"**{asp['transiting']}** ({asp['transit_sign']}) **{asp['aspect']}** **{asp['natal']}** ({asp['natal_sign']}) {exact_indicator}"):
                         st.markdown(f"**Orb:** {asp['orb']}°")
+                        if asp.get('exact_time'):
+                            phase = "applying" if asp.get('applying') else "separating"
+                            st.markdown(f"**Exact:** {asp['exact_time']} ({phase})")
                         st.markdown(f"**House Affected:** {asp['house_affected']} - {asp.get('house_meaning', '')}")
                         if asp.get('transit_sabian'):
                             st.markdown(f"**✨ Transit Sabian ({asp['transit_sign']} {asp['transit_degree']}°):** _{asp['transit_sabian']}_")
@@ -752,7 +758,7 @@ def render_prediction_section(result: Dict, birth_data: Dict, lang: dict, lang_c
         
         with st.spinner("Generating monthly outlook..."):
             now = datetime.now()
-            monthly = generate_monthly_outlook(planets, asc, now.year, now.month, birth_data["timezone"], lang_code)
+            monthly = cached_monthly_outlook(birth_data, now.year, now.month, lang_code, result)
             
             # Overview
             st.markdown(f"### {lang.get('month_theme', 'Monthly Theme')}")
@@ -784,6 +790,17 @@ def render_prediction_section(result: Dict, birth_data: Dict, lang: dict, lang_c
                     elif desc:
                         st.markdown(f"- {desc}")
             
+            # Exact aspects, ingresses and Moon phases in date order
+            key_dates = [(w["peak"], f"{w['transiting']} {w['aspect']} {w['natal']}")
+                         for w in monthly.get("aspect_windows", []) if w.get("exact")]
+            key_dates += [(e["date"], f"{e['planet']} → {e['sign']}{' ℞' if e.get('retrograde') else ''}")
+                          for e in monthly.get("ingresses", [])]
+            key_dates += [(e["date"], f"🌙 {e['phase']} ({e['sign']})") for e in monthly.get("moon_phases", [])]
+            if key_dates:
+                with st.expander(f"📅 {lang.get('key_dates', 'Key Dates')}"):
+                    for date, label in sorted(key_dates):
+                        st.markdown(f"- **{date}** {label}")
+            
             # Advice
             st.markdown(f"### 💡 {lang.get('advice', 'Advice')}")
             st.info(monthly.get("advice", ""))
@@ -794,7 +811,7 @@ def render_prediction_section(result: Dict, birth_data: Dict, lang: dict, lang_c
         
         with st.spinner("Generating yearly outlook..."):
             now = datetime.now()
-            yearly = generate_yearly_outlook(planets, asc, now.year, birth_data["timezone"], lang_code)
+            yearly = cached_yearly_outlook(birth_data, now.year, lang_code, result)
             
             # Overview
             st.markdown(f"### 📅 {now.year} {lang.get('yearly_outlook', 'Yearly Outlook')}")
@@ -821,6 +838,15 @@ def render_prediction_section(result: Dict, birth_data: Dict, lang: dict, lang_c
                     with st.expander(f"**{period}** - Jupiter in {jupiter}, Saturn in {saturn}"):
                         st.write(theme)
             
+            # Calendar events that touch the natal chart, and the year's eclipses
+            key_dates = [(e["date"], f"{e['event']}: {e['description']}") for e in yearly.get("key_events", [])]
+            key_dates += [(e["date"], f"🌑 {e['eclipse']} ({e['type']}, {e['sign']})")
+                          for e in yearly.get("eclipses", [])]
+            if key_dates:
+                with st.expander(f"📅 {lang.get('key_dates', 'Key Dates')}"):
+                    for date, label in sorted(key_dates):
+                        st.markdown(f"- **{date}** {label}")
+            
             # Advice
             st.markdown(f"### 💡 {lang.get('advice', 'Advice')}")
             st.info(yearly.get("advice", ""))
@@ -830,6 +856,76 @@ def render_prediction_section(result: Dict, birth_data: Dict, lang: dict, lang_c
         render_thai_prediction(year, month, day, planets, lang)
 
 
+# ============== Cached Computations ==============
+# Streamlit reruns the whole script on every interaction, so anything costly is
+# looked up here first. Charts are keyed by their birth data (which fully
+# determines them); the chart itself is passed as an unhashed ``_result``.
+# TTLs follow how fast each reading changes: the daily fortune reads transits
+# for the current minute (the Moon moves about half a degree an hour), while
+# monthly and yearly outlooks depend only on their month or year and expire
+# just to free memory.
+
+DAILY_FORTUNE_TTL = 60 * 60
+MONTHLY_OUTLOOK_TTL = 24 * 60 * 60
+YEARLY_OUTLOOK_TTL = 7 * 24 * 60 * 60
+READING_CACHE_ENTRIES = 1000
+
+
+@st.cache_resource
+def get_calculator() -> SwissEphemerisCalculator:
+    """Calculator shared by all sessions, backed by the process-wide chart cache"""
+    return SwissEphemerisCalculator(cache=get_chart_cache())
+
+
+@st.cache_data(ttl=DAILY_FORTUNE_TTL, max_entries=READING_CACHE_ENTRIES, show_spinner=False)
+def cached_daily_fortune(birth_data: Dict, date: str, lang_code: str, _result: Dict) -> Dict:
+    """Daily fortune of a chart, per local ``date`` and language"""
+    return generate_detailed_daily_fortune(
+        _result["planets"], _result.get("houses", {}), _result["ascendant"],
+        birth_data["timezone"], lang_code
+    )
+
+
+@st.cache_data(ttl=MONTHLY_OUTLOOK_TTL, max_entries=READING_CACHE_ENTRIES, show_spinner=False)
+def cached_monthly_outlook(birth_data: Dict, year: int, month: int, lang_code: str, _result: Dict) -> Dict:
+    """Monthly outlook of a chart"""
+    return generate_monthly_outlook(_result["planets"], _result["ascendant"], year, month,
+                                    birth_data["timezone"], lang_code)
+
+
+@st.cache_data(ttl=YEARLY_OUTLOOK_TTL, max_entries=READING_CACHE_ENTRIES, show_spinner=False)
+def cached_yearly_outlook(birth_data: Dict, year: int, lang_code: str, _result: Dict) -> Dict:
+    """Yearly outlook of a chart"""
+    return generate_yearly_outlook(_result["planets"], _result["ascendant"], year,
+                                   birth_data["timezone"], lang_code)
+
+
+# SVG renderer and the name of its matplotlib counterpart in core.chart_wheel,
+# which is only imported (with matplotlib) when PNGs are actually rendered
+WHEEL_RENDERERS = {
+    "transit": (transit_overlay_svg, "create_transit_overlay_chart"),
+    "synastry": (synastry_chart_svg, "create_synastry_chart"),
+}
+
+
+def cached_wheel_image(kind: str, chart_data: Dict, options: Dict):
+    """Wheel image (SVG text or PNG bytes), rendered only when the drawn data or options change"""
+    def render():
+        svg_renderer, matplotlib_renderer = WHEEL_RENDERERS[kind]
+        if CHART_RENDERER == "svg":
+            return svg_renderer(**chart_data, **options)
+        import matplotlib.pyplot as plt
+        from core import chart_wheel
+        fig = getattr(chart_wheel, matplotlib_renderer)(**chart_data, **options)
+        try:
+            return chart_wheel.chart_to_image(fig)
+        finally:
+            plt.close(fig)
+    
+    key = image_key(kind, CHART_RENDERER, chart_data, options)
+    return get_image_cache().get_or_render(key, render)
+
+
 # ============== Main App ==============
 def main():
     """Main application"""
@@ -853,8 +949,8 @@ def main():
         if st.button(lang["calculate"], type="primary", use_container_width=True):
             try:
                 with st.spinner("Calculating..."):
-                    calc = SwissEphemerisCalculator()
-                    result = calc.calculate_all(
+                    calc = get_calculator()
+                    result = calc.calculate_chart(
                         year=birth_data["year"],
                         month=birth_data["month"],
                         day=birth_data["day"],
@@ -871,7 +967,7 @@ def main():
                 
                 st.success(f"✅ {lang['your_chart']} - {birth_data['year']}-{birth_data['month']:02d}-{birth_data['day']:02d}")
                 st.rerun()
-                
+            
             except Exception as e:
                 st.error(f"Error: {str(e)}")
         else:
@@ -1012,21 +1108,24 @@ def main():
                 # Get current transits
                 transits = get_current_transits(timezone=birth_data["timezone"])
                 
-                # Create transit overlay chart
-                fig = create_transit_overlay_chart(
-                    natal_planets=result["planets"],
-                    natal_houses=result["houses"],
-                    natal_ascendant=result["ascendant"],
-                    natal_midheaven=result["midheaven"],
-                    natal_aspects=result.get("aspects", []),
-                    transit_planets=transits,
-                    show_aspects=True,
-                    show_houses=show_transit_houses,
-                    show_transit_aspects=show_transit_aspects
+                # Transit overlay chart (cached across reruns until something drawn changes)
+                chart_image = cached_wheel_image(
+                    "transit",
+                    dict(
+                        natal_planets=result["planets"],
+                        natal_houses=result["houses"],
+                        natal_ascendant=result["ascendant"],
+                        natal_midheaven=result["midheaven"],
+                        natal_aspects=result.get("aspects", []),
+                        transit_planets=transits
+                    ),
+                    dict(
+                        show_aspects=True,
+                        show_houses=show_transit_houses,
+                        show_transit_aspects=show_transit_aspects
+                    )
                 )
-                chart_bytes = chart_to_image(fig)
-                st.image(chart_bytes, use_container_width=True)
-                plt.close(fig)
+                st.image(chart_image, use_container_width=True)
             
             # Show current transit positions
             st.markdown("---")
@@ -1062,8 +1161,8 @@ def main():
                     try:
                         with st.spinner("Calculating synastry..."):
                             # Calculate Person 2 chart
-                            calc = SwissEphemerisCalculator()
-                            result_p2 = calc.calculate_all(
+                            calc = get_calculator()
+                            result_p2 = calc.calculate_chart(
                                 year=birth_data_p2["year"],
                                 month=birth_data_p2["month"],
                                 day=birth_data_p2["day"],
@@ -1085,24 +1184,24 @@ def main():
                             with col_opts2:
                                 show_syn_aspects = st.checkbox(lang.get("show_aspects", "Show Aspects"), value=True, key="syn_aspects")
                             
-                            # Create synastry chart
-                            fig = create_synastry_chart(
-                                person1_planets=result["planets"],
-                                person1_houses=result["houses"],
-                                person1_ascendant=result["ascendant"],
-                                person1_midheaven=result["midheaven"],
-                                person2_planets=result_p2["planets"],
-                                person2_houses=result_p2["houses"],
-                                person2_ascendant=result_p2["ascendant"],
-                                person2_midheaven=result_p2["midheaven"],
-                                person1_name="You",
-                                person2_name="Partner",
-                                show_aspects=show_syn_aspects,
-                                show_houses=show_syn_houses
+                            # Synastry chart (cached by what is drawn)
+                            chart_image = cached_wheel_image(
+                                "synastry",
+                                dict(
+                                    person1_planets=result["planets"],
+                                    person1_houses=result["houses"],
+                                    person1_ascendant=result["ascendant"],
+                                    person1_midheaven=result["midheaven"],
+                                    person2_planets=result_p2["planets"],
+                                    person2_houses=result_p2["houses"],
+                                    person2_ascendant=result_p2["ascendant"],
+                                    person2_midheaven=result_p2["midheaven"],
+                                    person1_name="You",
+                                    person2_name="Partner"
+                                ),
+                                dict(show_aspects=show_syn_aspects, show_houses=show_syn_houses)
                             )
-                            chart_bytes = chart_to_image(fig)
-                            st.image(chart_bytes, use_container_width=True)
-                            plt.close(fig)
+                            st.image(chart_image, use_container_width=True)
                             
                             # === SYNASTRY COMPATIBILITY ANALYSIS ===
                             st.markdown("---")
@@ -1160,7 +1259,7 @@ def main():
                             with col2:
                                 if aspects_list:
                                     st.write("**Aspects:** " + " | ".join(aspects_list))
-                                    
+                    
                     except Exception as e:
                         st.error(f"Error: {str(e)}")
         else:
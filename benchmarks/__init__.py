@@ -0,0 +1 @@
+"""Benchmarks for Swiss Horoscope (run from the repository root with ``python -m benchmarks.<name>``)"""
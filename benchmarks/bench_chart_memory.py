@@ -0,0 +1,66 @@
+"""
+Memory benchmark: resident natal charts
+calculate_all dict trees vs compact core.chart.Chart objects
+"""
+
+import argparse
+import gc
+import tracemalloc
+
+import numpy as np
+
+from core.swiss_eph import SwissEphemerisCalculator
+
+
+def _births(count: int, seed: int) -> list:
+    """Synthetic birth data (year, month, day, hour, minute, lat, lon, tz)"""
+    rng = np.random.default_rng(seed)
+    return [
+        (int(y), int(m), int(d), int(h), int(mi), float(lat), float(lon), "Asia/Bangkok")
+        for y, m, d, h, mi, lat, lon in zip(
+            rng.integers(1930, 2020, count), rng.integers(1, 13, count), rng.integers(1, 29, count),
+            rng.integers(0, 24, count), rng.integers(0, 60, count),
+            rng.uniform(-60, 60, count), rng.uniform(-180, 180, count)
+        )
+    ]
+
+
+def _resident_bytes(build, births: list) -> float:
+    """Bytes still allocated per chart after building and keeping them all"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    charts = [build(*birth) for birth in births]
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del charts
+    return (after - before) / len(births)
+
+
+def run(charts: int = 2000, seed: int = 42) -> dict:
+    """Measure both representations over the same births"""
+    calc = SwissEphemerisCalculator()
+    births = _births(charts, seed)
+    
+    dict_bytes = _resident_bytes(calc.calculate_all, births)
+    chart_bytes = _resident_bytes(calc.calculate_chart, births)
+    
+    return {
+        'charts': charts,
+        'dict_bytes': dict_bytes,
+        'chart_bytes': chart_bytes,
+        'reduction': dict_bytes / chart_bytes
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--charts", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    
+    result = run(args.charts, args.seed)
+    print(f"calculate_all dict : {result['dict_bytes']:8.0f} bytes/chart")
+    print(f"Chart              : {result['chart_bytes']:8.0f} bytes/chart")
+    print(f"reduction          : {result['reduction']:8.1f}x")
@@ -0,0 +1,77 @@
+"""
+Throughput benchmark: ChartPool scaling with worker processes
+Charts per second in-process vs 1..N pool workers over the same births
+"""
+
+import argparse
+import os
+import time
+
+import numpy as np
+
+from core.chart_pool import ChartPool
+from core.swiss_eph import SwissEphemerisCalculator
+
+
+def _births(count: int, seed: int) -> list:
+    """calculate_all keyword arguments for synthetic births"""
+    rng = np.random.default_rng(seed)
+    return [
+        {'year': int(y), 'month': int(m), 'day': int(d), 'hour': int(h), 'minute': int(mi),
+         'latitude': float(lat), 'longitude': float(lon), 'timezone': 'Asia/Bangkok'}
+        for y, m, d, h, mi, lat, lon in zip(
+            rng.integers(1930, 2020, count), rng.integers(1, 13, count), rng.integers(1, 29, count),
+            rng.integers(0, 24, count), rng.integers(0, 60, count),
+            rng.uniform(-60, 60, count), rng.uniform(-180, 180, count)
+        )
+    ]
+
+
+def run(charts: int = 4000, max_processes: int = None, kind: str = 'compact',
+        chunk_size: int = 64, seed: int = 42) -> dict:
+    """Charts/s serially and with 1, 2, 4, ... workers up to ``max_processes``"""
+    max_processes = max_processes or os.cpu_count() or 1
+    births = _births(charts, seed)
+    
+    calc = SwissEphemerisCalculator()
+    method = calc.calculate_chart if kind == 'compact' else calc.calculate_all
+    start = time.perf_counter()
+    for birth in births:
+        method(**birth)
+    serial = charts / (time.perf_counter() - start)
+    
+    counts = sorted({1, max_processes} | {2 ** k for k in range(1, 8) if 2 ** k < max_processes})
+    pool_rates = {}
+    for processes in counts:
+        with ChartPool(processes=processes, chunk_size=chunk_size) as pool:
+            # Warm the workers up (process start + ephemeris init) outside the timing
+            pool.run(kind, births[:processes])
+            start = time.perf_counter()
+            for _ in pool.map(kind, births):
+                pass
+            pool_rates[processes] = charts / (time.perf_counter() - start)
+    
+    return {
+        'charts': charts,
+        'cpu_count': os.cpu_count(),
+        'serial_per_s': serial,
+        'pool_per_s': pool_rates,
+        'efficiency': {p: rate / (pool_rates[1] * p) for p, rate in pool_rates.items()}
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--charts", type=int, default=4000)
+    parser.add_argument("--max-processes", type=int, default=None)
+    parser.add_argument("--kind", default="compact", choices=["compact", "chart"])
+    parser.add_argument("--chunk-size", type=int, default=64)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    
+    result = run(args.charts, args.max_processes, args.kind, args.chunk_size, args.seed)
+    print(f"cpu count        : {result['cpu_count']}")
+    print(f"in-process       : {result['serial_per_s']:9.0f} charts/s")
+    for processes, rate in result['pool_per_s'].items():
+        print(f"pool x{processes:<3}         : {rate:9.0f} charts/s "
+              f"(scaling efficiency {result['efficiency'][processes]:.0%})")
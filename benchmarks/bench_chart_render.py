@@ -0,0 +1,81 @@
+"""
+Render benchmark: chart wheel PNGs
+Times figure building and chart_to_image with the cached static ring, against a cold ring cache and plain savefig
+"""
+
+import argparse
+import io
+import time
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+
+from core import chart_wheel
+from core.swiss_eph import SwissEphemerisCalculator
+
+
+def _builders(calc: SwissEphemerisCalculator) -> dict:
+    """Chart kind -> function building its figure"""
+    a = calc.calculate_all(1990, 5, 15, 10, 30, 13.7563, 100.5018, "Asia/Bangkok")
+    b = calc.calculate_all(1992, 8, 1, 6, 0, 18.7883, 98.9853, "Asia/Bangkok")
+    transits = chart_wheel.get_current_transits()
+    return {
+        'natal': lambda: chart_wheel.create_chart_wheel(
+            a['planets'], a['houses'], a['ascendant'], a['midheaven'], a['aspects']),
+        'transit': lambda: chart_wheel.create_transit_overlay_chart(
+            a['planets'], a['houses'], a['ascendant'], a['midheaven'], a['aspects'], transits),
+        'synastry': lambda: chart_wheel.create_synastry_chart(
+            a['planets'], a['houses'], a['ascendant'], a['midheaven'],
+            b['planets'], b['houses'], b['ascendant'], b['midheaven'], "A", "B"),
+    }
+
+
+def _savefig(fig) -> bytes:
+    """Generic matplotlib path: savefig with a measured tight bounding box"""
+    buf = io.BytesIO()
+    fig.savefig(buf, format='png', facecolor=fig.get_facecolor(),
+                edgecolor='none', bbox_inches='tight', dpi=chart_wheel.CHART_DPI)
+    return buf.getvalue()
+
+
+def _time(build, encode, rounds: int, cold: bool = False) -> dict:
+    """Mean milliseconds for building and encoding one chart"""
+    build_s = encode_s = 0.0
+    for _ in range(rounds):
+        if cold:
+            chart_wheel._layer_cache.clear()
+        start = time.perf_counter()
+        fig = build()
+        built = time.perf_counter()
+        encode(fig)
+        build_s += built - start
+        encode_s += time.perf_counter() - built
+        plt.close(fig)
+    return {'build_ms': build_s / rounds * 1000, 'encode_ms': encode_s / rounds * 1000,
+            'total_ms': (build_s + encode_s) / rounds * 1000}
+
+
+def run(rounds: int = 10) -> dict:
+    """Time every chart kind warm, cold and through savefig"""
+    results = {}
+    for kind, build in _builders(SwissEphemerisCalculator()).items():
+        plt.close(build())   # warm the ring cache and font caches
+        results[kind] = {
+            'warm': _time(build, chart_wheel.chart_to_image, rounds),
+            'cold': _time(build, chart_wheel.chart_to_image, rounds, cold=True),
+            'savefig': _time(build, _savefig, rounds),
+        }
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rounds", type=int, default=10)
+    args = parser.parse_args()
+    
+    for kind, result in run(args.rounds).items():
+        print(f"{kind}:")
+        for mode, t in result.items():
+            print(f"  {mode:8s} build {t['build_ms']:6.1f} ms | encode {t['encode_ms']:6.1f} ms | "
+                  f"total {t['total_ms']:6.1f} ms")
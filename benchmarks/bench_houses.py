@@ -0,0 +1,55 @@
+"""
+Micro-benchmark: house calculation per chart
+Three separate swe.houses calls (ASC, MC, cusps) vs one shared HouseFrame
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from core.swiss_eph import SwissEphemerisCalculator
+
+
+def run(iterations: int = 5000, seed: int = 42) -> dict:
+    """Time both house paths over the same synthetic births"""
+    calc = SwissEphemerisCalculator()
+    rng = np.random.default_rng(seed)
+    jds = (2415020.5 + rng.random(iterations) * 40000).tolist()
+    lats = rng.uniform(-60, 60, iterations).tolist()
+    lons = rng.uniform(-180, 180, iterations).tolist()
+    
+    start = time.perf_counter()
+    for jd, lat, lon in zip(jds, lats, lons):
+        calc.get_ascendant(jd, lat, lon)
+        calc.get_midheaven(jd, lat, lon)
+        calc.get_houses(jd, lat, lon)
+    separate = (time.perf_counter() - start) / iterations
+    
+    start = time.perf_counter()
+    for jd, lat, lon in zip(jds, lats, lons):
+        frame = calc.get_house_frame(jd, lat, lon)
+        calc.get_ascendant(jd, lat, lon, frame=frame)
+        calc.get_midheaven(jd, lat, lon, frame=frame)
+        calc.get_houses(jd, lat, lon, frame=frame)
+    shared = (time.perf_counter() - start) / iterations
+    
+    return {
+        'iterations': iterations,
+        'separate_us': separate * 1e6,
+        'shared_us': shared * 1e6,
+        'saving_us': (separate - shared) * 1e6,
+        'speedup': separate / shared
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    
+    result = run(args.iterations, args.seed)
+    print(f"3x swe.houses : {result['separate_us']:8.2f} us/chart")
+    print(f"HouseFrame    : {result['shared_us']:8.2f} us/chart")
+    print(f"saving        : {result['saving_us']:8.2f} us/chart ({result['speedup']:.2f}x)")
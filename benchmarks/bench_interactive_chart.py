@@ -0,0 +1,54 @@
+"""
+Render benchmark: interactive Plotly chart wheel
+Times building and serializing the figure with the cached base layout, against a cold base cache
+"""
+
+import argparse
+import time
+
+import plotly.io as pio
+
+from core import interactive_chart
+from core.swiss_eph import SwissEphemerisCalculator
+
+
+def _time(build, rounds: int, cold: bool = False) -> dict:
+    """Mean milliseconds for building and serializing one figure"""
+    build_s = json_s = 0.0
+    size = 0
+    for _ in range(rounds):
+        if cold:
+            interactive_chart._base_figure.cache_clear()
+        start = time.perf_counter()
+        fig = build()
+        built = time.perf_counter()
+        size = len(pio.to_json(fig, validate=False))
+        build_s += built - start
+        json_s += time.perf_counter() - built
+    return {'build_ms': build_s / rounds * 1000, 'json_ms': json_s / rounds * 1000,
+            'traces': len(fig.data), 'json_bytes': size}
+
+
+def run(rounds: int = 20) -> dict:
+    """Time the natal wheel warm and cold"""
+    chart = SwissEphemerisCalculator().calculate_all(1990, 5, 15, 10, 30, 13.7563, 100.5018, "Asia/Bangkok")
+    
+    def build():
+        return interactive_chart.create_interactive_chart_wheel(
+            chart['planets'], chart['houses'], chart['ascendant'], chart['midheaven'], chart['aspects'])
+    
+    build()
+    return {
+        'warm': _time(build, rounds),
+        'cold': _time(build, rounds, cold=True),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+    
+    for mode, t in run(args.rounds).items():
+        print(f"{mode:5s} build {t['build_ms']:6.1f} ms | json {t['json_ms']:5.1f} ms | "
+              f"{t['traces']} traces, {t['json_bytes'] / 1024:.1f} KB")
@@ -0,0 +1,57 @@
+"""
+Query benchmark: sorted natal longitude index
+Times "which charts have transiting Saturn square their natal Sun" with LongitudeIndex.query against
+a full NumPy scan of the same column, over a large population of random natal longitudes
+"""
+
+import argparse
+import statistics
+import time
+
+import numpy as np
+
+from core.longitude_index import LongitudeIndex
+from core.swiss_eph import PLANETS
+
+
+def run(charts: int = 1_000_000, rounds: int = 20, seed: int = 42) -> dict:
+    """Build time, then median query and scan times in milliseconds"""
+    rng = np.random.default_rng(seed)
+    longitudes = rng.uniform(0, 360, (charts, len(PLANETS)))
+    
+    start = time.perf_counter()
+    index = LongitudeIndex(longitudes, list(PLANETS))
+    build_s = time.perf_counter() - start
+    
+    sun = longitudes[:, list(PLANETS).index('Sun')]
+    angle, orb = 90.0, 7.0
+    query_ms, scan_ms = [], []
+    for saturn in rng.uniform(0, 360, rounds).tolist():
+        start = time.perf_counter()
+        matches = index.query('Sun', saturn, angle, orb)
+        query_ms.append((time.perf_counter() - start) * 1000)
+        
+        start = time.perf_counter()
+        diff = np.abs(saturn - sun)
+        scanned = np.nonzero(np.abs(np.where(diff > 180, 360 - diff, diff) - angle) <= orb)[0]
+        scan_ms.append((time.perf_counter() - start) * 1000)
+        assert np.array_equal(matches['chart'], scanned)
+    
+    return {
+        'charts': charts,
+        'build_s': build_s,
+        'query_ms': statistics.median(query_ms),
+        'scan_ms': statistics.median(scan_ms),
+        'matches': len(matches),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--charts", type=int, default=1_000_000)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+    
+    r = run(args.charts, args.rounds)
+    print(f"{r['charts']} charts | build {r['build_s']:.2f} s | query {r['query_ms']:.2f} ms | "
+          f"scan {r['scan_ms']:.2f} ms | ~{r['matches']} matches")
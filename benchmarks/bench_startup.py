@@ -0,0 +1,69 @@
+"""
+Startup benchmark: import time per module
+Imports each module in a fresh interpreter (cold start, as in a new container or worker)
+and reports the wall time plus which heavy libraries it pulled in
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+
+MODULES = [
+    'core',
+    'core.image_cache',
+    'core.swiss_eph',
+    'core.fortune_reader',
+    'core.wheel_data',
+    'core.svg_chart',
+    'core.interactive_chart',
+    'core.chart_wheel',
+    'api',
+    'app',
+]
+
+HEAVY_LIBRARIES = ['numpy', 'swisseph', 'pytz', 'plotly', 'matplotlib', 'streamlit']
+
+_PROBE = '''
+import json, sys, time, warnings
+warnings.simplefilter("ignore")
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"ms": elapsed * 1000, "loaded": [m for m in {heavy!r} if m in sys.modules]}}))
+'''
+
+
+def time_import(module: str) -> dict:
+    """Import ``module`` in a new interpreter: milliseconds and heavy libraries loaded"""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    probe = _PROBE.format(module=module, heavy=HEAVY_LIBRARIES)
+    done = subprocess.run([sys.executable, '-c', probe], cwd=root, capture_output=True, text=True, check=True)
+    return json.loads(done.stdout.strip().splitlines()[-1])
+
+
+def run(rounds: int = 5, modules: list = None) -> dict:
+    """Median import time of every module over ``rounds`` cold starts"""
+    results = {}
+    for module in modules or MODULES:
+        samples = [time_import(module) for _ in range(rounds)]
+        results[module] = {
+            'median_ms': statistics.median(s['ms'] for s in samples),
+            'min_ms': min(s['ms'] for s in samples),
+            'loaded': samples[-1]['loaded'],
+        }
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("modules", nargs="*", help="modules to import (default: core, api and app)")
+    args = parser.parse_args()
+    
+    for module, result in run(args.rounds, args.modules).items():
+        print(f"{module:24s} median {result['median_ms']:7.1f} ms | min {result['min_ms']:7.1f} ms | "
+              f"{', '.join(result['loaded']) or '-'}")
@@ -0,0 +1,166 @@
+"""
+Load test for the JSON API (api.py)
+Keep-alive HTTP/1.1 clients hammer one endpoint and report requests per second and latency percentiles
+
+Without --url a uvicorn server is started on a free local port for the run:
+
+    python -m benchmarks.load_test_api --endpoint chart --concurrency 32 --duration 10
+    python -m benchmarks.load_test_api --url http://127.0.0.1:8000 --endpoint batch
+"""
+
+import argparse
+import asyncio
+import json
+import socket
+import subprocess
+import sys
+import time
+from urllib.parse import urlparse
+
+import numpy as np
+
+
+def _birth(rng: np.random.Generator) -> dict:
+    """Random birth object"""
+    return {
+        'year': int(rng.integers(1930, 2020)), 'month': int(rng.integers(1, 13)),
+        'day': int(rng.integers(1, 29)), 'hour': int(rng.integers(0, 24)),
+        'minute': int(rng.integers(0, 60)),
+        'latitude': round(float(rng.uniform(-60, 60)), 4),
+        'longitude': round(float(rng.uniform(-180, 180)), 4),
+        'timezone': 'Asia/Bangkok'
+    }
+
+
+def make_request(endpoint: str, rng: np.random.Generator, batch_size: int) -> tuple:
+    """(path, body) for one request against ``endpoint``"""
+    if endpoint == 'chart':
+        return '/chart', _birth(rng)
+    if endpoint == 'daily':
+        return '/fortune/daily', {'birth': _birth(rng)}
+    if endpoint == 'monthly':
+        return '/fortune/monthly', {'birth': _birth(rng), 'year': 2026, 'month': 1}
+    if endpoint == 'synastry':
+        return '/synastry', {'person1': _birth(rng), 'person2': _birth(rng)}
+    if endpoint == 'batch':
+        return '/batch', {'requests': [{'path': '/chart', 'body': _birth(rng)} for _ in range(batch_size)]}
+    raise ValueError(f"unknown endpoint {endpoint}")
+
+
+async def _client(host: str, port: int, endpoint: str, deadline: float, seed: int,
+                  batch_size: int, latencies: list, errors: list):
+    """One keep-alive connection sending requests back to back until the deadline"""
+    rng = np.random.default_rng(seed)
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        while time.perf_counter() < deadline:
+            path, body = make_request(endpoint, rng, batch_size)
+            payload = json.dumps(body).encode()
+            request = (f"POST {path} HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\n"
+                       f"Content-Length: {len(payload)}\r\n\r\n").encode() + payload
+            
+            start = time.perf_counter()
+            writer.write(request)
+            await writer.drain()
+            status_line = await reader.readline()
+            length = 0
+            while True:
+                line = await reader.readline()
+                if line in (b'\r\n', b''):
+                    break
+                name, _, value = line.decode().partition(':')
+                if name.lower() == 'content-length':
+                    length = int(value)
+            await reader.readexactly(length)
+            latencies.append(time.perf_counter() - start)
+            
+            if not status_line.startswith(b'HTTP/1.1 200'):
+                errors.append(status_line.decode().strip())
+    finally:
+        writer.close()
+
+
+async def _load(host: str, port: int, endpoint: str, concurrency: int, duration: float,
+                batch_size: int) -> dict:
+    """Run ``concurrency`` clients for ``duration`` seconds and summarize"""
+    latencies, errors = [], []
+    start = time.perf_counter()
+    deadline = start + duration
+    await asyncio.gather(*[
+        _client(host, port, endpoint, deadline, seed, batch_size, latencies, errors)
+        for seed in range(concurrency)
+    ])
+    elapsed = time.perf_counter() - start
+    
+    lat = np.array(latencies) * 1000
+    per_request = batch_size if endpoint == 'batch' else 1
+    return {
+        'endpoint': endpoint,
+        'concurrency': concurrency,
+        'requests': len(latencies),
+        'errors': len(errors),
+        'rps': len(latencies) / elapsed,
+        'items_per_s': len(latencies) * per_request / elapsed,
+        'p50_ms': float(np.percentile(lat, 50)) if len(lat) else 0.0,
+        'p95_ms': float(np.percentile(lat, 95)) if len(lat) else 0.0,
+        'p99_ms': float(np.percentile(lat, 99)) if len(lat) else 0.0
+    }
+
+
+def _free_port() -> int:
+    """Unused local TCP port"""
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def _start_server(port: int, workers: int) -> subprocess.Popen:
+    """uvicorn api:app on 127.0.0.1:port, returned once it accepts connections"""
+    server = subprocess.Popen(
+        [sys.executable, '-m', 'uvicorn', 'api:app', '--host', '127.0.0.1', '--port', str(port),
+         '--workers', str(workers), '--log-level', 'warning'],
+    )
+    for _ in range(200):
+        try:
+            socket.create_connection(('127.0.0.1', port), timeout=0.1).close()
+            return server
+        except OSError:
+            time.sleep(0.05)
+    server.terminate()
+    raise RuntimeError("uvicorn did not start")
+
+
+def run(endpoint: str = 'chart', concurrency: int = 16, duration: float = 5.0,
+        url: str = None, server_workers: int = 1, batch_size: int = 16) -> dict:
+    """Run the load test (starting a local server unless ``url`` is given)"""
+    server = None
+    if url:
+        parsed = urlparse(url)
+        host, port = parsed.hostname, parsed.port or 80
+    else:
+        host, port = '127.0.0.1', _free_port()
+        server = _start_server(port, server_workers)
+    try:
+        return asyncio.run(_load(host, port, endpoint, concurrency, duration, batch_size))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--endpoint", default="chart",
+                        choices=["chart", "daily", "monthly", "synastry", "batch"])
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=5.0, help="seconds")
+    parser.add_argument("--url", default=None, help="existing server, e.g. http://127.0.0.1:8000")
+    parser.add_argument("--server-workers", type=int, default=1, help="uvicorn processes for a local server")
+    parser.add_argument("--batch-size", type=int, default=16, help="charts per /batch request")
+    args = parser.parse_args()
+    
+    result = run(args.endpoint, args.concurrency, args.duration, args.url,
+                 args.server_workers, args.batch_size)
+    print(f"{result['endpoint']}: {result['requests']} requests, {result['errors']} errors")
+    print(f"  {result['rps']:.1f} req/s ({result['items_per_s']:.1f} items/s)")
+    print(f"  latency p50 {result['p50_ms']:.1f} ms, p95 {result['p95_ms']:.1f} ms, p99 {result['p99_ms']:.1f} ms")
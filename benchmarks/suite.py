@@ -0,0 +1,270 @@
+"""
+Benchmark suite: every hot path in core/
+Runs each case over the same seeded synthetic births and a fixed reading date, writes JSON
+results and compares them with a baseline, flagging cases that got slower than a threshold
+
+    python -m benchmarks.suite --output baseline.json
+    python -m benchmarks.suite --output current.json --compare baseline.json --threshold 0.1
+    python -m benchmarks.suite --results current.json --compare baseline.json
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pytz
+import swisseph as swe
+
+from core.swiss_eph import SwissEphemerisCalculator
+from core import fortune_reader
+
+
+TIMEZONES = ["Asia/Bangkok", "Europe/London", "America/New_York", "Asia/Tokyo", "Australia/Sydney", "UTC"]
+
+# Every reading is made for this local moment, so results do not depend on the day the suite runs
+READING_DATE = datetime(2024, 3, 20, 9, 0)
+
+# Matplotlib wheels cost 0.1-0.2 s each, so that case only draws the first few charts
+PNG_CHARTS = 3
+
+DEFAULT_THRESHOLD = 0.10
+
+
+def synthetic_births(count: int, seed: int = 42) -> List[Dict]:
+    """Reproducible calculate_all kwargs: births 1930-2010 at latitudes -60..60"""
+    rng = np.random.default_rng(seed)
+    births = []
+    for _ in range(count):
+        births.append({
+            'year': int(rng.integers(1930, 2011)),
+            'month': int(rng.integers(1, 13)),
+            'day': int(rng.integers(1, 29)),
+            'hour': int(rng.integers(0, 24)),
+            'minute': int(rng.integers(0, 60)),
+            'latitude': round(float(rng.uniform(-60, 60)), 4),
+            'longitude': round(float(rng.uniform(-180, 180)), 4),
+            'timezone': TIMEZONES[int(rng.integers(len(TIMEZONES)))]
+        })
+    return births
+
+
+# ============== Cases ==============
+# Each case gets the shared context and returns (function, list of argument tuples);
+# one operation is one call.
+
+Case = Callable[[Dict], Tuple[Callable, List[tuple]]]
+
+
+def _calculate_all(ctx: Dict):
+    calc = ctx['calc']
+    return (lambda birth: calc.calculate_all(**birth)), [(b,) for b in ctx['births']]
+
+
+def _get_aspects(ctx: Dict):
+    return ctx['calc'].get_aspects, [(c['planets'],) for c in ctx['charts']]
+
+
+def _transit_aspects(ctx: Dict):
+    transits = ctx['transits']
+    return fortune_reader.calculate_transit_aspects, [(c['planets'], transits) for c in ctx['charts']]
+
+
+def _house_position(ctx: Dict):
+    rng = np.random.default_rng(ctx['seed'])
+    longitudes = rng.uniform(0, 360, len(ctx['charts'])).tolist()
+    return fortune_reader.get_house_position, [(lon, c['houses']) for lon, c in zip(longitudes, ctx['charts'])]
+
+
+def _daily_fortune(ctx: Dict):
+    def daily(chart, birth):
+        now = pytz.timezone(birth['timezone']).localize(READING_DATE)
+        return fortune_reader.generate_detailed_daily_fortune(
+            chart['planets'], chart['houses'], chart['ascendant'], birth['timezone'], 'en', now=now)
+    return daily, list(zip(ctx['charts'], ctx['births']))
+
+
+def _daily_fanout(ctx: Dict):
+    # One operation is the whole batch: the sky once, then every chart
+    from core.fanout import DailySky, fan_out
+    
+    def fanout(charts):
+        sky = DailySky(pytz.timezone("UTC").localize(READING_DATE), "UTC")
+        return list(fan_out(enumerate(charts), sky))
+    return fanout, [(ctx['charts'],)]
+
+
+def _monthly_outlook(ctx: Dict):
+    def monthly(chart, birth):
+        return fortune_reader.generate_monthly_outlook(
+            chart['planets'], chart['ascendant'], READING_DATE.year, READING_DATE.month, birth['timezone'])
+    return monthly, list(zip(ctx['charts'], ctx['births']))
+
+
+def _yearly_outlook(ctx: Dict):
+    def yearly(chart, birth):
+        return fortune_reader.generate_yearly_outlook(
+            chart['planets'], chart['ascendant'], READING_DATE.year, birth['timezone'])
+    return yearly, list(zip(ctx['charts'], ctx['births']))
+
+
+def _chart_wheel_png(ctx: Dict):
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    from core import chart_wheel
+    
+    def png(chart):
+        fig = chart_wheel.create_chart_wheel(
+            chart['planets'], chart['houses'], chart['ascendant'], chart['midheaven'], chart['aspects'])
+        try:
+            return chart_wheel.chart_to_image(fig)
+        finally:
+            plt.close(fig)
+    return png, [(c,) for c in ctx['charts'][:PNG_CHARTS]]
+
+
+def _interactive_chart(ctx: Dict):
+    from core.interactive_chart import create_interactive_chart_wheel
+    
+    def interactive(chart):
+        return create_interactive_chart_wheel(
+            chart['planets'], chart['houses'], chart['ascendant'], chart['midheaven'], chart['aspects'])
+    return interactive, [(c,) for c in ctx['charts']]
+
+
+CASES: Dict[str, Case] = {
+    'calculate_all': _calculate_all,
+    'get_aspects': _get_aspects,
+    'calculate_transit_aspects': _transit_aspects,
+    'get_house_position': _house_position,
+    'daily_fortune': _daily_fortune,
+    'daily_fanout': _daily_fanout,
+    'monthly_outlook': _monthly_outlook,
+    'yearly_outlook': _yearly_outlook,
+    'chart_wheel_png': _chart_wheel_png,
+    'interactive_chart': _interactive_chart,
+}
+
+
+# ============== Running ==============
+
+def _context(births: int, seed: int) -> Dict:
+    """Calculator, synthetic births, their charts and the transit set of READING_DATE"""
+    calc = SwissEphemerisCalculator()
+    birth_list = synthetic_births(births, seed)
+    return {
+        'seed': seed,
+        'calc': calc,
+        'births': birth_list,
+        'charts': [calc.calculate_all(**b) for b in birth_list],
+        'transits': fortune_reader.get_current_transits_for_date(
+            READING_DATE.year, READING_DATE.month, READING_DATE.day, READING_DATE.hour, READING_DATE.minute, "UTC"),
+    }
+
+
+def time_case(func: Callable, calls: List[tuple], rounds: int) -> Dict:
+    """Microseconds per call over ``rounds`` passes through ``calls`` (after one warm-up pass)"""
+    for args in calls:
+        func(*args)
+    
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for args in calls:
+            func(*args)
+        samples.append((time.perf_counter() - start) / len(calls) * 1e6)
+    
+    return {
+        'us_per_op': statistics.median(samples),
+        'min_us': min(samples),
+        'max_us': max(samples),
+        'ops': len(calls),
+        'rounds': rounds,
+    }
+
+
+def run(births: int = 50, rounds: int = 5, seed: int = 42, cases: Optional[List[str]] = None) -> Dict:
+    """Run the selected cases (default: all) and return the JSON-ready report"""
+    ctx = _context(births, seed)
+    results = {}
+    for name in cases or CASES:
+        func, calls = CASES[name](ctx)
+        results[name] = time_case(func, calls, rounds)
+    
+    return {
+        'meta': {
+            'created': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'numpy': np.__version__,
+            'swisseph': swe.version,
+            'births': births,
+            'rounds': rounds,
+            'seed': seed,
+        },
+        'results': results,
+    }
+
+
+def compare(baseline: Dict, current: Dict, threshold: float = DEFAULT_THRESHOLD) -> List[Dict]:
+    """Per-case change from ``baseline`` to ``current``; ``regression`` when slower by more than ``threshold``"""
+    rows = []
+    for name, result in current['results'].items():
+        if name not in baseline['results']:
+            continue
+        before = baseline['results'][name]['us_per_op']
+        after = result['us_per_op']
+        change = after / before - 1 if before else 0.0
+        rows.append({
+            'case': name,
+            'baseline_us': before,
+            'current_us': after,
+            'change': change,
+            'regression': change > threshold,
+        })
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--births", type=int, default=50, help="synthetic births per case")
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--cases", help="comma-separated subset of: " + ", ".join(CASES))
+    parser.add_argument("--output", help="write results JSON here")
+    parser.add_argument("--results", help="compare this results file instead of running the suite")
+    parser.add_argument("--compare", help="baseline results JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="slowdown (fraction) counted as a regression, default 0.10")
+    args = parser.parse_args()
+    
+    if args.results:
+        with open(args.results) as f:
+            report = json.load(f)
+    else:
+        report = run(args.births, args.rounds, args.seed, args.cases.split(",") if args.cases else None)
+        for name, result in report['results'].items():
+            print(f"{name:28s} {result['us_per_op']:11.1f} us/op | min {result['min_us']:11.1f} | "
+                  f"{result['ops']} ops x {result['rounds']}")
+    
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        rows = compare(baseline, report, args.threshold)
+        print()
+        for row in rows:
+            flag = "REGRESSION" if row['regression'] else ""
+            print(f"{row['case']:28s} {row['baseline_us']:11.1f} -> {row['current_us']:11.1f} us/op "
+                  f"{row['change']:+7.1%} {flag}")
+        if any(row['regression'] for row in rows):
+            sys.exit(1)
@@ -1,5 +1,19 @@
 """Core module for Swiss Horoscope"""
 
-from .swiss_eph import SwissEphemerisCalculator
+__all__ = ["SwissEphemerisCalculator", "Chart"]
 
-__all__ = ["SwissEphemerisCalculator"]
+# Exported lazily, so importing one submodule (core.image_cache, core.svg_chart ...)
+# does not load Swiss Ephemeris and numpy through the calculator
+_LAZY_EXPORTS = {
+    "SwissEphemerisCalculator": ".swiss_eph",
+    "Chart": ".chart",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        from importlib import import_module
+        value = getattr(import_module(_LAZY_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
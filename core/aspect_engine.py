@@ -0,0 +1,115 @@
+"""
+Vectorized aspect engine (NumPy)
+Pairwise angular separations and aspect/orb masks for one or many charts in one pass
+"""
+
+from typing import Iterable, Optional, Tuple
+
+import numpy as np
+
+
+# Hit records: chart row, body indices in the first/second set, aspect index, separation, orb
+ASPECT_DTYPE = np.dtype([
+    ('chart', np.int32),
+    ('i', np.int16),
+    ('j', np.int16),
+    ('aspect', np.int8),
+    ('separation', np.float64),
+    ('orb', np.float64),
+])
+
+
+# Charts processed per block in many-charts mode
+CHUNK_CHARTS = 4096
+
+
+class AspectTable:
+    """Aspect angles, names and maximum orbs as parallel arrays"""
+    
+    def __init__(self, aspects: Iterable[Tuple[float, str, float]]):
+        """Build from (angle, name, max_orb) tuples"""
+        aspects = list(aspects)
+        self.angles = np.array([a[0] for a in aspects], dtype=float)
+        self.names = [a[1] for a in aspects]
+        self.orbs = np.array([a[2] for a in aspects], dtype=float)
+        # Original angle values (ints stay ints in the dict wrappers)
+        self.raw_angles = [a[0] for a in aspects]
+    
+    def __len__(self) -> int:
+        return len(self.names)
+
+
+def separation_matrix(lon_a: np.ndarray, lon_b: np.ndarray) -> np.ndarray:
+    """Shortest angular distance (0-180) between every body in lon_a and lon_b
+    
+    ``lon_a`` has shape (..., n) and ``lon_b`` shape (..., m); the result has
+    shape (..., n, m).
+    """
+    diff = np.abs(lon_a[..., :, None] - lon_b[..., None, :])
+    return np.where(diff > 180, 360 - diff, diff)
+
+
+def find_aspects(
+    lon_a,
+    lon_b=None,
+    table: Optional[AspectTable] = None,
+    sort: bool = True
+) -> np.ndarray:
+    """Find every aspect hit as a structured array (see ``ASPECT_DTYPE``)
+    
+    Modes:
+        natal-natal     ``lon_b`` is None: unique pairs i < j within ``lon_a``
+        transit-natal   ``lon_a`` (n,) against ``lon_b`` (m,), every pair
+        many charts     2-D inputs of shape (charts, n) / (charts, m); a 1-D
+                        input on either side is shared by all charts (one sky vs many natals)
+    
+    Hits come out in (chart, i, j, aspect) order; with ``sort`` they are
+    stably re-ordered by orb within each chart.
+    """
+    if table is None:
+        table = DEFAULT_TABLE
+    
+    a = np.atleast_2d(np.asarray(lon_a, dtype=float))
+    natal_mode = lon_b is None
+    b = a if natal_mode else np.atleast_2d(np.asarray(lon_b, dtype=float))
+    charts = max(a.shape[0], b.shape[0])
+    
+    # Bound the (charts, n, m, aspects) temporaries for large populations
+    if charts > CHUNK_CHARTS:
+        parts = []
+        for start in range(0, charts, CHUNK_CHARTS):
+            part_a = a if a.shape[0] == 1 else a[start:start + CHUNK_CHARTS]
+            part_b = None if natal_mode else (b if b.shape[0] == 1 else b[start:start + CHUNK_CHARTS])
+            hits = find_aspects(part_a, part_b, table, sort)
+            hits['chart'] += start
+            parts.append(hits)
+        return np.concatenate(parts)
+    
+    sep = separation_matrix(a, b)
+    orbs = np.abs(sep[..., None] - table.angles)
+    mask = orbs <= table.orbs
+    if natal_mode:
+        n = a.shape[1]
+        mask &= np.triu(np.ones((n, n), dtype=bool), k=1)[None, :, :, None]
+    
+    chart, i, j, k = np.nonzero(mask)
+    hits = np.empty(len(chart), dtype=ASPECT_DTYPE)
+    hits['chart'] = chart
+    hits['i'] = i
+    hits['j'] = j
+    hits['aspect'] = k
+    hits['separation'] = sep[chart, i, j]
+    hits['orb'] = orbs[chart, i, j, k]
+    
+    if sort:
+        hits = hits[np.lexsort((hits['orb'], hits['chart']))]
+    return hits
+
+
+DEFAULT_TABLE = AspectTable([
+    (0, "Conjunction", 8),
+    (60, "Sextile", 6),
+    (90, "Square", 8),
+    (120, "Trine", 8),
+    (180, "Opposition", 8)
+])
@@ -5,6 +5,8 @@ Generates personalized natal chart readings based on Swiss Ephemeris data
 
 from typing import Dict, List, Optional
 
+from .house_lookup import HouseLookup
+
 
 # ============== Planet Meanings ==============
 PLANET_MEANINGS = {
@@ -284,12 +286,16 @@ def generate_birth_chart_reading(
     
     # Find planets in angles (1st, 4th, 7th, 10th houses)
     angle_houses = {1, 4, 7, 10}
+    house_of = HouseLookup.from_houses(houses).house if houses else None
     for planet_name in ["Sun", "Moon", "Mercury", "Venus", "Mars", "Jupiter", "Saturn"]:
         if planet_name in planets:
             planet_sign = planets[planet_name].get("sign", "Aries")
+            house = house_of(planets[planet_name]["longitude"]) if house_of else None
             section4["planets"].append({
                 "name": planet_name,
                 "sign": planet_sign,
+                "house": house,
+                "angular": house in angle_houses,
                 "traits": get_planet_meaning(planet_name, lang)
             })
     reading["sections"].append(section4)
@@ -304,10 +310,12 @@ def generate_birth_chart_reading(
     # Find planets in houses
     for planet_name in ["Sun", "Moon", "Mercury", "Venus", "Mars", "Jupiter", "Saturn"]:
         if planet_name in planets:
-            # Simplified: use sign to estimate house (not accurate but workable)
+            house = house_of(planets[planet_name]["longitude"]) if house_of else None
             section5["houses"].append({
                 "planet": planet_name,
-                "sign": planets[planet_name].get("sign", "Aries")
+                "sign": planets[planet_name].get("sign", "Aries"),
+                "house": house,
+                "meaning": get_house_meaning(house, lang) if house else ""
             })
     reading["sections"].append(section5)
     
@@ -0,0 +1,266 @@
+"""
+Compact chart representation
+One natal chart as a few small NumPy arrays instead of a tree of dicts
+
+``calculate_all`` returns about a hundred small dicts per chart, each repeating
+the same string keys. ``Chart`` keeps the numbers in contiguous arrays:
+
+    bodies       float64 (n, 4)   longitude, latitude, distance, speed per body
+    cusps        float64 (12,)    house cusps 1-12
+    angles       float64 (2,)     Ascendant, Midheaven
+    signs        int8 (n + 14,)   sign index of every body, cusp and angle
+    aspect_hits  structured array (i, j, aspect index, orb)
+
+and builds the familiar dicts on access. A ``Chart`` is a read-only
+``Mapping`` with the same keys as the ``calculate_all`` result
+(``chart['planets']['Sun']['sign']``, ``chart['houses'][1]``,
+``chart.get('aspects', [])``), so code written against the dict form keeps
+working. ``to_dict()`` returns the exact ``calculate_all`` structure.
+
+Derived points (South Node) have NaN latitude, distance and speed and are
+reported retrograde, as in ``calculate_all``.
+"""
+
+from collections.abc import Mapping
+from typing import Dict, Iterator, List, Sequence
+
+import numpy as np
+
+from .aspect_engine import AspectTable
+from .swiss_eph import ASPECT_TABLE, PLANETS, SIGNS, SIGNS_TH
+
+
+BODY_NAMES = tuple(PLANETS)
+
+# Aspect hits without the bookkeeping fields of ASPECT_DTYPE
+HIT_DTYPE = np.dtype([
+    ('i', np.int8),
+    ('j', np.int8),
+    ('aspect', np.int8),
+    ('orb', np.float64),
+])
+
+CHART_KEYS = ('subject', 'planets', 'ascendant', 'midheaven', 'houses', 'aspects')
+
+
+def _point(longitude: float, sign_num: int) -> Dict:
+    """Sign breakdown dict (same keys as swiss_eph.sign_position)"""
+    return {
+        'longitude': longitude,
+        'sign': SIGNS[sign_num],
+        'sign_th': SIGNS_TH[sign_num],
+        'degree': longitude % 30,
+        'sign_num': sign_num
+    }
+
+
+class Chart(Mapping):
+    """Read-only, array-backed natal chart with dict-style access"""
+    
+    __slots__ = ('name', 'date_time', 'timezone', 'jd', 'latitude', 'longitude',
+                 'body_names', 'bodies', 'cusps', 'angles', 'signs', 'aspect_hits', 'aspect_table')
+    
+    def __init__(
+        self,
+        subject: Dict,
+        bodies: np.ndarray,
+        cusps: Sequence[float],
+        angles: Sequence[float],
+        aspect_hits: np.ndarray,
+        body_names: Sequence[str] = BODY_NAMES,
+        aspect_table: AspectTable = ASPECT_TABLE
+    ):
+        """Build from raw arrays; ``aspect_hits`` needs fields i, j, aspect and orb"""
+        self.set_subject(subject)
+        names = tuple(body_names)
+        # Charts with the standard body list share one names tuple
+        self.body_names = BODY_NAMES if names == BODY_NAMES else names
+        self.bodies = np.ascontiguousarray(bodies, dtype=np.float64).reshape(len(self.body_names), 4)
+        self.cusps = np.asarray(cusps, dtype=np.float64)
+        self.angles = np.asarray(angles, dtype=np.float64)
+        
+        # Same rule as calculate_all: int(longitude / 30) % 12
+        longitudes = self.bodies[:, 0].tolist() + self.cusps.tolist() + self.angles.tolist()
+        self.signs = np.array([int(lon / 30) % 12 for lon in longitudes], dtype=np.int8)
+        
+        hits = np.empty(len(aspect_hits), dtype=HIT_DTYPE)
+        for field in HIT_DTYPE.names:
+            hits[field] = aspect_hits[field]
+        self.aspect_hits = hits
+        self.aspect_table = aspect_table
+    
+    def set_subject(self, subject: Dict):
+        """Replace the input-specific subject fields"""
+        self.name = subject.get('name', 'User')
+        self.date_time = subject['date_time']
+        self.timezone = subject['timezone']
+        self.jd = subject['jd']
+        self.latitude = subject['latitude']
+        self.longitude = subject['longitude']
+    
+    @classmethod
+    def from_dict(cls, result: Dict) -> "Chart":
+        """Convert a ``calculate_all`` result"""
+        names = tuple(result['planets'])
+        nan = float('nan')
+        bodies = [[p['longitude'], p.get('latitude', nan), p.get('distance', nan), p.get('speed', nan)]
+                  for p in result['planets'].values()]
+        index = {name: i for i, name in enumerate(names)}
+        table_index = {name: k for k, name in enumerate(ASPECT_TABLE.names)}
+        
+        hits = np.empty(len(result['aspects']), dtype=HIT_DTYPE)
+        for row, aspect in enumerate(result['aspects']):
+            hits[row] = (index[aspect['p1']], index[aspect['p2']], table_index[aspect['type']], aspect['orb'])
+        
+        return cls(
+            result['subject'],
+            np.array(bodies, dtype=np.float64),
+            [result['houses'][h]['longitude'] for h in range(1, 13)],
+            [result['ascendant']['longitude'], result['midheaven']['longitude']],
+            hits,
+            names
+        )
+    
+    # ============== Mapping Interface ==============
+    
+    def __getitem__(self, key: str):
+        if key == 'subject':
+            return self.subject
+        if key == 'planets':
+            return PlanetsView(self)
+        if key == 'ascendant':
+            return self.ascendant
+        if key == 'midheaven':
+            return self.midheaven
+        if key == 'houses':
+            return HousesView(self)
+        if key == 'aspects':
+            return self.aspects
+        raise KeyError(key)
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(CHART_KEYS)
+    
+    def __len__(self) -> int:
+        return len(CHART_KEYS)
+    
+    def __repr__(self) -> str:
+        return f"Chart({self.date_time!r}, {self.timezone!r}, lat={self.latitude}, lon={self.longitude})"
+    
+    # ============== Dict Views ==============
+    
+    @property
+    def subject(self) -> Dict:
+        """Birth data block"""
+        return {
+            'name': self.name,
+            'date_time': self.date_time,
+            'latitude': self.latitude,
+            'longitude': self.longitude,
+            'timezone': self.timezone,
+            'jd': self.jd
+        }
+    
+    @property
+    def ascendant(self) -> Dict:
+        """Ascendant with sign details"""
+        n = len(self.body_names)
+        return _point(self.angles[0].item(), int(self.signs[n + 12]))
+    
+    @property
+    def midheaven(self) -> Dict:
+        """Midheaven with sign details"""
+        n = len(self.body_names)
+        return _point(self.angles[1].item(), int(self.signs[n + 13]))
+    
+    @property
+    def aspects(self) -> List[Dict]:
+        """Aspect list, most exact first"""
+        names = self.body_names
+        table = self.aspect_table
+        return [{
+            'p1': names[i],
+            'p2': names[j],
+            'type': table.names[k],
+            'angle': table.raw_angles[k],
+            'orb': orb,
+            'exact': orb < 1.0
+        } for i, j, k, orb in self.aspect_hits.tolist()]
+    
+    def planet(self, index: int) -> Dict:
+        """Position dict of the body at ``index``"""
+        longitude, latitude, distance, speed = self.bodies[index].tolist()
+        sign_num = int(self.signs[index])
+        if speed != speed:
+            # Derived point (South Node): no latitude/distance/speed of its own
+            point = _point(longitude, sign_num)
+            point['retrograde'] = True
+            return point
+        return {
+            'longitude': longitude,
+            'latitude': latitude,
+            'distance': distance,
+            'speed': speed,
+            'sign': SIGNS[sign_num],
+            'sign_th': SIGNS_TH[sign_num],
+            'degree': longitude % 30,
+            'sign_num': sign_num,
+            'retrograde': speed < 0
+        }
+    
+    def house(self, number: int) -> Dict:
+        """Cusp dict of house 1-12"""
+        return _point(self.cusps[number - 1].item(), int(self.signs[len(self.body_names) + number - 1]))
+    
+    def to_dict(self) -> Dict:
+        """Full nested dict, identical to the ``calculate_all`` result"""
+        return {
+            'subject': self.subject,
+            'planets': {name: self.planet(i) for i, name in enumerate(self.body_names)},
+            'ascendant': self.ascendant,
+            'midheaven': self.midheaven,
+            'houses': {h: self.house(h) for h in range(1, 13)},
+            'aspects': self.aspects
+        }
+
+
+class PlanetsView(Mapping):
+    """``chart['planets']``: body name -> position dict"""
+    
+    __slots__ = ('_chart',)
+    
+    def __init__(self, chart: Chart):
+        self._chart = chart
+    
+    def __getitem__(self, name: str) -> Dict:
+        try:
+            index = self._chart.body_names.index(name)
+        except ValueError:
+            raise KeyError(name) from None
+        return self._chart.planet(index)
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._chart.body_names)
+    
+    def __len__(self) -> int:
+        return len(self._chart.body_names)
+
+
+class HousesView(Mapping):
+    """``chart['houses']``: house number 1-12 -> cusp dict"""
+    
+    __slots__ = ('_chart',)
+    
+    def __init__(self, chart: Chart):
+        self._chart = chart
+    
+    def __getitem__(self, number: int) -> Dict:
+        if not isinstance(number, int) or not 1 <= number <= 12:
+            raise KeyError(number)
+        return self._chart.house(number)
+    
+    def __iter__(self) -> Iterator[int]:
+        return iter(range(1, 13))
+    
+    def __len__(self) -> int:
+        return 12
@@ -0,0 +1,156 @@
+"""
+Content-addressed natal chart cache
+``calculate_all`` results keyed by what actually determines them, not by how the birth data was typed in
+
+The key is a hash of the UT Julian Day, coordinates rounded to
+``COORD_DECIMALS`` (4 decimals, about 11 m), house system, swe flags, the
+position source (live Swiss Ephemeris or a Chebyshev table), the pyswisseph
+version and the ephemeris path. Upgrading pyswisseph or pointing at other
+ephemeris files therefore changes every key, so stale charts are never
+served. The input-specific ``subject`` block is not cached; it is rebuilt on
+each call.
+
+Tiers:
+    memory   bounded LRU of pickled bytes (compact, and every hit is a fresh copy)
+    disk     optional SQLite file shared by processes on a host
+
+The shared instance reads the SQLite path from ``$SWISS_HOROSCOPE_CHART_CACHE``
+(unset = memory only).
+"""
+
+import hashlib
+import os
+import pickle
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional
+
+import swisseph as swe
+
+
+COORD_DECIMALS = 4
+DEFAULT_MAXSIZE = 2048
+
+ENV_PATH = 'SWISS_HOROSCOPE_CHART_CACHE'
+
+
+def chart_key(
+    jd: float,
+    latitude: float,
+    longitude: float,
+    house_system: bytes,
+    flags: int,
+    ephe_path: Optional[str],
+    source: str = 'swe'
+) -> str:
+    """Canonical cache key for one chart"""
+    parts = [
+        f"{jd:.8f}",
+        f"{round(latitude, COORD_DECIMALS):.{COORD_DECIMALS}f}",
+        f"{round(longitude, COORD_DECIMALS):.{COORD_DECIMALS}f}",
+        house_system.decode(),
+        str(flags),
+        source,
+        swe.version,
+        ephe_path or ''
+    ]
+    return hashlib.sha1('|'.join(parts).encode()).hexdigest()
+
+
+class ChartCache:
+    """Two-tier (memory LRU + optional SQLite) store of pickled charts"""
+    
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE, path: Optional[str] = None):
+        """Keep up to ``maxsize`` charts in memory; ``path`` enables the SQLite tier"""
+        self.maxsize = maxsize
+        self.path = path
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = None
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        
+        if path:
+            directory = os.path.dirname(os.path.abspath(path))
+            os.makedirs(directory, exist_ok=True)
+            self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("CREATE TABLE IF NOT EXISTS charts (key TEXT PRIMARY KEY, data BLOB NOT NULL)")
+    
+    def get(self, key: str) -> Optional[Dict]:
+        """Cached chart (a fresh copy) or None"""
+        with self._lock:
+            blob = self._memory.get(key)
+            if blob is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return pickle.loads(blob)
+            
+            if self._db is not None:
+                row = self._db.execute("SELECT data FROM charts WHERE key = ?", (key,)).fetchone()
+                if row is not None:
+                    blob = bytes(row[0])
+                    self._remember(key, blob)
+                    self.disk_hits += 1
+                    return pickle.loads(blob)
+            
+            self.misses += 1
+            return None
+    
+    def put(self, key: str, chart: Dict):
+        """Store a chart in every tier"""
+        blob = pickle.dumps(chart, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._remember(key, blob)
+            if self._db is not None:
+                self._db.execute("INSERT OR REPLACE INTO charts (key, data) VALUES (?, ?)", (key, blob))
+    
+    def _remember(self, key: str, blob: bytes):
+        """Insert into the memory tier, evicting least recently used entries"""
+        self._memory[key] = blob
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.maxsize:
+            self._memory.popitem(last=False)
+    
+    def clear(self):
+        """Drop every entry (both tiers) and reset the counters"""
+        with self._lock:
+            self._memory.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM charts")
+            self.hits = self.disk_hits = self.misses = 0
+    
+    def stats(self) -> Dict:
+        """Hit/miss counters and memory footprint"""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'disk_hits': self.disk_hits,
+                'misses': self.misses,
+                'size': len(self._memory),
+                'bytes': sum(len(blob) for blob in self._memory.values())
+            }
+    
+    def close(self):
+        """Close the SQLite connection"""
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+
+# ============== Shared Instance ==============
+
+_shared_cache = None
+_shared_lock = threading.Lock()
+
+
+def get_chart_cache() -> ChartCache:
+    """Process-wide chart cache (SQLite tier from $SWISS_HOROSCOPE_CHART_CACHE, if set)"""
+    global _shared_cache
+    if _shared_cache is None:
+        with _shared_lock:
+            if _shared_cache is None:
+                _shared_cache = ChartCache(path=os.environ.get(ENV_PATH) or None)
+    return _shared_cache
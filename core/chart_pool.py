@@ -0,0 +1,242 @@
+"""
+Process pool for chart, transit and fortune jobs
+pyswisseph holds the GIL and keeps global state, so bulk work scales with processes, not threads
+
+Each worker process sets up Swiss Ephemeris once (its own
+``SwissEphemerisCalculator``) and then serves chunks of jobs. ``ChartPool.map``
+streams results back while reading its input lazily:
+
+    with ChartPool(processes=4) as pool:
+        for chart in pool.map('chart', births):
+            ...
+
+Job kinds and their payloads (dicts):
+
+    chart      calculate_all keyword arguments               -> dict
+    compact    calculate_chart keyword arguments             -> core.chart.Chart
+    transits   get_current_transits_for_date arguments       -> dict
+    daily      {birth, lang}                                 -> daily fortune dict
+    monthly    {birth, year, month, lang}                    -> monthly outlook dict
+    yearly     {birth, year, lang}                           -> yearly outlook dict
+
+Backpressure: at most ``max_pending`` chunks are in flight, and input items
+are only pulled when a slot frees up, so a generator over millions of rows
+never gets materialized. ``cancel()`` (or abandoning the iterator) stops
+submitting and cancels chunks that have not started.
+"""
+
+import os
+import threading
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .swiss_eph import SwissEphemerisCalculator
+from .fortune_reader import (
+    generate_detailed_daily_fortune, generate_monthly_outlook, generate_yearly_outlook,
+    get_current_transits_for_date
+)
+
+
+DEFAULT_CHUNK_SIZE = 32
+
+
+class ChartJobError(Exception):
+    """A job failed in a worker; carries the item index and the original error text"""
+    
+    def __init__(self, index: int, message: str):
+        super().__init__(f"job {index} failed: {message}")
+        self.index = index
+        self.message = message
+
+
+# ============== Worker Side ==============
+
+_worker_calc = None
+
+
+def _init_worker(ephe_path: Optional[str]):
+    """Per-process setup: one calculator, one set_ephe_path call"""
+    global _worker_calc
+    _worker_calc = SwissEphemerisCalculator(ephe_path)
+
+
+def _job_chart(calc, payload: Dict):
+    """Natal chart dict"""
+    return calc.calculate_all(**payload)
+
+
+def _job_compact(calc, payload: Dict):
+    """Compact natal chart"""
+    return calc.calculate_chart(**payload)
+
+
+def _job_transits(calc, payload: Dict):
+    """Transit positions for a date"""
+    return get_current_transits_for_date(**payload)
+
+
+def _job_daily(calc, payload: Dict):
+    """Daily fortune for a birth"""
+    chart = calc.calculate_all(**payload['birth'])
+    return generate_detailed_daily_fortune(
+        chart['planets'], chart['houses'], chart['ascendant'],
+        chart['subject']['timezone'], payload.get('lang', 'en')
+    )
+
+
+def _job_monthly(calc, payload: Dict):
+    """Monthly outlook for a birth"""
+    chart = calc.calculate_all(**payload['birth'])
+    return generate_monthly_outlook(
+        chart['planets'], chart['ascendant'], payload['year'], payload['month'],
+        chart['subject']['timezone'], payload.get('lang', 'en')
+    )
+
+
+def _job_yearly(calc, payload: Dict):
+    """Yearly outlook for a birth"""
+    chart = calc.calculate_all(**payload['birth'])
+    return generate_yearly_outlook(
+        chart['planets'], chart['ascendant'], payload['year'],
+        chart['subject']['timezone'], payload.get('lang', 'en')
+    )
+
+
+JOBS: Dict[str, Callable] = {
+    'chart': _job_chart,
+    'compact': _job_compact,
+    'transits': _job_transits,
+    'daily': _job_daily,
+    'monthly': _job_monthly,
+    'yearly': _job_yearly,
+}
+
+
+def _run_chunk(kind: str, payloads: List[Dict]) -> List[Tuple[bool, Any]]:
+    """Run one chunk in a worker; failures are returned per item, not raised"""
+    if _worker_calc is None:
+        _init_worker(None)
+    job = JOBS[kind]
+    results = []
+    for payload in payloads:
+        try:
+            results.append((True, job(_worker_calc, payload)))
+        except Exception as e:
+            results.append((False, f"{type(e).__name__}: {e}"))
+    return results
+
+
+# ============== Pool ==============
+
+class ChartPool:
+    """Long-lived worker processes with chunked, back-pressured, ordered streaming"""
+    
+    def __init__(
+        self,
+        processes: Optional[int] = None,
+        ephe_path: Optional[str] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_pending: Optional[int] = None,
+        mp_context=None
+    ):
+        """Start ``processes`` workers (default: CPU count)
+        
+        ``max_pending`` bounds the chunks in flight (default: 2 per process).
+        """
+        self.processes = processes or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.max_pending = max_pending or 2 * self.processes
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.processes,
+            mp_context=mp_context,
+            initializer=_init_worker,
+            initargs=(ephe_path,)
+        )
+        self._cancelled = threading.Event()
+    
+    def map(
+        self,
+        kind: str,
+        payloads: Iterable[Dict],
+        ordered: bool = True,
+        return_exceptions: bool = False
+    ) -> Iterator:
+        """Stream results for every payload
+        
+        With ``ordered`` results come back in input order; otherwise in
+        completion order as (index, result) pairs. A failed job raises
+        ``ChartJobError`` unless ``return_exceptions`` is set, in which case
+        the error object is yielded in its place.
+        """
+        if kind not in JOBS:
+            raise ValueError(f"Unknown job kind {kind!r}")
+        self._cancelled.clear()
+        
+        items = iter(payloads)
+        pending = deque()   # (start index, future) in submission order
+        next_index = 0
+        
+        def submit() -> bool:
+            nonlocal next_index
+            chunk = list(islice(items, self.chunk_size))
+            if not chunk or self._cancelled.is_set():
+                return False
+            pending.append((next_index, self._executor.submit(_run_chunk, kind, chunk)))
+            next_index += len(chunk)
+            return True
+        
+        def unpack(start: int, future: Future):
+            for offset, (ok, value) in enumerate(future.result()):
+                if not ok:
+                    value = ChartJobError(start + offset, value)
+                    if not return_exceptions:
+                        raise value
+                yield start + offset, value
+        
+        try:
+            exhausted = False
+            while len(pending) < self.max_pending and not exhausted:
+                exhausted = not submit()
+            
+            while pending:
+                if self._cancelled.is_set():
+                    break
+                if ordered:
+                    start, future = pending.popleft()
+                    future.result()
+                else:
+                    done, _ = wait([f for _, f in pending], return_when=FIRST_COMPLETED)
+                    start, future = next((s, f) for s, f in pending if f in done)
+                    pending.remove((start, future))
+                
+                # Refill before handing results out so workers stay busy
+                if not exhausted:
+                    exhausted = not submit()
+                
+                for index, value in unpack(start, future):
+                    if self._cancelled.is_set():
+                        return
+                    yield value if ordered else (index, value)
+        finally:
+            for _, future in pending:
+                future.cancel()
+    
+    def run(self, kind: str, payloads: Iterable[Dict], return_exceptions: bool = False) -> List:
+        """All results as a list, in input order"""
+        return list(self.map(kind, payloads, return_exceptions=return_exceptions))
+    
+    def cancel(self):
+        """Stop the running map: no new chunks, unstarted chunks are dropped"""
+        self._cancelled.set()
+    
+    def close(self, cancel_pending: bool = True):
+        """Shut the workers down"""
+        self._executor.shutdown(wait=True, cancel_futures=cancel_pending)
+    
+    def __enter__(self) -> "ChartPool":
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
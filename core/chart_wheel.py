@@ -5,60 +5,180 @@ Supports: Birth Chart, Transit Overlay, Synastry Comparison
 
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from matplotlib.image import AxesImage
+from matplotlib.transforms import IdentityTransform
 import numpy as np
 from typing import Dict, List, Optional, Tuple
 import io
-from datetime import datetime
-import swisseph as swe
-import pytz
-
-# Planet glyphs and colors
-PLANET_GLYPHS = {
-    'Sun': '☉', 'Moon': '☽', 'Mercury': '☿', 'Venus': '♀', 'Mars': '♂',
-    'Jupiter': '♃', 'Saturn': '♄', 'Uranus': '⛢', 'Neptune': '♆',
-    'Pluto': '♇', 'North Node': '☊', 'South Node': '☋',
-    'Chiron': '⚷', 'Ceres': '⚵', 'Pallas': '⚶', 'Juno': '⚳', 'Vesta': '⚴'
-}
-
-PLANET_COLORS = {
-    'Sun': '#FFD700', 'Moon': '#C0C0C0', 'Mercury': '#A9A9A9', 'Venus': '#FFA500',
-    'Mars': '#FF4500', 'Jupiter': '#DAA520', 'Saturn': '#D2691E', 'Uranus': '#40E0D0',
-    'Neptune': '#4169E1', 'Pluto': '#8B4513', 'North Node': '#FF69B4', 'South Node': '#FFB6C1',
-    'Chiron': '#9370DB', 'Ceres': '#98FB98', 'Pallas': '#DDA0DD', 'Juno': '#F0E68C', 'Vesta': '#E6E6FA'
-}
-
-# Sign colors
-SIGN_COLORS = {
-    'Aries': '#FF6B6B', 'Taurus': '#4ECDC4', 'Gemini': '#FFE66D', 'Cancer': '#95E1D3',
-    'Leo': '#F38181', 'Virgo': '#AA96DA', 'Libra': '#FCBAD3', 'Scorpio': '#A8D8EA',
-    'Sagittarius': '#FF9F43', 'Capricorn': '#6C5CE7', 'Aquarius': '#74B9FF', 'Pisces': '#DFE6E9'
-}
-
-ELEMENT_COLORS = {
-    'Fire': '#FF6B6B', 'Earth': '#4ECDC4', 'Air': '#FFE66D', 'Water': '#74B9FF'
-}
-
-# Aspect colors and line styles
-ASPECT_CONFIG = {
-    'Conjunction': {'color': '#FFFFFF', 'width': 2, 'style': '-'},
-    'Opposition': {'color': '#FF6B6B', 'width': 1.5, 'style': '-'},
-    'Square': {'color': '#FF4500', 'width': 1.5, 'style': '-'},
-    'Trine': {'color': '#4ECDC4', 'width': 1.5, 'style': '-'},
-    'Sextile': {'color': '#95E1D3', 'width': 1, 'style': '--'},
-}
-
-
-def normalize_angle(angle: float) -> float:
-    """Normalize angle to 0-360 degrees"""
-    return angle % 360
-
-
-def degree_to_chart_coords(longitude: float, radius: float) -> tuple:
-    """Convert zodiac longitude to chart coordinates."""
-    angle = np.radians(90 - longitude)
-    x = radius * np.cos(angle)
-    y = radius * np.sin(angle)
-    return x, y
+import struct
+import threading
+import weakref
+import zlib
+from collections import OrderedDict
+
+from .wheel_data import (
+    ASPECT_CONFIG, BACKGROUND, ELEMENT_COLORS, PLANET_COLORS, PLANET_GLYPHS, SIGN_COLORS, SIGN_GLYPHS, SIGNS,
+    SYNASTRY_ASPECT_LETTERS, SYNASTRY_ASPECT_TABLE, SYNASTRY_PLANETS, TRANSIT_ASPECT_COLORS,
+    TRANSIT_OVERLAY_ASPECTS, TRANSIT_OVERLAY_PLANETS, TRANSIT_PLANETS,
+    calculate_synastry_aspects, degree_to_chart_coords, find_transit_overlay_aspects,
+    get_current_transits, normalize_angle
+)
+
+
+# ============== Static Wheel Layer ==============
+
+# Wheels are built at the dpi chart_to_image writes, so the cached ring maps 1:1 onto output pixels
+CHART_DPI = 150
+PNG_COMPRESS_LEVEL = 1
+
+
+class WheelLayer:
+    """Pre-rendered zodiac ring plus the layout every wheel of the same geometry shares"""
+    
+    __slots__ = ('size', 'position', 'image', 'extent', 'crop')
+    
+    def __init__(self, size: tuple, position: list, image: np.ndarray, extent: tuple, crop: tuple):
+        self.size = size            # figure size (inches)
+        self.position = position    # axes position after tight_layout
+        self.image = image          # RGBA raster of the axes area, bottom row first
+        self.extent = extent        # data coordinates covered by image
+        self.crop = crop            # unrounded tight bounding box in pixels (x0, y0, x1, y1), origin bottom-left
+
+
+_layer_cache: "OrderedDict[tuple, WheelLayer]" = OrderedDict()
+_layer_lock = threading.Lock()
+_LAYER_CACHE_SIZE = 8
+
+# Wheel figures -> (layer, artists that may reach past the cached bounding box)
+_wheel_figures = weakref.WeakKeyDictionary()
+
+
+class _RingImage(AxesImage):
+    """AxesImage that blits its raster untouched when it already matches the output pixels"""
+    
+    def make_image(self, renderer, magnification=1.0, unsampled=False):
+        x0, x1, y0, y1 = self.get_extent()
+        (px0, py0), (px1, py1) = self.axes.transData.transform([(x0, y0), (x1, y1)])
+        height, width = self._A.shape[:2]
+        if (magnification == 1.0 and not unsampled
+                and round(px1 - px0) == width and round(py1 - py0) == height):
+            return self._A, round(px0), round(py0), IdentityTransform()
+        return super().make_image(renderer, magnification, unsampled)
+
+
+def _draw_sign_ring(ax, outer_radius: float, inner_radius: float, glyph_radius: float, glyph_size: float):
+    """The 12 sign wedges with their glyphs"""
+    for i, (sign, glyph) in enumerate(SIGN_GLYPHS.items()):
+        start_angle = 90 - i * 30
+        wedge = mpatches.Wedge((0, 0), outer_radius, start_angle - 30, start_angle,
+                               width=outer_radius - inner_radius,
+                               facecolor=SIGN_COLORS.get(sign, '#333'),
+                               edgecolor='#2d2d44', linewidth=1)
+        ax.add_patch(wedge)
+        
+        angle_rad = np.radians(start_angle - 15)
+        ax.text(glyph_radius * np.cos(angle_rad), glyph_radius * np.sin(angle_rad), glyph,
+                ha='center', va='center', fontsize=glyph_size, color='#fff', fontweight='bold')
+
+
+def _render_layer(size: tuple, limit: float, ring: tuple, circles: tuple, title: str, title_size: float) -> WheelLayer:
+    """Draw the static part of a wheel once, off-screen, and keep its pixels"""
+    # Laid out at the default dpi, like the pyplot figures the wheels used to be;
+    # tight_layout snaps text extents to pixels, so the dpi moves the axes slightly
+    fig = Figure(figsize=size, facecolor=BACKGROUND, dpi=plt.rcParams['figure.dpi'])
+    canvas = FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    ax.set_facecolor(BACKGROUND)
+    
+    _draw_sign_ring(ax, 1.0, *ring)
+    for radius, color, linewidth, linestyle in circles:
+        ax.add_patch(plt.Circle((0, 0), radius, fill=False, color=color, linewidth=linewidth, linestyle=linestyle))
+    
+    ax.set_xlim(-limit, limit)
+    ax.set_ylim(-limit, limit)
+    ax.set_aspect('equal')
+    ax.axis('off')
+    ax.set_title(title, fontsize=title_size, color='#fff', pad=20, y=1.0, fontweight='bold')
+    fig.tight_layout()
+    fig.set_dpi(CHART_DPI)
+    canvas.draw()
+    
+    renderer = canvas.get_renderer()
+    pixels = np.asarray(canvas.buffer_rgba())
+    height = pixels.shape[0]
+    
+    # Whole pixels around the (aspect-adjusted) axes box, and the data extent they cover
+    box = ax.get_window_extent(renderer)
+    x0, y0 = int(np.floor(box.x0)), int(np.floor(box.y0))
+    x1, y1 = int(np.ceil(box.x1)), int(np.ceil(box.y1))
+    (ex0, ey0), (ex1, ey1) = ax.transData.inverted().transform([(x0, y0), (x1, y1)])
+    image = pixels[height - y1:height - y0, x0:x1][::-1].copy()
+    
+    # Same box savefig(bbox_inches='tight') would crop to, with its 0.1 in padding
+    tight = fig.get_tightbbox(renderer).padded(0.1)
+    crop = tuple(v * CHART_DPI for v in (tight.x0, tight.y0, tight.x1, tight.y1))
+    
+    return WheelLayer(tuple(size), list(ax.get_position(original=True).bounds), image,
+                      (ex0, ex1, ey0, ey1), crop)
+
+
+def get_wheel_layer(size: tuple, limit: float, ring: tuple, circles: tuple = (),
+                    title: str = '', title_size: float = 12) -> WheelLayer:
+    """Cached static layer for a wheel geometry
+    
+    ``ring`` is (inner radius, glyph radius, glyph font size) of the sign ring,
+    ``circles`` fixed (radius, color, linewidth, linestyle) rings. Only the line
+    count of ``title`` matters for the layout.
+    """
+    key = (tuple(size), limit, ring, circles, title, title_size)
+    with _layer_lock:
+        layer = _layer_cache.get(key)
+        if layer is not None:
+            _layer_cache.move_to_end(key)
+            return layer
+    
+    layer = _render_layer(size, limit, ring, circles, title, title_size)
+    with _layer_lock:
+        _layer_cache[key] = layer
+        while len(_layer_cache) > _LAYER_CACHE_SIZE:
+            _layer_cache.popitem(last=False)
+    return layer
+
+
+def _wheel_figure(layer: WheelLayer, limit: float) -> Tuple[plt.Figure, plt.Axes]:
+    """New figure with the cached ring already in place; callers add the chart-specific artists"""
+    fig = plt.figure(figsize=layer.size, facecolor=BACKGROUND, dpi=CHART_DPI)
+    ax = fig.add_axes(layer.position)
+    ax.set_facecolor(BACKGROUND)
+    ring = _RingImage(ax, extent=layer.extent, origin='lower', interpolation='nearest', zorder=0)
+    ring.set_data(layer.image)
+    ax.add_image(ring)
+    ax.set_xlim(-limit, limit)
+    ax.set_ylim(-limit, limit)
+    ax.set_aspect('equal')
+    ax.axis('off')
+    _wheel_figures[fig] = (layer, [ax.title])
+    return fig, ax
+
+
+def _encode_png(rgb: np.ndarray) -> bytes:
+    """PNG bytes of an RGB array (unfiltered rows, fast zlib level)"""
+    height, width, _ = rgb.shape
+    raw = np.empty((height, width * 3 + 1), dtype=np.uint8)
+    raw[:, 0] = 0
+    pixels = raw[:, 1:].reshape(height, width, 3)
+    for channel in range(3):
+        # Channel by channel is several times faster than one strided RGBA -> RGB copy
+        pixels[..., channel] = rgb[..., channel]
+    
+    def chunk(tag: bytes, data: bytes) -> bytes:
+        return struct.pack('>I', len(data)) + tag + data + struct.pack('>I', zlib.crc32(tag + data))
+    
+    header = struct.pack('>IIBBBBB', width, height, 8, 2, 0, 0, 0)
+    return (b'\x89PNG\r\n\x1a\n' + chunk(b'IHDR', header) +
+            chunk(b'IDAT', zlib.compress(raw, PNG_COMPRESS_LEVEL)) + chunk(b'IEND', b''))
 
 
 def create_chart_wheel(
@@ -73,32 +193,15 @@ def create_chart_wheel(
 ) -> plt.Figure:
     """Create a natal chart wheel"""
     
-    fig, ax = plt.subplots(figsize=size, facecolor='#1a1a2e')
-    ax.set_facecolor('#1a1a2e')
-    
     outer_radius = 1.0
     house_radius = 0.85
     planet_radius = 0.55
     
-    # Draw outer ring (signs)
-    sign_glyphs = {'Aries': '♈', 'Taurus': '♉', 'Gemini': '♊', 'Cancer': '♋',
-                   'Leo': '♌', 'Virgo': '♍', 'Libra': '♎', 'Scorpio': '♏',
-                   'Sagittarius': '♐', 'Capricorn': '♑', 'Aquarius': '♒', 'Pisces': '♓'}
-    
-    for i, sign in enumerate(['Aries', 'Taurus', 'Gemini', 'Cancer', 'Leo', 'Virgo',
-                               'Libra', 'Scorpio', 'Sagittarius', 'Capricorn', 'Aquarius', 'Pisces']):
-        start_angle = 90 - i * 30
-        wedge = mpatches.Wedge((0, 0), outer_radius, start_angle - 30, start_angle,
-                               width=outer_radius - house_radius,
-                               facecolor=SIGN_COLORS.get(sign, '#333'),
-                               edgecolor='#2d2d44', linewidth=1)
-        ax.add_patch(wedge)
-        
-        angle_rad = np.radians(start_angle - 15)
-        glyph_x = (outer_radius - 0.05) * np.cos(angle_rad)
-        glyph_y = (outer_radius - 0.05) * np.sin(angle_rad)
-        ax.text(glyph_x, glyph_y, sign_glyphs.get(sign, ''), 
-                ha='center', va='center', fontsize=8, color='#fff', fontweight='bold')
+    # Sign ring (and the house circle) come pre-rendered
+    house_circle = ((house_radius, '#3d3d5c', 2, '-'),) if show_houses and houses else ()
+    layer = get_wheel_layer(size, 1.2, (house_radius, outer_radius - 0.05, 8), house_circle,
+                            'Natal Chart', 14)
+    fig, ax = _wheel_figure(layer, 1.2)
     
     # Draw house cusps
     if show_houses and houses:
@@ -114,10 +217,6 @@ def create_chart_wheel(
                 hx, hy = degree_to_chart_coords(mid_long, (house_radius + outer_radius) / 2)
                 ax.text(hx, hy, str(house_num), ha='center', va='center', 
                         fontsize=7, color='#888', fontweight='bold')
-        
-        circle = plt.Circle((0, 0), house_radius, fill=False, 
-                            color='#3d3d5c', linewidth=2, linestyle='-')
-        ax.add_patch(circle)
     
     # Draw aspects
     if show_aspects and aspects:
@@ -160,18 +259,37 @@ def create_chart_wheel(
         ax.annotate('MC', xy=degree_to_chart_coords(mc_long, house_radius - 0.08),
                    fontsize=8, color='#FFD700', fontweight='bold', ha='center')
     
-    ax.set_xlim(-1.2, 1.2)
-    ax.set_ylim(-1.2, 1.2)
-    ax.set_aspect('equal')
-    ax.axis('off')
-    ax.set_title('Natal Chart', fontsize=14, color='#fff', pad=20, fontweight='bold')
+    ax.set_title('Natal Chart', fontsize=14, color='#fff', pad=20, y=1.0, fontweight='bold')
     
-    plt.tight_layout()
     return fig
 
 
 def chart_to_image(fig: plt.Figure) -> bytes:
     """Convert matplotlib figure to PNG bytes"""
+    wheel = _wheel_figures.get(fig)
+    if (wheel is not None and isinstance(fig.canvas, FigureCanvasAgg) and fig.dpi == CHART_DPI
+            and tuple(fig.get_size_inches()) == wheel[0].size):
+        # One draw, cropped to the layer's known tight box (widened for long titles)
+        # instead of savefig's measuring pass
+        layer, outer = wheel
+        fig.canvas.draw()
+        renderer = fig.canvas.get_renderer()
+        pad = 0.1 * CHART_DPI
+        x0, y0, x1, y1 = layer.crop
+        for artist in outer:
+            if artist.get_visible() and artist.get_text():
+                box = artist.get_window_extent(renderer)
+                x0, y0 = min(x0, box.x0 - pad), min(y0, box.y0 - pad)
+                x1, y1 = max(x1, box.x1 + pad), max(y1, box.y1 + pad)
+        
+        # savefig truncates the box to whole pixels, keeping its top-left corner
+        pixels = np.asarray(fig.canvas.buffer_rgba())
+        height, width = pixels.shape[:2]
+        left, top = int(round(x0)), height - int(round(y1))
+        right, bottom = left + int(x1 - x0), top + int(y1 - y0)
+        left, top, right, bottom = max(left, 0), max(top, 0), min(right, width), min(bottom, height)
+        return _encode_png(pixels[top:bottom, left:right, :3])
+    
     buf = io.BytesIO()
     fig.savefig(buf, format='png', facecolor=fig.get_facecolor(), 
                 edgecolor='none', bbox_inches='tight', dpi=150)
@@ -181,40 +299,6 @@ def chart_to_image(fig: plt.Figure) -> bytes:
 
 # ============== Transit Overlay ==============
 
-TRANSIT_PLANETS = {
-    'Sun': swe.SUN, 'Moon': swe.MOON, 'Mercury': swe.MERCURY, 'Venus': swe.VENUS,
-    'Mars': swe.MARS, 'Jupiter': swe.JUPITER, 'Saturn': swe.SATURN,
-    'Uranus': swe.URANUS, 'Neptune': swe.NEPTUNE, 'Pluto': swe.PLUTO
-}
-
-SIGNS = ["Aries", "Taurus", "Gemini", "Cancer", "Leo", "Virgo",
-         "Libra", "Scorpio", "Sagittarius", "Capricorn", "Aquarius", "Pisces"]
-
-
-def get_current_transits(timezone: str = "Asia/Bangkok") -> Dict:
-    """Calculate current planetary positions (transits)"""
-    now = datetime.now(pytz.timezone(timezone))
-    jd = swe.julday(now.year, now.month, now.day, now.hour + now.minute/60.0)
-    flags = swe.FLG_SWIEPH | swe.FLG_SPEED
-    
-    transits = {}
-    for name, planet_id in TRANSIT_PLANETS.items():
-        result = swe.calc_ut(jd, planet_id, flags)
-        longitude = result[0][0]
-        sign_num = int(longitude / 30) % 12
-        degree = longitude % 30
-        
-        transits[name] = {
-            'longitude': longitude,
-            'sign': SIGNS[sign_num],
-            'degree': degree,
-            'sign_num': sign_num,
-            'speed': result[0][3]
-        }
-    
-    return transits
-
-
 def create_transit_overlay_chart(
     natal_planets: Dict,
     natal_houses: Dict,
@@ -229,32 +313,15 @@ def create_transit_overlay_chart(
 ) -> plt.Figure:
     """Natal chart with transit overlay. Natal: INNER, Transits: OUTER"""
     
-    fig, ax = plt.subplots(figsize=size, facecolor='#1a1a2e')
-    ax.set_facecolor('#1a1a2e')
-    
     outer_radius = 1.0
     natal_radius = 0.5
     transit_radius = 0.75
     
-    sign_glyphs = {'Aries': '♈', 'Taurus': '♉', 'Gemini': '♊', 'Cancer': '♋',
-                   'Leo': '♌', 'Virgo': '♍', 'Libra': '♎', 'Scorpio': '♏',
-                   'Sagittarius': '♐', 'Capricorn': '♑', 'Aquarius': '♒', 'Pisces': '♓'}
-    
-    # Draw signs
-    for i, sign in enumerate(['Aries', 'Taurus', 'Gemini', 'Cancer', 'Leo', 'Virgo',
-                               'Libra', 'Scorpio', 'Sagittarius', 'Capricorn', 'Aquarius', 'Pisces']):
-        start_angle = 90 - i * 30
-        wedge = mpatches.Wedge((0, 0), outer_radius, start_angle - 30, start_angle,
-                               width=outer_radius - transit_radius,
-                               facecolor=SIGN_COLORS.get(sign, '#333'),
-                               edgecolor='#2d2d44', linewidth=1)
-        ax.add_patch(wedge)
-        
-        angle_rad = np.radians(start_angle - 15)
-        glyph_x = (outer_radius - 0.03) * np.cos(angle_rad)
-        glyph_y = (outer_radius - 0.03) * np.sin(angle_rad)
-        ax.text(glyph_x, glyph_y, sign_glyphs.get(sign, ''), 
-                ha='center', va='center', fontsize=7, color='#fff', fontweight='bold')
+    # Sign ring and both orbit circles come pre-rendered
+    title = 'Transit Overlay Chart\n(Natal: Inner | Transits: Outer)'
+    circles = ((natal_radius, '#666', 1.5, '-'), (transit_radius, '#888', 1, '--'))
+    layer = get_wheel_layer(size, 1.25, (transit_radius, outer_radius - 0.03, 7), circles, title, 12)
+    fig, ax = _wheel_figure(layer, 1.25)
     
     # House cusps
     if show_houses and natal_houses:
@@ -266,12 +333,6 @@ def create_transit_overlay_chart(
                 x2, y2 = degree_to_chart_coords(long, natal_radius)
                 ax.plot([x1, x2], [y1, y2], color='#4a4a6a', linewidth=0.8, alpha=0.5)
     
-    # Circles
-    circle1 = plt.Circle((0, 0), natal_radius, fill=False, color='#666', linewidth=1.5)
-    ax.add_patch(circle1)
-    circle2 = plt.Circle((0, 0), transit_radius, fill=False, color='#888', linewidth=1, linestyle='--')
-    ax.add_patch(circle2)
-    
     # Natal planets
     for planet, data in natal_planets.items():
         long = data['longitude']
@@ -285,9 +346,7 @@ def create_transit_overlay_chart(
         ax.text(x, y, glyph, ha='center', va='center', fontsize=8, color='#000', fontweight='bold', zorder=4)
     
     # Transit planets
-    transit_planet_list = ['Sun', 'Moon', 'Mercury', 'Venus', 'Mars', 'Jupiter', 
-                          'Saturn', 'Uranus', 'Neptune', 'Pluto']
-    for planet in transit_planet_list:
+    for planet in TRANSIT_OVERLAY_PLANETS:
         if planet in transit_planets:
             data = transit_planets[planet]
             long = data['longitude']
@@ -306,39 +365,11 @@ def create_transit_overlay_chart(
     
     # Transit-Natal aspects
     if show_transit_aspects:
-        planet_pos_natal = {p: degree_to_chart_coords(natal_planets[p]['longitude'], natal_radius) 
-                          for p in natal_planets}
-        planet_pos_transit = {p: degree_to_chart_coords(transit_planets[p]['longitude'], transit_radius) 
-                            for p in transit_planets if p in transit_planets}
-        
-        for t_planet in transit_planet_list:
-            if t_planet not in transit_planets or t_planet not in planet_pos_transit:
-                continue
-            for n_planet in natal_planets:
-                if n_planet not in planet_pos_natal:
-                    continue
-                
-                t_long = transit_planets[t_planet]['longitude']
-                n_long = natal_planets[n_planet]['longitude']
-                
-                diff = abs(t_long - n_long)
-                if diff > 180:
-                    diff = 360 - diff
-                
-                # Check major aspects
-                for aspect_deg, aspect_name, max_orb in [(0, 'Conjunction', 2), 
-                                                          (180, 'Opposition', 2),
-                                                          (90, 'Square', 2), 
-                                                          (120, 'Trine', 2)]:
-                    orb = abs(diff - aspect_deg)
-                    if orb <= max_orb:
-                        x1, y1 = planet_pos_transit[t_planet]
-                        x2, y2 = planet_pos_natal[n_planet]
-                        
-                        colors = {'Conjunction': '#FF00FF', 'Opposition': '#FF6B6B',
-                                 'Square': '#FF4500', 'Trine': '#4ECDC4'}
-                        ax.plot([x1, x2], [y1, y2], color=colors.get(aspect_name, '#888'), 
-                               linewidth=1.5, linestyle='--', alpha=0.7, zorder=1)
+        for t_planet, n_planet, aspect_name in find_transit_overlay_aspects(natal_planets, transit_planets):
+            x1, y1 = degree_to_chart_coords(transit_planets[t_planet]['longitude'], transit_radius)
+            x2, y2 = degree_to_chart_coords(natal_planets[n_planet]['longitude'], natal_radius)
+            ax.plot([x1, x2], [y1, y2], color=TRANSIT_ASPECT_COLORS.get(aspect_name, '#888'), 
+                   linewidth=1.5, linestyle='--', alpha=0.7, zorder=1)
     
     # Labels
     if natal_ascendant:
@@ -348,58 +379,13 @@ def create_transit_overlay_chart(
         ax.annotate('MC', xy=degree_to_chart_coords(natal_midheaven['longitude'], natal_radius - 0.12),
                    fontsize=7, color='#FFD700', fontweight='bold', ha='center')
     
-    ax.set_xlim(-1.25, 1.25)
-    ax.set_ylim(-1.25, 1.25)
-    ax.set_aspect('equal')
-    ax.axis('off')
-    ax.set_title('Transit Overlay Chart\n(Natal: Inner | Transits: Outer)', 
-                 fontsize=12, color='#fff', pad=20, fontweight='bold')
+    ax.set_title(title, fontsize=12, color='#fff', pad=20, y=1.0, fontweight='bold')
     
-    plt.tight_layout()
     return fig
 
 
 # ============== Synastry Chart ==============
 
-def calculate_synastry_aspects(person1_planets: Dict, person2_planets: Dict) -> List[Dict]:
-    """Calculate synastry aspects between two people's planets"""
-    aspects = []
-    
-    planets1 = ['Sun', 'Moon', 'Mercury', 'Venus', 'Mars', 'Jupiter', 'Saturn', 'Uranus', 'Neptune', 'Pluto']
-    
-    for p1 in planets1:
-        if p1 not in person1_planets:
-            continue
-        for p2 in planets1:
-            if p2 not in person2_planets:
-                continue
-            
-            long1 = person1_planets[p1]['longitude']
-            long2 = person2_planets[p2]['longitude']
-            
-            diff = abs(long1 - long2)
-            if diff > 180:
-                diff = 360 - diff
-            
-            for aspect_deg, aspect_name, max_orb in [(0, "Conjunction", 8),
-                                                      (60, "Sextile", 6),
-                                                      (90, "Square", 8),
-                                                      (120, "Trine", 8),
-                                                      (180, "Opposition", 8)]:
-                orb = abs(diff - aspect_deg)
-                if orb <= max_orb:
-                    aspects.append({
-                        'p1': p1,
-                        'p2': p2,
-                        'type': aspect_name,
-                        'orb': orb,
-                        'exact': orb < 1.0
-                    })
-    
-    aspects.sort(key=lambda x: x['orb'])
-    return aspects
-
-
 def create_synastry_chart(
     person1_planets: Dict,
     person1_houses: Dict,
@@ -419,38 +405,16 @@ def create_synastry_chart(
     
     synastry_aspects = calculate_synastry_aspects(person1_planets, person2_planets)
     
-    fig, ax = plt.subplots(figsize=size, facecolor='#1a1a2e')
-    ax.set_facecolor('#1a1a2e')
-    
     outer_radius = 1.0
     person1_radius = 0.45
     person2_radius = 0.72
     
-    sign_glyphs = {'Aries': '♈', 'Taurus': '♉', 'Gemini': '♊', 'Cancer': '♋',
-                   'Leo': '♌', 'Virgo': '♍', 'Libra': '♎', 'Scorpio': '♏',
-                   'Sagittarius': '♐', 'Capricorn': '♑', 'Aquarius': '♒', 'Pisces': '♓'}
-    
-    # Draw signs
-    for i, sign in enumerate(['Aries', 'Taurus', 'Gemini', 'Cancer', 'Leo', 'Virgo',
-                               'Libra', 'Scorpio', 'Sagittarius', 'Capricorn', 'Aquarius', 'Pisces']):
-        start_angle = 90 - i * 30
-        wedge = mpatches.Wedge((0, 0), outer_radius, start_angle - 30, start_angle,
-                               width=outer_radius - person2_radius,
-                               facecolor=SIGN_COLORS.get(sign, '#333'),
-                               edgecolor='#2d2d44', linewidth=1)
-        ax.add_patch(wedge)
-        
-        angle_rad = np.radians(start_angle - 15)
-        glyph_x = (outer_radius - 0.03) * np.cos(angle_rad)
-        glyph_y = (outer_radius - 0.03) * np.sin(angle_rad)
-        ax.text(glyph_x, glyph_y, sign_glyphs.get(sign, ''), 
-                ha='center', va='center', fontsize=7, color='#fff', fontweight='bold')
-    
-    # Circles
-    circle1 = plt.Circle((0, 0), person1_radius, fill=False, color='#4169E1', linewidth=2)
-    ax.add_patch(circle1)
-    circle2 = plt.Circle((0, 0), person2_radius, fill=False, color='#FF69B4', linewidth=2)
-    ax.add_patch(circle2)
+    # Sign ring and both person circles come pre-rendered; the layout only
+    # depends on the title being one line, so the names stay out of the key
+    circles = ((person1_radius, '#4169E1', 2, '-'), (person2_radius, '#FF69B4', 2, '-'))
+    layer = get_wheel_layer(size, 1.25, (person2_radius, outer_radius - 0.03, 7), circles,
+                            'Synastry Chart', 12)
+    fig, ax = _wheel_figure(layer, 1.25)
     
     # House cusps
     if show_houses and person1_houses:
@@ -497,9 +461,6 @@ def create_synastry_chart(
         planet_pos_p2 = {p: degree_to_chart_coords(person2_planets[p]['longitude'], person2_radius) 
                         for p in person2_planets}
         
-        aspect_emojis = {'Conjunction': 'C', 'Opposition': 'O', 'Square': 'X',
-                        'Trine': 'T', 'Sextile': 'S'}
-        
         for asp in synastry_aspects[:12]:
             p1, p2 = asp['p1'], asp['p2']
             if p1 in planet_pos_p1 and p2 in planet_pos_p2:
@@ -511,7 +472,7 @@ def create_synastry_chart(
                        linewidth=config['width'] + 0.5, linestyle='-', alpha=0.8, zorder=2)
                 
                 mid_x, mid_y = (x1 + x2) / 2, (y1 + y2) / 2
-                emoji = aspect_emojis.get(asp['type'], '●')
+                emoji = SYNASTRY_ASPECT_LETTERS.get(asp['type'], '●')
                 ax.text(mid_x, mid_y, emoji, ha='center', va='center', 
                        fontsize=10, color=config['color'], fontweight='bold', zorder=5)
     
@@ -523,16 +484,11 @@ def create_synastry_chart(
         ax.annotate('ASC2', xy=degree_to_chart_coords(person2_ascendant['longitude'], person2_radius + 0.08),
                    fontsize=6, color='#FF69B4', fontweight='bold', ha='center')
     
-    ax.set_xlim(-1.25, 1.25)
-    ax.set_ylim(-1.25, 1.25)
-    ax.set_aspect('equal')
-    ax.axis('off')
-    
-    ax.text(0, -1.15, f"🔵 {person1_name} (Inner)  |  🔴 {person2_name} (Outer)", 
-            ha='center', va='center', fontsize=10, color='#ccc')
+    legend = ax.text(0, -1.15, f"🔵 {person1_name} (Inner)  |  🔴 {person2_name} (Outer)", 
+                     ha='center', va='center', fontsize=10, color='#ccc')
+    _wheel_figures[fig][1].append(legend)
     
     ax.set_title(f'Synastry Chart: {person1_name} & {person2_name}', 
-                 fontsize=12, color='#fff', pad=20, fontweight='bold')
+                 fontsize=12, color='#fff', pad=20, y=1.0, fontweight='bold')
     
-    plt.tight_layout()
     return fig
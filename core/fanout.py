@@ -0,0 +1,354 @@
+"""
+Daily fortune fan-out
+One transit computation for the day, scored against many natal charts in vectorized chunks
+
+``generate_detailed_daily_fortune`` computes the sky and walks the aspects of
+one chart per call. For the morning push the sky is the same for every
+subscriber, so ``DailySky`` computes it once and each chunk of natal charts
+is scored in a handful of array operations:
+
+    aspects      one find_aspects call: the day's transits against every chart
+    houses       house of every natal and transit body in every chart (house_lookup)
+    sabian       natal degree symbols by table lookup (transit symbols once per day)
+
+The scores are then turned into the same dicts as
+``generate_detailed_daily_fortune`` (for the sky's moment and time zone) and
+yielded one subscriber at a time, so memory is bounded by ``chunk_size``
+however many subscribers stream through.
+
+Exact perfection times are on by default (``exact_times=True``). The search
+window of an aspect depends on its orb (as in ``find_aspect_perfection``), so
+each transit body is sampled once per distinct window and every aspect with
+that window is solved against the shared track. Same samples, same Newton
+polish: the times match the per-chart path to the minute, slow bodies included.
+Building the tracks costs a few seconds once per day (3-4 s here), then about
+1.2 ms per chart. With ``exact_times=False`` every aspect has ``exact_time``
+and ``applying`` set to None, so the output is no longer identical to
+``generate_detailed_daily_fortune``; scoring alone is about 0.13 ms per chart.
+
+Input is either (id, chart) pairs, with charts from ``calculate_all`` or
+``Chart``, or a file written by ``core.ingest``:
+
+    python -m core.fanout charts.parquet fortunes.jsonl --id-column id --date 2024-03-20T07:00
+"""
+
+import argparse
+import json
+import sys
+import time
+from datetime import datetime
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+import pytz
+
+from .aspect_engine import find_aspects
+from .chart import Chart
+from .fortune_reader import (
+    HOUSE_MEANINGS, LUCKY_COLORS, LUCKY_NUMBERS, SIGN_ELEMENTS, TRANSIT_ASPECT_TABLE,
+    get_current_transits_for_date, get_daily_recommendations, get_retrograde_effects, get_sabian_symbol
+)
+from .house_lookup import house_positions
+from .swiss_eph import PLANETS, SIGNS
+from .transit_solver import (
+    MAX_WINDOW_DAYS, MEAN_SPEEDS, TRANSIT_BODIES, BodyTrack, _wrap180, datetime_to_jd, jd_to_datetime
+)
+
+
+DEFAULT_CHUNK_SIZE = 5000
+
+# Same selections as generate_detailed_daily_fortune
+MAJOR_TRANSITS = ["Sun", "Moon", "Mercury", "Venus", "Mars", "Jupiter", "Saturn"]
+TOP_ASPECTS = 8
+
+# Sabian symbol of every zodiac degree (sign * 30 + degree), '' where the list is short
+SABIAN_TABLE = np.array(
+    [get_sabian_symbol(sign, degree) for sign in SIGNS for degree in range(30)], dtype=object
+)
+
+
+def sabian_symbols(longitudes: np.ndarray) -> np.ndarray:
+    """Sabian symbols of natal longitudes, as ``get_sabian_symbol`` on the 0.1°-rounded degree"""
+    sign = (longitudes / 30).astype(int) % 12
+    degree = np.round(longitudes % 30, 1).astype(int) % 30
+    return SABIAN_TABLE[sign * 30 + degree]
+
+
+class DailySky:
+    """The day's transits, computed once and shared by every chart of a fan-out
+    
+    ``now`` is an aware datetime; its zone is used for dates and exact times.
+    """
+    
+    def __init__(self, now: datetime, timezone: str, lang: str = "en"):
+        self.now = now
+        self.timezone = timezone
+        self.lang = lang
+        self.jd = datetime_to_jd(now)
+        self.transits = get_current_transits_for_date(now.year, now.month, now.day, now.hour, now.minute, timezone)
+        self.names = list(self.transits)
+        self.longitudes = np.array([self.transits[p]['longitude'] for p in self.names])
+        self.sabian = {p: get_sabian_symbol(d['sign'], round(d['degree'], 1)) for p, d in self.transits.items()}
+        self.retrograde_effects = get_retrograde_effects(self.transits, lang)
+        self._tracks: Dict[tuple, BodyTrack] = {}
+        
+        sun = self.transits.get("Sun", {})
+        self.overview = (f"Today the Sun is at **{sun.get('sign', 'Aries')} {int(sun.get('degree', 0))}°**, "
+                         "illuminating your {} house.")
+        self.major = [p for p in MAJOR_TRANSITS if p in self.transits]
+    
+    def track(self, planet: str, window: float) -> BodyTrack:
+        """Samples of one transit body over ``window`` days either side of now
+        
+        Tracks are kept for the life of the sky. Windows come from orbs rounded
+        to 0.01 degree, so there are at most 801 per body (about 2,400 in all,
+        2.4 MB, after 20,000 charts).
+        """
+        key = (planet, window)
+        if key not in self._tracks:
+            self._tracks[key] = BodyTrack(TRANSIT_BODIES[planet], self.jd - window, self.jd + window)
+        return self._tracks[key]
+    
+    def perfections(self, planet: str, natal_longitudes: np.ndarray, angles: np.ndarray,
+                    orbs: np.ndarray) -> List[Optional[float]]:
+        """Exact moments nearest to now, as ``find_aspect_perfection`` for each aspect of one transit body"""
+        body = TRANSIT_BODIES[planet]
+        transit = self.transits[planet]['longitude']
+        plus, minus = (natal_longitudes + angles) % 360, (natal_longitudes - angles) % 360
+        targets = np.where(np.abs(_wrap180(transit - plus)) <= np.abs(_wrap180(transit - minus)), plus, minus)
+        windows = np.minimum((orbs + 1) / MEAN_SPEEDS.get(body, 1.0) * 1.5 + 1, MAX_WINDOW_DAYS).tolist()
+        by_window: Dict[float, List[int]] = {}
+        for k, window in enumerate(windows):
+            by_window.setdefault(window, []).append(k)
+        
+        best: List[Optional[float]] = [None] * len(targets)
+        for window, ks in by_window.items():
+            for jd, idx, _, _ in self.track(planet, window).crossings(targets[ks]):
+                k = ks[idx]
+                if best[k] is None or abs(jd - self.jd) < abs(best[k] - self.jd):
+                    best[k] = jd
+        return best
+
+
+# ============== Scoring ==============
+
+def score_chunk(sky: DailySky, natal_longitudes: np.ndarray, cusps: np.ndarray) -> Dict[str, np.ndarray]:
+    """Aspects, houses and natal Sabian symbols of n charts against the day's sky
+    
+    ``natal_longitudes`` (n, bodies) and ``cusps`` (n, 12). Hits are ordered as
+    ``calculate_transit_aspects`` orders them within each chart.
+    """
+    n = len(natal_longitudes)
+    hits = find_aspects(sky.longitudes, natal_longitudes, table=TRANSIT_ASPECT_TABLE, sort=False)
+    hits = hits[np.lexsort((np.round(hits['orb'], 2), hits['chart']))]
+    return {
+        'hits': hits,
+        'bounds': np.searchsorted(hits['chart'], np.arange(n + 1)),
+        'natal_houses': house_positions(natal_longitudes, cusps),
+        'transit_houses': house_positions(np.broadcast_to(sky.longitudes, (n, len(sky.names))), cusps),
+        'natal_sabian': sabian_symbols(natal_longitudes),
+    }
+
+
+def chunk_fortunes(
+    sky: DailySky,
+    ids: Sequence[Any],
+    body_names: Sequence[str],
+    natal_longitudes: np.ndarray,
+    cusps: np.ndarray,
+    exact_times: bool = True
+) -> Iterator[Tuple[Any, Dict]]:
+    """Yield (id, fortune) for one chunk of charts given as arrays"""
+    lang = sky.lang
+    natal_longitudes = np.asarray(natal_longitudes, dtype=float)
+    scores = score_chunk(sky, natal_longitudes, np.asarray(cusps, dtype=float))
+    hits, bounds = scores['hits'], scores['bounds'].tolist()
+    
+    # Python values once per chunk; the per-user loop below only indexes lists
+    natal_lons = natal_longitudes.tolist()
+    natal_houses = scores['natal_houses'].tolist()
+    transit_houses = scores['transit_houses'].tolist()
+    natal_sabian = scores['natal_sabian'].tolist()
+    i_col, j_col = hits['i'].tolist(), hits['j'].tolist()
+    aspect_col, orb_col = hits['aspect'].tolist(), hits['orb'].tolist()
+    
+    exact = {}
+    if exact_times:
+        top = np.concatenate([np.arange(bounds[c], min(bounds[c + 1], bounds[c] + TOP_ASPECTS))
+                              for c in range(len(ids))] or [np.empty(0, dtype=int)]).astype(int)
+        angles = TRANSIT_ASPECT_TABLE.angles[hits['aspect'][top]]
+        natal = natal_longitudes[hits['chart'][top], hits['j'][top]]
+        orbs = np.round(hits['orb'][top], 2)
+        for t, planet in enumerate(sky.names):
+            mine = np.nonzero(hits['i'][top] == t)[0]
+            if len(mine):
+                for row, jd in zip(top[mine].tolist(), sky.perfections(planet, natal[mine], angles[mine], orbs[mine])):
+                    exact[row] = jd
+    
+    sun_index = body_names.index("Sun") if "Sun" in body_names else None
+    t_index = {p: t for t, p in enumerate(sky.names)}
+    date, day_name = sky.now.strftime("%Y-%m-%d"), sky.now.strftime("%A")
+    
+    for c, user_id in enumerate(ids):
+        lons, houses = natal_lons[c], natal_houses[c]
+        
+        major_transits = []
+        for planet in sky.major:
+            p = sky.transits[planet]
+            house = transit_houses[c][t_index[planet]]
+            major_transits.append({
+                "planet": planet,
+                "sign": p['sign'],
+                "degree": f"{p['degree']:.1f}°",
+                "house": house,
+                "house_meaning": HOUSE_MEANINGS.get(house, {}).get(lang, "unknown area"),
+                "sabian": get_sabian_symbol(p['sign'], p['degree']),
+                "retrograde": p.get('retrograde', False)
+            })
+        
+        transit_aspects = []
+        for row in range(bounds[c], min(bounds[c + 1], bounds[c] + TOP_ASPECTS)):
+            t_planet, j, aspect = sky.names[i_col[row]], j_col[row], TRANSIT_ASPECT_TABLE.names[aspect_col[row]]
+            t_data, lon = sky.transits[t_planet], lons[j]
+            house = houses[j]
+            exact_jd = exact.get(row)
+            exact_time = jd_to_datetime(exact_jd).astimezone(sky.now.tzinfo) if exact_jd is not None else None
+            transit_aspects.append({
+                "transiting": t_planet,
+                "transit_sign": t_data['sign'],
+                "transit_degree": round(t_data['degree'], 1),
+                "transit_sabian": sky.sabian[t_planet],
+                "aspect": aspect,
+                "orb": round(orb_col[row], 2),
+                "exactness": 'exact' if orb_col[row] < 1 else 'close',
+                "exact_time": exact_time.strftime("%Y-%m-%d %H:%M") if exact_time else None,
+                "applying": exact_jd > sky.jd if exact_jd is not None else None,
+                "natal": body_names[j],
+                "natal_sign": SIGNS[int(lon / 30) % 12],
+                "natal_degree": round(lon % 30, 1),
+                "natal_sabian": natal_sabian[c][j],
+                "house_affected": house,
+                "house_meaning": HOUSE_MEANINGS.get(house, {}).get(lang, "unknown area"),
+                "interpretation": f"The transit of {t_planet} makes a {aspect} to your natal {body_names[j]}."
+            })
+        
+        activated = sorted({houses[j] for j in j_col[bounds[c]:bounds[c + 1]]})
+        natal_sign = SIGNS[int(lons[sun_index] / 30) % 12] if sun_index is not None else "Aries"
+        element = SIGN_ELEMENTS.get(natal_sign, "Fire")
+        sun_house = transit_houses[c][t_index["Sun"]]
+        
+        yield user_id, {
+            "date": date,
+            "day_name": day_name,
+            "title": "Daily Fortune" if lang == "en" else "ดวงประจำวัน",
+            "overview": sky.overview.format(HOUSE_MEANINGS.get(sun_house, {}).get(lang, 'chart')),
+            "major_transits": major_transits,
+            "transit_aspects": transit_aspects,
+            "retrograde_effects": list(sky.retrograde_effects),
+            "house_activations": [{"house": h, "meaning": HOUSE_MEANINGS.get(h, {}).get(lang, "")} for h in activated],
+            "lucky": {
+                "color": LUCKY_COLORS.get(element, {}).get(lang, "All colors"),
+                "number": LUCKY_NUMBERS.get(element, {}).get(lang, "All numbers"),
+                "day": day_name,
+                "element": element
+            },
+            "recommendations": get_daily_recommendations(transit_aspects, sky.retrograde_effects, lang)
+        }
+
+
+# ============== Front Ends ==============
+
+def _chart_arrays(chart: Mapping) -> Tuple[Tuple[str, ...], List[float], List[float]]:
+    """Body names, body longitudes and cusps 1-12 of a calculate_all result or Chart"""
+    if isinstance(chart, Chart):
+        return chart.body_names, chart.bodies[:, 0].tolist(), chart.cusps.tolist()
+    planets = chart['planets']
+    return (tuple(planets), [p['longitude'] for p in planets.values()],
+            [chart['houses'][h]['longitude'] for h in range(1, 13)])
+
+
+def fan_out(
+    subscribers: Iterable[Tuple[Any, Mapping]],
+    sky: DailySky,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    exact_times: bool = True
+) -> Iterator[Tuple[Any, Dict]]:
+    """Stream (id, daily fortune) for every (id, chart) pair, in input order
+    
+    Charts are scored ``chunk_size`` at a time; a chunk is cut early when the
+    body list changes, so charts with different body sets can be mixed.
+    """
+    subscribers = iter(subscribers)
+    while True:
+        block = list(islice(subscribers, chunk_size))
+        if not block:
+            return
+        
+        ids, lons, cusps, names = [], [], [], None
+        for user_id, chart in block:
+            body_names, body_lons, chart_cusps = _chart_arrays(chart)
+            if names is not None and body_names != names:
+                yield from chunk_fortunes(sky, ids, names, np.array(lons), np.array(cusps), exact_times)
+                ids, lons, cusps = [], [], []
+            names = body_names
+            ids.append(user_id)
+            lons.append(body_lons)
+            cusps.append(chart_cusps)
+        yield from chunk_fortunes(sky, ids, names, np.array(lons), np.array(cusps), exact_times)
+
+
+def fan_out_file(
+    path: str,
+    sky: DailySky,
+    id_column: Optional[str] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    exact_times: bool = True
+) -> Iterator[Tuple[Any, Dict]]:
+    """Stream (id, daily fortune) for every chart row of a ``core.ingest`` output file
+    
+    The id is ``id_column`` when given, else the ``row`` column.
+    """
+    from .ingest import read_rows
+    
+    rows = read_rows(path, chunk_size)
+    while True:
+        block = list(islice(rows, chunk_size))
+        if not block:
+            return
+        keys = [(name, name.lower().replace(' ', '_') + '_lon') for name in PLANETS]
+        body_names = [name for name, column in keys if column in block[0]]
+        columns = [column for name, column in keys if column in block[0]]
+        ids = [row[id_column or 'row'] for row in block]
+        lons = np.array([[row[c] for c in columns] for row in block], dtype=float)
+        cusps = np.array([[row[f'cusp{h}'] for h in range(1, 13)] for row in block], dtype=float)
+        yield from chunk_fortunes(sky, ids, body_names, lons, cusps, exact_times)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Write the daily fortune of every chart in an ingest output file")
+    parser.add_argument("input", help="charts file from core.ingest (.parquet or .csv)")
+    parser.add_argument("output", help="JSON lines file, one {id, fortune} object per chart")
+    parser.add_argument("--date", default=None, help="local reading time, ISO format (default: now)")
+    parser.add_argument("--timezone", default="Asia/Bangkok", help="zone of --date and of exact times")
+    parser.add_argument("--lang", default="en")
+    parser.add_argument("--id-column", default=None, help="id column of the charts file (default: row)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--exact-times", action=argparse.BooleanOptionalAction, default=True,
+                        help="solve exact perfection times (default; a few seconds of setup per day, "
+                             "then about 1.2 ms per chart)")
+    args = parser.parse_args()
+    
+    tz = pytz.timezone(args.timezone)
+    now = tz.localize(datetime.fromisoformat(args.date)) if args.date else datetime.now(tz)
+    start = time.perf_counter()
+    sky = DailySky(now, args.timezone, args.lang)
+    count = 0
+    with open(args.output, "w", encoding="utf-8") as f:
+        for user_id, fortune in fan_out_file(args.input, sky, args.id_column, args.chunk_size, args.exact_times):
+            f.write(json.dumps({"id": user_id, "fortune": fortune}, ensure_ascii=False) + "\n")
+            count += 1
+            if count % args.chunk_size == 0:
+                print(f"{count} fortunes", file=sys.stderr)
+    elapsed = time.perf_counter() - start
+    print(f"Done in {elapsed:.1f} s: {count} fortunes ({count / elapsed if elapsed else 0:.0f}/s)")
@@ -8,6 +8,13 @@ from datetime import datetime, timedelta
 import swisseph as swe
 import pytz
 
+from .aspect_engine import AspectTable, find_aspects
+from .house_lookup import HouseLookup
+from .month_sweep import MOON_PHASES, aspect_windows, get_month_sky
+from .transit_cache import transit_positions
+from .transit_solver import TRANSIT_BODIES, datetime_to_jd, find_aspect_perfection, jd_to_datetime
+from .year_calendar import EVENT_LABELS, get_year_calendar, natal_contacts
+
 
 # ============== Sabian Symbols ==============
 SABIAN_SYMBOLS = {
@@ -261,6 +268,16 @@ HOUSE_MEANINGS = {
 }
 
 
+# ============== Transit Aspects ==============
+TRANSIT_ASPECT_TABLE = AspectTable([
+    (0, "Conjunction", 8),
+    (60, "Sextile", 5),
+    (90, "Square", 7),
+    (120, "Trine", 7),
+    (180, "Opposition", 8)
+])
+
+
 # ============== Transit Functions ==============
 
 def get_current_transits_for_date(
@@ -268,11 +285,11 @@ def get_current_transits_for_date(
     hour: int = 12, minute: int = 0,
     timezone: str = "Asia/Bangkok"
 ) -> Dict:
-    """Calculate transits for a specific date"""
+    """Calculate transits for a specific local date and time"""
     tz = pytz.timezone(timezone)
-    dt = tz.localize(datetime(year, month, day, hour, minute))
+    dt = tz.localize(datetime(year, month, day, hour, minute)).astimezone(pytz.utc)
     jd = swe.julday(dt.year, dt.month, dt.day, dt.hour + dt.minute/60.0)
-    flags = swe.FLG_SWIEPH
+    flags = swe.FLG_SWIEPH | swe.FLG_SPEED
     
     planets = {}
     planet_ids = {
@@ -285,10 +302,7 @@ def get_current_transits_for_date(
     signs = ["Aries", "Taurus", "Gemini", "Cancer", "Leo", "Virgo",
              "Libra", "Scorpio", "Sagittarius", "Capricorn", "Aquarius", "Pisces"]
     
-    for name, planet_id in planet_ids.items():
-        result = swe.calc_ut(jd, planet_id, flags)
-        longitude = result[0][0]
-        speed = result[0][3]
+    for name, (longitude, speed) in transit_positions(jd, planet_ids, flags).items():
         sign_num = int(longitude / 30) % 12
         
         planets[name] = {
@@ -304,52 +318,39 @@ def get_current_transits_for_date(
 
 def calculate_transit_aspects(natal_planets: Dict, transit_planets: Dict) -> List[Dict]:
     """Calculate exact aspects between transiting planets and natal planets"""
-    aspects = []
-    
-    major_aspects = [
-        (0, "Conjunction", 8),
-        (60, "Sextile", 5),
-        (90, "Square", 7),
-        (120, "Trine", 7),
-        (180, "Opposition", 8)
-    ]
+    t_names = list(transit_planets)
+    n_names = list(natal_planets)
+    hits = find_aspects(
+        [transit_planets[p]['longitude'] for p in t_names],
+        [natal_planets[p]['longitude'] for p in n_names],
+        table=TRANSIT_ASPECT_TABLE,
+        sort=False
+    )
     
-    for t_planet, t_data in transit_planets.items():
-        for n_planet, n_data in natal_planets.items():
-            diff = abs(t_data['longitude'] - n_data['longitude'])
-            if diff > 180:
-                diff = 360 - diff
-            
-            for deg, name, orb in major_aspects:
-                if abs(diff - deg) <= orb:
-                    aspects.append({
-                        'transiting': t_planet,
-                        'natal': n_planet,
-                        'type': name,
-                        'orb': round(abs(diff - deg), 2),
-                        'exactness': 'exact' if abs(diff - deg) < 1 else 'close',
-                        'transit_sign': t_data['sign'],
-                        'natal_sign': n_data['sign'],
-                        'transit_degree': round(t_data['degree'], 1),
-                        'natal_degree': round(n_data['degree'], 1)
-                    })
+    aspects = []
+    for i, j, k, orb in zip(hits['i'].tolist(), hits['j'].tolist(),
+                            hits['aspect'].tolist(), hits['orb'].tolist()):
+        t_data = transit_planets[t_names[i]]
+        n_data = natal_planets[n_names[j]]
+        aspects.append({
+            'transiting': t_names[i],
+            'natal': n_names[j],
+            'type': TRANSIT_ASPECT_TABLE.names[k],
+            'orb': round(orb, 2),
+            'exactness': 'exact' if orb < 1 else 'close',
+            'transit_sign': t_data['sign'],
+            'natal_sign': n_data['sign'],
+            'transit_degree': round(t_data['degree'], 1),
+            'natal_degree': round(n_data['degree'], 1)
+        })
     
     aspects.sort(key=lambda x: x['orb'])
     return aspects
 
 
 def get_house_position(longitude: float, houses: Dict) -> int:
-    """Determine which house a planet is in"""
-    cusps = sorted([(h, houses[h]['longitude']) for h in houses], key=lambda x: x[1])
-    
-    for i in range(len(cusps) - 1):
-        if cusps[i][1] <= longitude < cusps[i+1][1]:
-            return cusps[i][0]
-    
-    if longitude >= cusps[-1][1] or longitude < cusps[0][1]:
-        return cusps[-1][0]
-    
-    return 1
+    """Determine which house a planet is in (build a ``HouseLookup`` for repeated lookups)"""
+    return HouseLookup.from_houses(houses).house(longitude)
 
 
 def get_sabian_symbol(sign: str, degree: float) -> str:
@@ -367,6 +368,42 @@ def get_sabian_symbol(sign: str, degree: float) -> str:
     return ""
 
 
+# ============== Daily Fortune Parts ==============
+RETROGRADE_MEANINGS = {
+    "Mercury": {"en": "Time for reflection and review.", "th": "เวลาสำหรับการไตร่ตรองและทบทวน"},
+    "Venus": {"en": "Reevaluating relationships and values.", "th": "การประเมินความสัมพันธ์และคุณค่าใหม่"},
+    "Mars": {"en": "Energy directed inward.", "th": "พลังถูกชี้นำเข้าสู่ภายใน"},
+}
+
+
+def get_retrograde_effects(transits: Dict, lang: str = "en") -> List[Dict]:
+    """Meanings of the retrograde transiting planets that have one"""
+    effects = []
+    for planet, data in transits.items():
+        if data.get('retrograde', False) and planet in RETROGRADE_MEANINGS:
+            effects.append({
+                "planet": planet,
+                "meaning": RETROGRADE_MEANINGS.get(planet, {}).get(lang, "")
+            })
+    return effects
+
+
+def get_daily_recommendations(transit_aspects: List[Dict], retrograde_effects: List[Dict], lang: str = "en") -> List[str]:
+    """Advice from the three closest transit aspects and the retrograde planets"""
+    recommendations = []
+    
+    if any(a['aspect'] == 'Square' for a in transit_aspects[:3]):
+        recommendations.append("Challenge aspect detected: Use tension as fuel for growth." if lang == "en" else "ตรวจพบมุมท้าทาย: ใช้ความตึงเครียดเป็นเชื้อเพลิงสำหรับการเติบโต")
+    
+    if any(a['aspect'] == 'Trine' for a in transit_aspects[:3]):
+        recommendations.append("Harmonious aspect detected: Things flow easily today." if lang == "en" else "ตรวจพบมุมกลมกลืน: สิ่งต่างๆ ไหลลื่นวันนี้")
+    
+    if retrograde_effects:
+        recommendations.append("Retrograde planets indicate internal focus." if lang == "en" else "ดาวเคราห์ถอยหลังบ่งชี้ถึงการมุ่งเน้นภายใน")
+    
+    return recommendations
+
+
 # ============== Main Generation Functions ==============
 
 def generate_detailed_daily_fortune(
@@ -374,17 +411,25 @@ def generate_detailed_daily_fortune(
     natal_houses: Dict,
     natal_ascendant: Dict,
     timezone: str = "Asia/Bangkok",
-    lang: str = "en"
+    lang: str = "en",
+    now: Optional[datetime] = None
 ) -> Dict:
-    """Generate highly detailed daily fortune based on current transits"""
+    """Generate highly detailed daily fortune based on current transits
+    
+    ``now`` (aware, in ``timezone``) fixes the moment of the reading; by default it is
+    the current time in ``timezone``.
+    """
     
-    now = datetime.now(pytz.timezone(timezone))
+    if now is None:
+        now = datetime.now(pytz.timezone(timezone))
     today_transits = get_current_transits_for_date(
         now.year, now.month, now.day,
         now.hour, now.minute, timezone
     )
     
     aspects = calculate_transit_aspects(natal_planets, today_transits)
+    now_jd = datetime_to_jd(now)
+    natal_house = HouseLookup.from_houses(natal_houses).house
     
     fortune = {
         "date": now.strftime("%Y-%m-%d"),
@@ -408,13 +453,13 @@ def generate_detailed_daily_fortune(
     sun_transit = today_transits.get("Sun", {})
     sun_sign = sun_transit.get("sign", "Aries")
     sun_degree = sun_transit.get("degree", 0)
-    fortune["overview"] = f"Today the Sun is at **{sun_sign} {int(sun_degree)}°**, illuminating your {HOUSE_MEANINGS.get(get_house_position(sun_transit['longitude'], natal_houses), {}).get(lang, 'chart')} house."
+    fortune["overview"] = f"Today the Sun is at **{sun_sign} {int(sun_degree)}°**, illuminating your {HOUSE_MEANINGS.get(natal_house(sun_transit['longitude']), {}).get(lang, 'chart')} house."
     
     # Major transits
     for planet in ["Sun", "Moon", "Mercury", "Venus", "Mars", "Jupiter", "Saturn"]:
         if planet in today_transits:
             p = today_transits[planet]
-            house = get_house_position(p['longitude'], natal_houses)
+            house = natal_house(p['longitude'])
             
             sabian = get_sabian_symbol(p['sign'], p['degree'])
             
@@ -434,11 +479,22 @@ def generate_detailed_daily_fortune(
         n_planet = asp['natal']
         
         n_long = natal_planets.get(n_planet, {}).get('longitude', 0)
-        house = get_house_position(n_long, natal_houses)
+        house = natal_house(n_long)
         
         transit_sabian = get_sabian_symbol(asp['transit_sign'], asp['transit_degree'])
         natal_sabian = get_sabian_symbol(asp['natal_sign'], asp['natal_degree'])
         
+        # Exact perfection moment (local time) and whether it is still ahead
+        exact_jd = find_aspect_perfection(
+            TRANSIT_BODIES[t_planet],
+            today_transits[t_planet]['longitude'],
+            n_long,
+            TRANSIT_ASPECT_TABLE.raw_angles[TRANSIT_ASPECT_TABLE.names.index(asp['type'])],
+            asp['orb'],
+            now_jd
+        )
+        exact_time = jd_to_datetime(exact_jd).astimezone(now.tzinfo) if exact_jd is not None else None
+        
         fortune["transit_aspects"].append({
             "transiting": t_planet,
             "transit_sign": asp['transit_sign'],
@@ -447,6 +503,8 @@ def generate_detailed_daily_fortune(
             "aspect": asp['type'],
             "orb": asp['orb'],
             "exactness": asp['exactness'],
+            "exact_time": exact_time.strftime("%Y-%m-%d %H:%M") if exact_time else None,
+            "applying": exact_jd > now_jd if exact_jd is not None else None,
             "natal": n_planet,
             "natal_sign": asp['natal_sign'],
             "natal_degree": asp['natal_degree'],
@@ -457,25 +515,14 @@ def generate_detailed_daily_fortune(
         })
     
     # Retrograde effects
-    RETROGRADE_MEANINGS = {
-        "Mercury": {"en": "Time for reflection and review.", "th": "เวลาสำหรับการไตร่ตรองและทบทวน"},
-        "Venus": {"en": "Reevaluating relationships and values.", "th": "การประเมินความสัมพันธ์และคุณค่าใหม่"},
-        "Mars": {"en": "Energy directed inward.", "th": "พลังถูกชี้นำเข้าสู่ภายใน"},
-    }
-    
-    for planet, data in today_transits.items():
-        if data.get('retrograde', False) and planet in RETROGRADE_MEANINGS:
-            fortune["retrograde_effects"].append({
-                "planet": planet,
-                "meaning": RETROGRADE_MEANINGS.get(planet, {}).get(lang, "")
-            })
+    fortune["retrograde_effects"] = get_retrograde_effects(today_transits, lang)
     
     # House activations
     activated_houses = set()
     for asp in aspects:
         if asp['natal'] in natal_planets:
             n_long = natal_planets[asp['natal']]['longitude']
-            house = get_house_position(n_long, natal_houses)
+            house = natal_house(n_long)
             activated_houses.add(house)
     
     for house in sorted(activated_houses):
@@ -493,18 +540,7 @@ def generate_detailed_daily_fortune(
     }
     
     # Recommendations
-    recommendations = []
-    
-    if any(a['aspect'] == 'Square' for a in fortune['transit_aspects'][:3]):
-        recommendations.append("Challenge aspect detected: Use tension as fuel for growth." if lang == "en" else "ตรวจพบมุมท้าทาย: ใช้ความตึงเครียดเป็นเชื้อเพลิงสำหรับการเติบโต")
-    
-    if any(a['aspect'] == 'Trine' for a in fortune['transit_aspects'][:3]):
-        recommendations.append("Harmonious aspect detected: Things flow easily today." if lang == "en" else "ตรวจพบมุมกลมกลืน: สิ่งต่างๆ ไหลลื่นวันนี้")
-    
-    if fortune['retrograde_effects']:
-        recommendations.append("Retrograde planets indicate internal focus." if lang == "en" else "ดาวเคราห์ถอยหลังบ่งชี้ถึงการมุ่งเน้นภายใน")
-    
-    fortune["recommendations"] = recommendations
+    fortune["recommendations"] = get_daily_recommendations(fortune["transit_aspects"], fortune["retrograde_effects"], lang)
     
     return fortune
 
@@ -517,26 +553,30 @@ def generate_monthly_outlook(
     timezone: str = "Asia/Bangkok",
     lang: str = "en"
 ) -> Dict:
-    """Generate monthly outlook based on planetary movements"""
+    """Generate monthly outlook based on planetary movements
     
-    tz = pytz.timezone(timezone)
-    first_day = tz.localize(datetime(year, month, 1))
+    Built from a sweep of the whole month (``month_sweep``): sign themes at
+    mid-month, every transit aspect window with its exact date, ingresses and
+    Moon phases. The month's transit grid is shared by every chart.
+    """
     
-    mid_transits = get_current_transits_for_date(year, month, 15, 12, 0, timezone)
+    sky = get_month_sky(year, month, timezone)
     
     outlook = {
-        "month": first_day.strftime("%B %Y"),
+        "month": datetime(year, month, 1).strftime("%B %Y"),
         "title": "Monthly Outlook" if lang == "en" else "ดวงประจำเดือน",
         "themes": [],
         "highlights": [],
+        "aspect_windows": [],
+        "ingresses": [],
+        "moon_phases": [],
         "advice": ""
     }
     
     # Key transits for the month
     for planet in ["Sun", "Mercury", "Venus", "Mars", "Jupiter", "Saturn"]:
-        if planet in mid_transits:
-            p = mid_transits[planet]
-            sign = p["sign"]
+        if planet in sky.names:
+            sign = sky.sign(planet, sky.mid)
             element = SIGN_ELEMENTS.get(sign, "Fire")
             
             outlook["themes"].append({
@@ -546,17 +586,47 @@ def generate_monthly_outlook(
                 "meaning": TRANSIT_MEANINGS.get(planet, {}).get(lang, "")
             })
     
-    # Major aspects
-    aspects = calculate_transit_aspects(natal_planets, mid_transits)
-    for asp in aspects[:3]:
+    # Aspect windows over the month
+    windows = aspect_windows(sky, natal_planets, TRANSIT_ASPECT_TABLE)
+    for w in windows:
+        outlook["aspect_windows"].append({
+            "transiting": w['transiting'],
+            "natal": w['natal'],
+            "aspect": w['type'],
+            "start": sky.date(w['start']),
+            "end": sky.date(w['end']),
+            "peak": sky.time(w['peak']),
+            "orb": round(w['orb'], 2),
+            "exact": w['exact']
+        })
+    
+    # Highlights: aspects that perfect this month, slow (long) transits first
+    ranked = sorted(windows, key=lambda w: (not w['exact'], round(w['orb'], 2), w['start'] - w['end']))
+    for w in ranked[:3]:
         outlook["highlights"].append({
-            "aspect": f"{asp['transiting']} {asp['type']} {asp['natal']}",
-            "description": f"{asp['transiting']} in {asp['transit_sign']} makes {asp['type']} to natal {asp['natal']}"
+            "aspect": f"{w['transiting']} {w['type']} {w['natal']}",
+            "description": f"{w['transiting']} in {sky.sign(w['transiting'], sky.index(w['peak']))} makes {w['type']} to natal {w['natal']}",
+            "peak": sky.time(w['peak'])
+        })
+    
+    for e in sky.ingresses:
+        outlook["ingresses"].append({
+            "planet": e['planet'],
+            "sign": e['sign'],
+            "date": e['time'],
+            "retrograde": e['retrograde']
+        })
+    
+    for e in sky.phases:
+        outlook["moon_phases"].append({
+            "phase": MOON_PHASES[e['phase']].get(lang, MOON_PHASES[e['phase']]["en"]),
+            "sign": e['sign'],
+            "date": e['time']
         })
     
     # General advice
-    jupiter_sign = mid_transits.get("Jupiter", {}).get("sign", "Sagittarius")
-    saturn_sign = mid_transits.get("Saturn", {}).get("sign", "Capricorn")
+    jupiter_sign = sky.sign("Jupiter", sky.mid)
+    saturn_sign = sky.sign("Saturn", sky.mid)
     
     if lang == "en":
         outlook["advice"] = f"This month, focus on growth ({jupiter_sign}) while maintaining structure ({saturn_sign})."
@@ -573,14 +643,30 @@ def generate_yearly_outlook(
     timezone: str = "Asia/Bangkok",
     lang: str = "en"
 ) -> Dict:
-    """Generate yearly outlook based on major transits (Jupiter & Saturn)"""
+    """Generate yearly outlook from the annual event calendar
+    
+    The year's ingresses, stations, lunations and eclipses are computed once
+    for everybody (``year_calendar``); a chart only looks up which of them
+    touch its natal points, so no ephemeris calls are made per chart.
+    """
+    
+    calendar = get_year_calendar(year)
+    tz = pytz.timezone(timezone)
+    
+    def local_jd(year: int, month: int, day: int, hour: int = 0) -> float:
+        return datetime_to_jd(tz.localize(datetime(year, month, day, hour)))
+    
+    def local_time(jd: float) -> str:
+        return jd_to_datetime(jd).astimezone(tz).strftime("%Y-%m-%d %H:%M")
     
     outlook = {
         "year": str(year),
         "title": "Yearly Outlook" if lang == "en" else "ดวงประจำปี",
         "overview": "",
         "quarters": [],
-        "major_transits": []
+        "major_transits": [],
+        "key_events": [],
+        "eclipses": []
     }
     
     quarters = [
@@ -591,28 +677,67 @@ def generate_yearly_outlook(
     ]
     
     for q_year, q_month, q_name in quarters:
-        transits = get_current_transits_for_date(q_year, q_month, 15, 12, 0, timezone)
-        
-        jupiter = transits.get("Jupiter", {})
-        saturn = transits.get("Saturn", {})
+        jd = local_jd(q_year, q_month, 15, 12)
+        jupiter = calendar.sign_at("Jupiter", jd)
+        saturn = calendar.sign_at("Saturn", jd)
         
         outlook["quarters"].append({
             "quarter": q_name,
             "month": f"{q_month}/{q_year % 100}",
-            "jupiter": jupiter.get("sign", "Unknown"),
-            "saturn": saturn.get("sign", "Unknown"),
-            "theme": f"Jupiter in {jupiter.get('sign')}, Saturn in {saturn.get('sign')}" if lang == "en" else f"ดาวพฤหัสใน{jupiter.get('sign')} ดาวเสาร์ใน{saturn.get('sign')}"
+            "jupiter": jupiter,
+            "saturn": saturn,
+            "theme": f"Jupiter in {jupiter}, Saturn in {saturn}" if lang == "en" else f"ดาวพฤหัสใน{jupiter} ดาวเสาร์ใน{saturn}"
         })
     
-    year_mid = get_current_transits_for_date(year, 6, 15, 12, 0, timezone)
-    jupiter_sign = year_mid.get("Jupiter", {}).get("sign", "Sagittarius")
-    saturn_sign = year_mid.get("Saturn", {}).get("sign", "Capricorn")
+    year_mid = local_jd(year, 6, 15, 12)
+    jupiter_sign = calendar.sign_at("Jupiter", year_mid)
+    saturn_sign = calendar.sign_at("Saturn", year_mid)
     
     outlook["major_transits"] = [
         {"planet": "Jupiter", "sign": jupiter_sign, "meaning": "Growth and expansion opportunities"},
         {"planet": "Saturn", "sign": saturn_sign, "meaning": "Lessons and structure building"}
     ]
     
+    # The local calendar year's events, and those that touch the natal chart
+    events = calendar.between(local_jd(year, 1, 1), local_jd(year + 1, 1, 1))
+    natal_points = {name: data['longitude'] for name, data in natal_planets.items()}
+    if 'longitude' in natal_ascendant:
+        natal_points["Ascendant"] = natal_ascendant['longitude']
+    
+    for c in natal_contacts(events, natal_points):
+        label = EVENT_LABELS[c['detail'] if c['kind'] == 'station' else c['kind']].get(lang, "")
+        if c['kind'] in ('ingress', 'station'):
+            event = f"{c['planet']} {label} {c['sign']}" if c['kind'] == 'ingress' else f"{c['planet']} {label} ({c['sign']})"
+        else:
+            event = f"{label} ({c['sign']})"
+        if 'house' in c and c['detail'] == 'retrograde':
+            description = f"Moves back into your house {c['house']}" if lang == "en" else f"ถอยกลับเข้าภพที่ {c['house']}"
+        elif 'house' in c:
+            description = f"Moves through your house {c['house']}" if lang == "en" else f"โคจรผ่านภพที่ {c['house']}"
+        else:
+            description = f"{c['aspect']} natal {c['natal']}" if lang == "en" else f"{c['aspect']} กับ{c['natal']}ในดวงกำเนิด"
+        
+        outlook["key_events"].append({
+            "date": local_time(c['jd']),
+            "event": event,
+            "planet": c['planet'],
+            "sign": c['sign'],
+            "natal": c.get('natal', ""),
+            "aspect": c.get('aspect', ""),
+            "orb": round(c['orb'], 2) if 'orb' in c else None,
+            "house": c.get('house'),
+            "description": description
+        })
+    
+    for jd, kind, _, _, sign, detail in events.tolist():
+        if kind in ('solar_eclipse', 'lunar_eclipse'):
+            outlook["eclipses"].append({
+                "date": local_time(jd),
+                "eclipse": EVENT_LABELS[kind].get(lang, ""),
+                "type": detail,
+                "sign": sign
+            })
+    
     if lang == "en":
         outlook["overview"] = f"This year, Jupiter transits **{jupiter_sign}** bringing growth and opportunities, while Saturn in **{saturn_sign}** emphasizes structure and responsibility."
     else:
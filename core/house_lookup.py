@@ -0,0 +1,52 @@
+"""
+House lookup
+Which house a longitude falls in, answered by bisection over a chart's cusps rotated to the first house
+
+House 1 rarely starts at 0° Aries, so cusps sorted by raw longitude put the
+houses out of order and the house that straddles 0° needs special casing.
+Measured from the first cusp instead, the cusps are one ascending array:
+
+    offsets[h - 1] = (cusp[h] - cusp[1]) % 360      0 = offsets[0] < offsets[1] < ... < 360
+
+and a longitude ``lon`` is in house ``bisect_right(offsets, (lon - cusp[1]) % 360)``.
+``HouseLookup`` builds that array once per chart; ``house_positions`` does the
+same for a block of charts at once.
+"""
+
+from bisect import bisect_right
+from typing import List, Mapping, Sequence
+
+import numpy as np
+
+
+class HouseLookup:
+    """Rotated cusp array of one chart, for repeated house lookups"""
+    
+    __slots__ = ('first', 'offsets')
+    
+    def __init__(self, cusps: Sequence[float]):
+        """Build from the 12 cusp longitudes in house order (1-12)"""
+        self.first = float(cusps[0])
+        self.offsets: List[float] = [(c - self.first) % 360 for c in cusps]
+    
+    @classmethod
+    def from_houses(cls, houses: Mapping) -> "HouseLookup":
+        """Build from a ``calculate_all`` houses dict ({1: {'longitude': ...}, ...})"""
+        return cls([houses[h]['longitude'] for h in range(1, 13)])
+    
+    def house(self, longitude: float) -> int:
+        """House (1-12) of one longitude"""
+        return bisect_right(self.offsets, (longitude - self.first) % 360)
+    
+    def houses(self, longitudes) -> np.ndarray:
+        """Houses (1-12) of an array of longitudes"""
+        rotated = (np.asarray(longitudes, dtype=float) - self.first) % 360
+        return np.searchsorted(self.offsets, rotated, side='right')
+
+
+def house_positions(longitudes: np.ndarray, cusps: np.ndarray) -> np.ndarray:
+    """Houses (1-12) of ``longitudes`` (charts, k) against ``cusps`` (charts, 12), one chart per row"""
+    first = cusps[:, :1]
+    offsets = (cusps - first) % 360
+    rotated = (longitudes - first) % 360
+    return (offsets[:, None, :] <= rotated[:, :, None]).sum(axis=2)
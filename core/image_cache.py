@@ -0,0 +1,178 @@
+"""
+Rendered chart image cache
+Finished wheel images (PNG bytes or SVG text) keyed by a fingerprint of what was drawn, so reruns skip rendering
+
+The key hashes the renderer, every longitude that ends up on the wheel
+(rounded to ``LONGITUDE_DECIMALS``, far below a pixel), house cusps,
+aspects, the display options and the image size. Anything else in the
+chart dicts (signs, speeds, text) cannot change the picture and is ignored.
+
+Tiers:
+    memory   LRU bounded by total bytes, not entry count (a PNG is ~300 KB, an SVG ~12 KB)
+    disk     optional SQLite file shared by processes on a host
+
+The shared instance reads its SQLite path from ``$SWISS_HOROSCOPE_IMAGE_CACHE``
+(unset = memory only) and its memory budget in MB from
+``$SWISS_HOROSCOPE_IMAGE_CACHE_MB``.
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+from typing import Callable, Dict, Optional, Union
+
+
+LONGITUDE_DECIMALS = 3
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# Bump when a renderer draws differently, so old images are not served
+RENDER_VERSION = '1'
+
+ENV_PATH = 'SWISS_HOROSCOPE_IMAGE_CACHE'
+ENV_MAX_MB = 'SWISS_HOROSCOPE_IMAGE_CACHE_MB'
+
+Image = Union[bytes, str]
+
+
+def _fingerprint(value) -> str:
+    """Canonical text for chart data: longitudes only where a dict has one"""
+    if isinstance(value, Mapping):
+        if 'longitude' in value:
+            return f"{value['longitude']:.{LONGITUDE_DECIMALS}f}"
+        items = sorted(value.items(), key=lambda item: str(item[0]))
+        return '{' + ','.join(f"{key}:{_fingerprint(item)}" for key, item in items) + '}'
+    if isinstance(value, (list, tuple)):
+        return '[' + ','.join(_fingerprint(item) for item in value) + ']'
+    if isinstance(value, float):
+        return f"{value:.{LONGITUDE_DECIMALS}f}"
+    return repr(value)
+
+
+def image_key(kind: str, renderer: str, data: Dict, options: Optional[Dict] = None, size=None) -> str:
+    """Cache key for one rendered wheel
+    
+    ``data`` holds the chart inputs of the drawing function (planets, houses,
+    ascendant, aspects, names ...), ``options`` its display flags.
+    """
+    text = '|'.join([RENDER_VERSION, kind, renderer, _fingerprint(data), _fingerprint(options or {}), repr(size)])
+    return hashlib.sha1(text.encode()).hexdigest()
+
+
+class ImageCache:
+    """Two-tier (byte-bounded memory LRU + optional SQLite) store of rendered images"""
+    
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES, path: Optional[str] = None):
+        """Keep up to ``max_bytes`` of images in memory; ``path`` enables the SQLite tier"""
+        self.max_bytes = max_bytes
+        self.path = path
+        self._memory = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._db = None
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        
+        if path:
+            directory = os.path.dirname(os.path.abspath(path))
+            os.makedirs(directory, exist_ok=True)
+            self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("CREATE TABLE IF NOT EXISTS images (key TEXT PRIMARY KEY, data BLOB NOT NULL)")
+    
+    def get(self, key: str) -> Optional[Image]:
+        """Cached image or None"""
+        with self._lock:
+            image = self._memory.get(key)
+            if image is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return image
+            
+            if self._db is not None:
+                row = self._db.execute("SELECT data FROM images WHERE key = ?", (key,)).fetchone()
+                if row is not None:
+                    image = row[0] if isinstance(row[0], str) else bytes(row[0])
+                    self._remember(key, image)
+                    self.disk_hits += 1
+                    return image
+            
+            self.misses += 1
+            return None
+    
+    def put(self, key: str, image: Image):
+        """Store an image in every tier"""
+        with self._lock:
+            self._remember(key, image)
+            if self._db is not None:
+                self._db.execute("INSERT OR REPLACE INTO images (key, data) VALUES (?, ?)", (key, image))
+    
+    def get_or_render(self, key: str, render: Callable[[], Image]) -> Image:
+        """Cached image, or ``render()`` stored under ``key``"""
+        image = self.get(key)
+        if image is None:
+            image = render()
+            self.put(key, image)
+        return image
+    
+    def _remember(self, key: str, image: Image):
+        """Insert into the memory tier, evicting least recently used images past the byte budget"""
+        old = self._memory.pop(key, None)
+        if old is not None:
+            self._bytes -= len(old)
+        if len(image) > self.max_bytes:
+            return
+        self._memory[key] = image
+        self._bytes += len(image)
+        while self._bytes > self.max_bytes:
+            _, evicted = self._memory.popitem(last=False)
+            self._bytes -= len(evicted)
+            self.evictions += 1
+    
+    def clear(self):
+        """Drop every entry (both tiers) and reset the counters"""
+        with self._lock:
+            self._memory.clear()
+            self._bytes = 0
+            if self._db is not None:
+                self._db.execute("DELETE FROM images")
+            self.hits = self.disk_hits = self.misses = self.evictions = 0
+    
+    def stats(self) -> Dict:
+        """Hit/miss counters and memory footprint"""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'disk_hits': self.disk_hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'size': len(self._memory),
+                'bytes': self._bytes
+            }
+    
+    def close(self):
+        """Close the SQLite connection"""
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+
+# ============== Shared Instance ==============
+
+_shared_cache = None
+_shared_lock = threading.Lock()
+
+
+def get_image_cache() -> ImageCache:
+    """Process-wide image cache (SQLite tier from $SWISS_HOROSCOPE_IMAGE_CACHE, if set)"""
+    global _shared_cache
+    if _shared_cache is None:
+        with _shared_lock:
+            if _shared_cache is None:
+                max_mb = float(os.environ.get(ENV_MAX_MB, DEFAULT_MAX_BYTES / (1024 * 1024)))
+                _shared_cache = ImageCache(int(max_mb * 1024 * 1024), os.environ.get(ENV_PATH) or None)
+    return _shared_cache
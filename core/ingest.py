@@ -0,0 +1,350 @@
+"""
+Streaming bulk ingestion of birth records
+Reads birth rows lazily, computes charts chunk by chunk with calculate_many and appends them to a columnar file
+
+Memory stays bounded by ``chunk_rows`` however large the input is: rows are
+read one chunk at a time, charted in a single ``calculate_many`` call and
+written out before the next chunk is read.
+
+Input (CSV, or Parquet with pyarrow) has one birth per row, either as
+separate columns ``year, month, day, hour, minute`` or one ISO ``datetime``
+column (local birth time), plus ``latitude``, ``longitude`` and an optional
+``timezone``. ``column_map`` renames partner columns to these names.
+
+Output is Parquet (one row group per chunk, needs pyarrow) or CSV, picked by
+file extension, with one row per valid birth:
+
+    row, [id], jd, <planet>_lon / _speed / _sign / _retro for each planet,
+    asc_lon, asc_sign, mc_lon, mc_sign, cusp1 ... cusp12
+
+Rows that cannot be parsed (missing or non-numeric fields, impossible dates,
+coordinates out of range or at the poles, unknown time zones) or charted
+(house cusps undefined near the poles) are skipped and listed with the
+reason in an optional errors CSV.
+
+    python -m core.ingest births.csv charts.parquet --errors bad_rows.csv --id-column id
+"""
+
+import argparse
+import csv
+import sys
+import time
+from datetime import datetime
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pytz
+import swisseph as swe
+
+from .swiss_eph import SwissEphemerisCalculator
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Parquet support is optional
+    pa = None
+    pq = None
+
+
+DEFAULT_CHUNK_ROWS = 5000
+DATE_FIELDS = ('year', 'month', 'day', 'hour', 'minute')
+
+
+class IngestStats:
+    """Running counters of one ingestion"""
+    
+    def __init__(self):
+        self.rows_read = 0
+        self.rows_written = 0
+        self.error_rows = 0
+        self.chunks = 0
+        self.started = time.perf_counter()
+    
+    @property
+    def elapsed(self) -> float:
+        """Seconds since the ingestion started"""
+        return time.perf_counter() - self.started
+    
+    @property
+    def rows_per_second(self) -> float:
+        """Input rows processed per second"""
+        return self.rows_read / self.elapsed if self.elapsed else 0.0
+    
+    def as_dict(self) -> Dict:
+        """Counters as a plain dict"""
+        return {
+            'rows_read': self.rows_read,
+            'rows_written': self.rows_written,
+            'error_rows': self.error_rows,
+            'chunks': self.chunks,
+            'elapsed_s': self.elapsed,
+            'rows_per_s': self.rows_per_second
+        }
+    
+    def __str__(self) -> str:
+        return (f"rows {self.rows_read:,} | written {self.rows_written:,} | errors {self.error_rows:,} | "
+                f"{self.rows_per_second:,.0f} rows/s")
+
+
+# ============== Reading ==============
+
+def read_rows(path: str, batch_rows: int = DEFAULT_CHUNK_ROWS) -> Iterator[Dict]:
+    """Lazily yield input rows as dicts (CSV, or Parquet with pyarrow)"""
+    if path.endswith('.parquet'):
+        if pq is None:
+            raise ImportError("Reading Parquet needs pyarrow (pip install pyarrow)")
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=batch_rows):
+            yield from batch.to_pylist()
+    else:
+        with open(path, newline='', encoding='utf-8') as f:
+            yield from csv.DictReader(f)
+
+
+_tz_cache: Dict[str, bool] = {}
+
+
+def _known_timezone(name: str) -> bool:
+    """True if pytz knows the zone (memoized)"""
+    if name not in _tz_cache:
+        try:
+            pytz.timezone(name)
+            _tz_cache[name] = True
+        except pytz.UnknownTimeZoneError:
+            _tz_cache[name] = False
+    return _tz_cache[name]
+
+
+def parse_row(row: Dict, default_timezone: str = "Asia/Bangkok") -> Tuple[datetime, float, float, str]:
+    """(local datetime, latitude, longitude, timezone) of one row; ValueError if invalid"""
+    def field(name):
+        value = row.get(name)
+        if value is None or value == '':
+            raise ValueError(f"missing {name}")
+        return value
+    
+    try:
+        if row.get('datetime') not in (None, ''):
+            # An explicit UTC offset wins over the timezone column
+            dt = row['datetime']
+            if not isinstance(dt, datetime):
+                dt = datetime.fromisoformat(str(dt))
+        else:
+            dt = datetime(*(int(float(field(name))) for name in DATE_FIELDS))
+        latitude = float(field('latitude'))
+        longitude = float(field('longitude'))
+    except (TypeError, OverflowError) as e:
+        raise ValueError(str(e)) from None
+    
+    # House cusps are undefined at the poles
+    if not -90 < latitude < 90:
+        raise ValueError(f"latitude {latitude} out of range")
+    if not -180 <= longitude <= 180:
+        raise ValueError(f"longitude {longitude} out of range")
+    
+    timezone = row.get('timezone') or default_timezone
+    if not _known_timezone(timezone):
+        raise ValueError(f"unknown timezone {timezone}")
+    return dt, latitude, longitude, timezone
+
+
+# ============== Writing ==============
+
+def chart_columns(result: Dict) -> Dict[str, np.ndarray]:
+    """Flatten a calculate_many result into named columns"""
+    columns = {'jd': result['jd']}
+    for name, data in result['planets'].items():
+        key = name.lower().replace(' ', '_')
+        columns[f'{key}_lon'] = data['longitude']
+        columns[f'{key}_speed'] = data['speed']
+        columns[f'{key}_sign'] = data['sign_num']
+        columns[f'{key}_retro'] = data['retrograde']
+    columns['asc_lon'] = result['ascendant']['longitude']
+    columns['asc_sign'] = result['ascendant']['sign_num']
+    columns['mc_lon'] = result['midheaven']['longitude']
+    columns['mc_sign'] = result['midheaven']['sign_num']
+    for h in range(12):
+        columns[f'cusp{h + 1}'] = result['cusps'][:, h]
+    return columns
+
+
+class ParquetSink:
+    """Appends each chunk as one Parquet row group"""
+    
+    def __init__(self, path: str):
+        if pq is None:
+            raise ImportError("Writing Parquet needs pyarrow (pip install pyarrow); use a .csv output instead")
+        self.path = path
+        self._writer = None
+    
+    def write(self, columns: Dict[str, np.ndarray]):
+        """Append one chunk"""
+        table = pa.table({name: pa.array(values) for name, values in columns.items()})
+        if self._writer is None:
+            self._writer = pq.ParquetWriter(self.path, table.schema)
+        self._writer.write_table(table)
+    
+    def close(self):
+        """Finish the file"""
+        if self._writer is not None:
+            self._writer.close()
+
+
+class CsvSink:
+    """Appends each chunk as CSV rows"""
+    
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, 'w', newline='', encoding='utf-8')
+        self._writer = csv.writer(self._file)
+        self._header = False
+    
+    def write(self, columns: Dict[str, np.ndarray]):
+        """Append one chunk"""
+        if not self._header:
+            self._writer.writerow(list(columns))
+            self._header = True
+        lists = [np.asarray(values).tolist() for values in columns.values()]
+        self._writer.writerows(zip(*lists))
+    
+    def close(self):
+        """Finish the file"""
+        self._file.close()
+
+
+def open_sink(path: str):
+    """Output writer for a path (.parquet or .csv)"""
+    return ParquetSink(path) if path.endswith('.parquet') else CsvSink(path)
+
+
+# ============== Pipeline ==============
+
+# Per-row failures inside calculate_many (e.g. Placidus cusps near the poles)
+CHART_ERRORS = (swe.Error, OverflowError)
+
+def _chunks(rows: Iterable[Dict], size: int) -> Iterator[List[Dict]]:
+    """Group an iterator into lists of ``size`` rows"""
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _chart_chunk(calc: SwissEphemerisCalculator, datetimes: List[datetime], lats: List[float],
+                 lons: List[float], tzs: List[str]) -> Tuple[Dict[str, np.ndarray], List[int], List[Tuple[int, str]]]:
+    """Chart columns of a chunk, the indices they cover and the (index, error) of rows that failed
+    
+    The chunk is charted in one ``calculate_many`` call; if that fails, row by
+    row, so one bad row does not take the rest of the chunk with it.
+    """
+    try:
+        return chart_columns(calc.calculate_many(datetimes, lats, lons, tzs)), list(range(len(datetimes))), []
+    except CHART_ERRORS:
+        pass
+    
+    parts, kept, failed = [], [], []
+    for i in range(len(datetimes)):
+        try:
+            parts.append(chart_columns(calc.calculate_many([datetimes[i]], [lats[i]], [lons[i]], [tzs[i]])))
+            kept.append(i)
+        except CHART_ERRORS as e:
+            failed.append((i, str(e)))
+    columns = {key: np.concatenate([p[key] for p in parts]) for key in parts[0]} if parts else {}
+    return columns, kept, failed
+
+
+def ingest(
+    input_path: str,
+    output_path: str,
+    errors_path: Optional[str] = None,
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+    column_map: Optional[Dict[str, str]] = None,
+    id_column: Optional[str] = None,
+    default_timezone: str = "Asia/Bangkok",
+    calculator: Optional[SwissEphemerisCalculator] = None,
+    progress: Optional[Callable[[IngestStats], None]] = None
+) -> IngestStats:
+    """Chart every row of ``input_path`` into ``output_path`` in bounded memory
+    
+    ``column_map`` maps input column names to the expected ones (e.g.
+    ``{'lat': 'latitude'}``); ``id_column`` is copied through to the output.
+    ``progress`` is called with the running stats after every chunk.
+    """
+    calc = calculator or SwissEphemerisCalculator()
+    stats = IngestStats()
+    sink = open_sink(output_path)
+    errors_file = open(errors_path, 'w', newline='', encoding='utf-8') if errors_path else None
+    errors_writer = csv.writer(errors_file) if errors_file else None
+    if errors_writer:
+        errors_writer.writerow(['row', 'error', 'data'])
+    
+    try:
+        for chunk in _chunks(read_rows(input_path, chunk_rows), chunk_rows):
+            row_numbers, raws, ids, datetimes, lats, lons, tzs = [], [], [], [], [], [], []
+            for offset, raw in enumerate(chunk):
+                row_number = stats.rows_read + offset + 1
+                row = {column_map.get(k, k): v for k, v in raw.items()} if column_map else raw
+                try:
+                    dt, lat, lon, tz = parse_row(row, default_timezone)
+                except ValueError as e:
+                    stats.error_rows += 1
+                    if errors_writer:
+                        errors_writer.writerow([row_number, str(e), repr(raw)])
+                    continue
+                row_numbers.append(row_number)
+                raws.append(raw)
+                ids.append(row.get(id_column) if id_column else None)
+                datetimes.append(dt)
+                lats.append(lat)
+                lons.append(lon)
+                tzs.append(tz)
+            stats.rows_read += len(chunk)
+            
+            if datetimes:
+                charts, kept, failed = _chart_chunk(calc, datetimes, lats, lons, tzs)
+                for i, error in failed:
+                    stats.error_rows += 1
+                    if errors_writer:
+                        errors_writer.writerow([row_numbers[i], error, repr(raws[i])])
+                if kept:
+                    columns = {'row': np.array([row_numbers[i] for i in kept], dtype=np.int64)}
+                    if id_column:
+                        columns[id_column] = np.array([ids[i] for i in kept], dtype=object)
+                    columns.update(charts)
+                    sink.write(columns)
+                    stats.rows_written += len(kept)
+            stats.chunks += 1
+            if progress:
+                progress(stats)
+    finally:
+        sink.close()
+        if errors_file:
+            errors_file.close()
+    return stats
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Chart a file of birth records into a columnar file")
+    parser.add_argument("input", help="CSV or Parquet file of birth rows")
+    parser.add_argument("output", help=".parquet (needs pyarrow) or .csv")
+    parser.add_argument("--errors", default=None, help="CSV file for rejected rows")
+    parser.add_argument("--chunk-rows", type=int, default=DEFAULT_CHUNK_ROWS)
+    parser.add_argument("--id-column", default=None, help="input column copied to the output")
+    parser.add_argument("--map", action="append", default=[], metavar="SOURCE=TARGET",
+                        help="rename an input column, e.g. --map lat=latitude")
+    parser.add_argument("--timezone", default="Asia/Bangkok", help="zone for rows without one")
+    parser.add_argument("--ephe-path", default=None, help="Swiss Ephemeris data directory")
+    args = parser.parse_args()
+    
+    column_map = dict(item.split('=', 1) for item in args.map)
+    stats = ingest(
+        args.input, args.output, args.errors, args.chunk_rows, column_map, args.id_column,
+        args.timezone, SwissEphemerisCalculator(args.ephe_path),
+        progress=lambda s: print(s, file=sys.stderr)
+    )
+    print(f"Done in {stats.elapsed:.1f} s: {stats}")
+    if stats.error_rows and args.errors:
+        print(f"Rejected rows listed in {args.errors}")
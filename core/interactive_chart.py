@@ -5,6 +5,7 @@ Clickable planets with hover details
 
 import plotly.graph_objects as go
 import numpy as np
+from functools import lru_cache
 from typing import Dict, List, Optional
 
 # Planet glyphs and colors (matching chart_wheel.py)
@@ -59,264 +60,256 @@ def degree_to_chart_coords(longitude: float, radius: float) -> tuple:
     return x, y
 
 
-def create_interactive_chart_wheel(
-    planets: Dict,
-    houses: Dict,
-    ascendant: Dict,
-    midheaven: Dict,
-    aspects: Optional[List[Dict]] = None,
-    show_aspects: bool = True,
-    show_houses: bool = True,
-    width: int = 700,
-    height: int = 700
-) -> go.Figure:
-    """Create an interactive Plotly chart wheel"""
-    
-    fig = go.Figure()
-    
-    # Set dark background
-    fig.update_layout(
-        paper_bgcolor='#1a1a2e',
-        plot_bgcolor='#1a1a2e',
-        width=width,
-        height=height,
-        xaxis=dict(range=[-1.3, 1.3], showgrid=False, zeroline=False, showticklabels=False),
-        yaxis=dict(range=[-1.3, 1.3], showgrid=False, zeroline=False, showticklabels=False),
-        showlegend=False,
-        margin=dict(l=20, r=20, t=40, b=20),
-        hovermode='closest'
-    )
-    
-    outer_radius = 1.0
-    house_radius = 0.85
-    planet_radius = 0.55
-    
-    # Draw sign segments as wedges using shapes
-    for i, sign in enumerate(['Aries', 'Taurus', 'Gemini', 'Cancer', 'Leo', 'Virgo',
-                               'Libra', 'Scorpio', 'Sagittarius', 'Capricorn', 'Aquarius', 'Pisces']):
-        start_angle = 90 - i * 30
-        end_angle = start_angle - 30
-        
-        # Draw wedge using shapes (pie slices)
-        fig.add_shape(
+# ============== Batched Traces ==============
+# Every layer of the wheel is one trace (or layout shapes), however many
+# glyphs it holds, so the figure JSON and the browser's trace count stay
+# small and fixed. Coordinates are rounded to COORD_DECIMALS, far below a pixel.
+
+COORD_DECIMALS = 4
+
+SIGNS = ['Aries', 'Taurus', 'Gemini', 'Cancer', 'Leo', 'Virgo',
+         'Libra', 'Scorpio', 'Sagittarius', 'Capricorn', 'Aquarius', 'Pisces']
+
+ASPECT_COLORS = {
+    'Conjunction': '#FFFFFF',
+    'Opposition': '#FF6B6B',
+    'Square': '#FF4500',
+    'Trine': '#4ECDC4',
+    'Sextile': '#95E1D3'
+}
+
+OUTER_RADIUS = 1.0
+HOUSE_RADIUS = 0.85
+PLANET_RADIUS = 0.55
+
+
+def _point(longitude: float, radius: float) -> tuple:
+    """Rounded chart coordinates of a longitude"""
+    x, y = degree_to_chart_coords(longitude, radius)
+    return round(float(x), COORD_DECIMALS), round(float(y), COORD_DECIMALS)
+
+
+def _segments(pairs: List[tuple]) -> tuple:
+    """x and y lists drawing each (start, end) pair as its own line in a single trace"""
+    xs, ys = [], []
+    for (x1, y1), (x2, y2) in pairs:
+        xs.extend([x1, x2, None])
+        ys.extend([y1, y2, None])
+    return xs, ys
+
+
+def _sign_shapes(show_houses: bool) -> List[Dict]:
+    """Sign wedges and ring circles as layout shapes"""
+    shapes = []
+    for i, sign in enumerate(SIGNS):
+        x1, y1 = _point(i * 30, OUTER_RADIUS)
+        x2, y2 = _point((i + 1) * 30, OUTER_RADIUS)
+        shapes.append(dict(
             type="path",
-            path=f"M 0 0 L {outer_radius*np.cos(np.radians(start_angle))} {outer_radius*np.sin(np.radians(start_angle))} A {outer_radius} {outer_radius} 0 0 0 {outer_radius*np.cos(np.radians(end_angle))} {outer_radius*np.sin(np.radians(end_angle))} Z",
+            path=f"M 0 0 L {x1} {y1} A {OUTER_RADIUS} {OUTER_RADIUS} 0 0 0 {x2} {y2} Z",
             fillcolor=SIGN_COLORS.get(sign, '#333'),
             opacity=0.5,
             line=dict(color='#2d2d44', width=1),
             layer="below"
-        )
-        
-        # Sign glyph at center of each sign using scatter
-        mid_angle = start_angle - 15
-        glyph_x = (outer_radius - 0.05) * np.cos(np.radians(90 - mid_angle))
-        glyph_y = (outer_radius - 0.05) * np.sin(np.radians(90 - mid_angle))
-        
-        fig.add_trace(go.Scatter(
-            x=[glyph_x], y=[glyph_y],
-            mode='text',
-            text=[SIGN_GLYPHS.get(sign, '')],
-            textfont=dict(size=14, color='white'),
-            hoverinfo='skip'
         ))
     
-    # Draw outer circle
-    theta_circle = np.linspace(0, 2*np.pi, 100)
-    fig.add_trace(go.Scatter(
-        x=outer_radius * np.cos(theta_circle),
-        y=outer_radius * np.sin(theta_circle),
-        mode='lines',
-        line=dict(color='#4a4a6a', width=2),
-        hoverinfo='skip'
-    ))
-    
-    # Draw house circle
+    rings = [(OUTER_RADIUS, '#4a4a6a')]
     if show_houses:
-        fig.add_trace(go.Scatter(
-            x=house_radius * np.cos(theta_circle),
-            y=house_radius * np.sin(theta_circle),
-            mode='lines',
-            line=dict(color='#3d3d5c', width=2),
-            hoverinfo='skip'
+        rings.append((HOUSE_RADIUS, '#3d3d5c'))
+    for radius, color in rings:
+        shapes.append(dict(
+            type="circle",
+            x0=-radius, y0=-radius, x1=radius, y1=radius,
+            line=dict(color=color, width=2)
         ))
-        
-        # House cusps and numbers
-        house_xs, house_ys = [], []
-        house_labels_x, house_labels_y, house_labels_text = [], [], []
-        
+    return shapes
+
+
+def _sign_glyph_trace() -> Dict:
+    """All twelve sign glyphs, each centred in its wedge"""
+    points = [_point(i * 30 + 15, OUTER_RADIUS - 0.05) for i in range(12)]
+    return dict(
+        type='scatter',
+        x=[p[0] for p in points], y=[p[1] for p in points],
+        mode='text',
+        text=[SIGN_GLYPHS[sign] for sign in SIGNS],
+        textfont=dict(size=14, color='white'),
+        hoverinfo='skip',
+        name='Signs'
+    )
+
+
+def _planet_hover(planet: str, data: Dict) -> str:
+    """Hover card of one planet"""
+    sign = data.get('sign', 'Unknown')
+    degree = data.get('degree', 0)
+    house = data.get('house', 'N/A')
+    is_retrograde = data.get('retrograde', False)
+    element = ELEMENTS.get(sign, 'Unknown')
+    description = PLANET_DESCRIPTIONS.get(planet, 'Unknown planet')
+    
+    hover_text = f"<b>{planet}</b><br>"
+    hover_text += f"Sign: {sign} ({element})<br>"
+    hover_text += f"Degree: {int(degree)}°{int((degree % 1) * 60)}'<br>"
+    hover_text += f"House: {house}<br>"
+    hover_text += f"Retrograde: {'Yes' if is_retrograde else 'No'}<br>"
+    hover_text += f"<br><i>{description}</i>"
+    return hover_text
+
+
+# ============== Base Figure ==============
+# Background, axes, sign wedges, rings, title and sign glyphs are the same for
+# every chart of a given size. Plotly validates them once; each chart then
+# reuses the result and adds only its own traces, skipping the validation
+# pass that used to cost most of the build time.
+
+@lru_cache(maxsize=16)
+def _base_figure(show_houses: bool, width: int, height: int) -> tuple:
+    """Validated (layout, sign glyph trace) of the static wheel as plotly JSON dicts"""
+    fig = go.Figure(
+        data=[_sign_glyph_trace()],
+        layout=dict(
+            paper_bgcolor='#1a1a2e',
+            plot_bgcolor='#1a1a2e',
+            width=width,
+            height=height,
+            xaxis=dict(range=[-1.3, 1.3], showgrid=False, zeroline=False, showticklabels=False),
+            yaxis=dict(range=[-1.3, 1.3], showgrid=False, zeroline=False, showticklabels=False),
+            showlegend=False,
+            margin=dict(l=20, r=20, t=40, b=20),
+            hovermode='closest',
+            shapes=_sign_shapes(show_houses),
+            title=dict(
+                text="Interactive Birth Chart",
+                font=dict(size=16, color='white'),
+                y=0.98
+            )
+        )
+    )
+    return fig.layout.to_plotly_json(), fig.data[0].to_plotly_json()
+
+
+def _chart_traces(planets: Dict, houses: Dict, ascendant: Dict, midheaven: Dict,
+                  aspects: Optional[List[Dict]], show_aspects: bool, show_houses: bool) -> List[Dict]:
+    """Per-chart traces: house lines, one per aspect type, planets and text labels"""
+    traces = []
+    
+    # Text labels (house numbers, planet names, ASC/MC) share one trace
+    label_points, label_texts, label_sizes, label_colors = [], [], [], []
+    
+    def add_label(point, text, size, color):
+        label_points.append(point)
+        label_texts.append(text)
+        label_sizes.append(size)
+        label_colors.append(color)
+    
+    # House cusps and numbers
+    if show_houses:
+        cusp_lines = []
         for house_num in range(1, 13):
             if house_num in houses:
-                cusp = houses[house_num]
-                long = cusp['longitude']
-                x1, y1 = degree_to_chart_coords(long, house_radius)
-                x2, y2 = degree_to_chart_coords(long, outer_radius)
-                
-                house_xs.extend([x1, x2, None])
-                house_ys.extend([y1, y2, None])
-                
-                # House number position
-                mid_long = (long + 15) % 360
-                hx, hy = degree_to_chart_coords(mid_long, (house_radius + outer_radius) / 2)
-                house_labels_x.append(hx)
-                house_labels_y.append(hy)
-                house_labels_text.append(str(house_num))
+                long = houses[house_num]['longitude']
+                cusp_lines.append((_point(long, HOUSE_RADIUS), _point(long, OUTER_RADIUS)))
+                add_label(_point((long + 15) % 360, (HOUSE_RADIUS + OUTER_RADIUS) / 2),
+                          str(house_num), 9, '#888')
         
-        # Draw house lines
-        if house_xs:
-            fig.add_trace(go.Scatter(
+        if cusp_lines:
+            house_xs, house_ys = _segments(cusp_lines)
+            traces.append(dict(
+                type='scatter',
                 x=house_xs, y=house_ys,
                 mode='lines',
                 line=dict(color='#4a4a6a', width=1),
-                hoverinfo='skip'
-            ))
-        
-        # Draw house numbers
-        if house_labels_x:
-            fig.add_trace(go.Scatter(
-                x=house_labels_x, y=house_labels_y,
-                mode='text',
-                text=house_labels_text,
-                textfont=dict(size=9, color='#888'),
-                hoverinfo='skip'
+                hoverinfo='skip',
+                name='Houses'
             ))
     
-    # Draw aspect lines
+    planet_positions = {p: _point(data['longitude'], PLANET_RADIUS) for p, data in planets.items()}
+    
+    # Aspect lines, one trace per aspect type
     if show_aspects and aspects:
-        planet_positions = {p: degree_to_chart_coords(planets[p]['longitude'], planet_radius) 
-                          for p in planets if p in planets}
-        
-        aspect_colors = {
-            'Conjunction': '#FFFFFF',
-            'Opposition': '#FF6B6B',
-            'Square': '#FF4500',
-            'Trine': '#4ECDC4',
-            'Sextile': '#95E1D3'
-        }
-        
-        aspect_xs, aspect_ys = [], []
-        
+        aspect_lines = {}
         for aspect in aspects[:15]:
             p1, p2 = aspect['p1'], aspect['p2']
             if p1 in planet_positions and p2 in planet_positions:
-                x1, y1 = planet_positions[p1]
-                x2, y2 = planet_positions[p2]
-                
-                aspect_xs.extend([x1, x2, None])
-                aspect_ys.extend([y1, y2, None])
+                aspect_lines.setdefault(aspect['type'], []).append(
+                    (planet_positions[p1], planet_positions[p2]))
         
-        if aspect_xs:
-            fig.add_trace(go.Scatter(
+        for aspect_name, lines in aspect_lines.items():
+            aspect_xs, aspect_ys = _segments(lines)
+            traces.append(dict(
+                type='scatter',
                 x=aspect_xs, y=aspect_ys,
                 mode='lines',
-                line=dict(color='#666', width=1),
+                line=dict(color=ASPECT_COLORS.get(aspect_name, '#666'), width=1),
                 opacity=0.4,
-                hoverinfo='skip'
+                hoverinfo='skip',
+                name=aspect_name
             ))
     
-    # Draw planets
-    planet_xs, planet_ys = [], []
-    planet_glyphs, planet_colors = [], []
-    planet_hover, planet_texts = [], []
-    
-    for planet, data in planets.items():
-        long = data['longitude']
-        sign = data.get('sign', 'Unknown')
-        degree = data.get('degree', 0)
-        house = data.get('house', 'N/A')
-        is_retrograde = data.get('retrograde', False)
-        element = ELEMENTS.get(sign, 'Unknown')
-        
-        x, y = degree_to_chart_coords(long, planet_radius)
-        
-        planet_xs.append(x)
-        planet_ys.append(y)
-        planet_glyphs.append(PLANET_GLYPHS.get(planet, '●'))
-        planet_colors.append(PLANET_COLORS.get(planet, '#888'))
-        
-        # Hover text
-        description = PLANET_DESCRIPTIONS.get(planet, 'Unknown planet')
-        hover_text = f"<b>{planet}</b><br>"
-        hover_text += f"Sign: {sign} ({element})<br>"
-        hover_text += f"Degree: {int(degree)}°{int((degree % 1) * 60)}'<br>"
-        hover_text += f"House: {house}<br>"
-        hover_text += f"Retrograde: {'Yes' if is_retrograde else 'No'}<br>"
-        hover_text += f"<br><i>{description}</i>"
-        planet_hover.append(hover_text)
-        planet_texts.append(planet)
-    
-    # Draw planets as markers with glyphs
-    if planet_xs:
-        # Planet circles
-        fig.add_trace(go.Scatter(
-            x=planet_xs, y=planet_ys,
-            mode='markers',
+    # Planets: markers with their glyphs and hover details in one trace
+    if planets:
+        traces.append(dict(
+            type='scatter',
+            x=[planet_positions[p][0] for p in planets],
+            y=[planet_positions[p][1] for p in planets],
+            mode='markers+text',
             marker=dict(
                 size=28,
-                color=planet_colors,
+                color=[PLANET_COLORS.get(p, '#888') for p in planets],
                 line=dict(color='white', width=2)
             ),
-            hovertemplate='%{customdata}<extra></extra>',
-            customdata=planet_hover,
-            name='Planets'
-        ))
-        
-        # Planet glyphs
-        fig.add_trace(go.Scatter(
-            x=planet_xs, y=planet_ys,
-            mode='text',
-            text=planet_glyphs,
+            text=[PLANET_GLYPHS.get(p, '●') for p in planets],
             textposition='middle center',
             textfont=dict(size=14, color='black'),
-            hoverinfo='skip'
+            hovertemplate='%{customdata}<extra></extra>',
+            customdata=[_planet_hover(p, data) for p, data in planets.items()],
+            name='Planets'
         ))
         
-        # Planet names
-        name_positions = []
         for planet, data in planets.items():
-            long = data['longitude']
-            nx, ny = degree_to_chart_coords(long, planet_radius - 0.12)
-            name_positions.append((nx, ny, planet))
-        
-        if name_positions:
-            fig.add_trace(go.Scatter(
-                x=[p[0] for p in name_positions],
-                y=[p[1] for p in name_positions],
-                mode='text',
-                text=[p[2] for p in name_positions],
-                textfont=dict(size=8, color='#aaa'),
-                hoverinfo='skip'
-            ))
+            add_label(_point(data['longitude'], PLANET_RADIUS - 0.12), planet, 8, '#aaa')
     
-    # ASC and MC markers using scatter
+    # ASC and MC
     if ascendant:
-        asc_long = ascendant['longitude']
-        ax, ay = degree_to_chart_coords(asc_long, house_radius - 0.1)
-        fig.add_trace(go.Scatter(
-            x=[ax], y=[ay],
-            mode='text',
-            text=['ASC'],
-            textfont=dict(size=10, color='#00FF00'),
-            hoverinfo='skip'
-        ))
-    
+        add_label(_point(ascendant['longitude'], HOUSE_RADIUS - 0.1), 'ASC', 10, '#00FF00')
     if midheaven:
-        mc_long = midheaven['longitude']
-        mx, my = degree_to_chart_coords(mc_long, house_radius - 0.1)
-        fig.add_trace(go.Scatter(
-            x=[mx], y=[my],
+        add_label(_point(midheaven['longitude'], HOUSE_RADIUS - 0.1), 'MC', 10, '#FFD700')
+    
+    if label_points:
+        traces.append(dict(
+            type='scatter',
+            x=[p[0] for p in label_points],
+            y=[p[1] for p in label_points],
             mode='text',
-            text=['MC'],
-            textfont=dict(size=10, color='#FFD700'),
-            hoverinfo='skip'
+            text=label_texts,
+            textfont=dict(size=label_sizes, color=label_colors),
+            hoverinfo='skip',
+            name='Labels'
         ))
     
-    # Title
-    fig.update_layout(
-        title=dict(
-            text="Interactive Birth Chart",
-            font=dict(size=16, color='white'),
-            y=0.98
-        )
-    )
+    return traces
+
+
+def create_interactive_chart_wheel(
+    planets: Dict,
+    houses: Dict,
+    ascendant: Dict,
+    midheaven: Dict,
+    aspects: Optional[List[Dict]] = None,
+    show_aspects: bool = True,
+    show_houses: bool = True,
+    width: int = 700,
+    height: int = 700
+) -> go.Figure:
+    """Create an interactive Plotly chart wheel
+    
+    The cached base figure supplies the layout and sign glyphs; only the
+    chart's own traces (house lines, one per aspect type, planets with
+    their hover details, text labels) are built per call.
+    """
+    layout, sign_glyphs = _base_figure(show_houses, width, height)
+    traces = _chart_traces(planets, houses, ascendant, midheaven, aspects, show_aspects, show_houses)
     
-    return fig
+    # The base is already validated and the chart traces are plain scatter dicts
+    return go.Figure(data=[sign_glyphs] + traces, layout=layout, _validate=False)
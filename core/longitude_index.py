@@ -0,0 +1,180 @@
+"""
+Sorted natal longitude index
+Range queries over a natal population: which charts have a body within an orb of a point or aspect
+
+``find_aspects`` scans every transit x natal x aspect combination, which is
+linear in the population. For one sky against many charts the question is
+usually narrow ("who has Saturn square their natal Sun today"), so here each
+natal body's longitudes are sorted once:
+
+    sorted   float64 (n,) per body   longitudes 0-360, ascending
+    order    int32 (n,) per body     chart row of each sorted longitude
+
+An aspect of angle ``a`` within ``orb`` from a transit at ``t`` is a natal point
+on the arcs ``t + a +/- orb`` or ``t - a +/- orb``; each arc is two bisections
+(split in two where it wraps past 0°), so a query costs O(log n) plus the
+charts it returns. Candidates are re-checked with the same separation and orb
+arithmetic as ``find_aspects``, so results match it exactly.
+"""
+
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence
+
+import numpy as np
+
+from .aspect_engine import ASPECT_DTYPE, AspectTable
+from .fortune_reader import TRANSIT_ASPECT_TABLE
+from .swiss_eph import PLANETS
+
+
+# Query results: chart row, separation from the transit and orb from the exact aspect
+MATCH_DTYPE = np.dtype([
+    ('chart', np.int32),
+    ('separation', np.float64),
+    ('orb', np.float64),
+])
+
+# Arcs are widened by this much before the exact re-check, so rounding at the edges never drops a chart
+EDGE_DEG = 1e-9
+
+
+class LongitudeIndex:
+    """Per-body sorted natal longitudes of a population of charts"""
+    
+    def __init__(self, longitudes: np.ndarray, body_names: Sequence[str], ids: Optional[Sequence] = None):
+        """Index ``longitudes`` (charts, bodies), columns named by ``body_names``
+        
+        ``ids`` (one per chart) are kept as ``self.ids`` to translate result rows.
+        """
+        longitudes = np.asarray(longitudes, dtype=float) % 360
+        self.body_names = list(body_names)
+        self.ids = None if ids is None else np.asarray(ids)
+        self.count = longitudes.shape[0]
+        self._order = []
+        self._sorted = []
+        for j in range(len(self.body_names)):
+            order = np.argsort(longitudes[:, j], kind='stable').astype(np.int32)
+            self._order.append(order)
+            self._sorted.append(longitudes[order, j])
+    
+    def __len__(self) -> int:
+        return self.count
+    
+    @classmethod
+    def from_charts(cls, charts: Iterable[Mapping], ids: Optional[Sequence] = None) -> "LongitudeIndex":
+        """Index ``calculate_all`` results or ``Chart`` objects (all with the same bodies)"""
+        rows, names = [], None
+        for chart in charts:
+            planets = chart['planets']
+            if names is None:
+                names = list(planets)
+            rows.append([planets[p]['longitude'] for p in names])
+        return cls(np.array(rows, dtype=float).reshape(len(rows), len(names or [])), names or [], ids)
+    
+    @classmethod
+    def from_columns(cls, columns: Mapping[str, np.ndarray], id_column: Optional[str] = None) -> "LongitudeIndex":
+        """Index ``core.ingest`` columns (``<planet>_lon`` for each planet)"""
+        names, arrays = [], []
+        for name in PLANETS:
+            key = name.lower().replace(' ', '_') + '_lon'
+            if key in columns:
+                names.append(name)
+                arrays.append(np.asarray(columns[key], dtype=float))
+        ids = columns[id_column] if id_column else None
+        return cls(np.column_stack(arrays), names, ids)
+    
+    @classmethod
+    def from_file(cls, path: str, id_column: Optional[str] = None) -> "LongitudeIndex":
+        """Index a ``core.ingest`` output file, reading only the longitude (and id) columns"""
+        from .ingest import pq, read_rows
+        
+        wanted = [name.lower().replace(' ', '_') + '_lon' for name in PLANETS] + ([id_column] if id_column else [])
+        if path.endswith('.parquet'):
+            if pq is None:
+                raise ImportError("Reading Parquet needs pyarrow (pip install pyarrow)")
+            present = set(pq.ParquetFile(path).schema_arrow.names)
+            table = pq.read_table(path, columns=[c for c in wanted if c in present])
+            return cls.from_columns({c: table.column(c).to_numpy() for c in table.column_names}, id_column)
+        
+        columns: Dict[str, List] = {}
+        for row in read_rows(path):
+            for c in wanted:
+                if c in row:
+                    columns.setdefault(c, []).append(row[c])
+        return cls.from_columns({c: np.array(v) for c, v in columns.items()}, id_column)
+    
+    # ============== Queries ==============
+    
+    def _column(self, body: str) -> int:
+        try:
+            return self.body_names.index(body)
+        except ValueError:
+            raise KeyError(f"Body not in index: {body}") from None
+    
+    def _slices(self, j: int, start: float, end: float) -> List[slice]:
+        """Positions in the sorted column ``j`` on the arc from ``start`` to ``end``"""
+        lons = self._sorted[j]
+        if end - start >= 360:
+            return [slice(0, len(lons))]
+        
+        lo = start % 360
+        hi = lo + (end - start) % 360
+        if hi < 360:
+            return [slice(np.searchsorted(lons, lo, 'left'), np.searchsorted(lons, hi, 'right'))]
+        return [slice(np.searchsorted(lons, lo, 'left'), len(lons)),
+                slice(0, np.searchsorted(lons, hi - 360, 'right'))]
+    
+    def window(self, body: str, start: float, end: float) -> np.ndarray:
+        """Rows whose ``body`` longitude lies on the arc from ``start`` to ``end`` (counter-clockwise, inclusive)"""
+        j = self._column(body)
+        return np.concatenate([self._order[j][s] for s in self._slices(j, start, end)])
+    
+    def query(self, body: str, transit_longitude: float, angle: float, orb: float) -> np.ndarray:
+        """Charts whose natal ``body`` is within ``orb`` of ``angle`` from ``transit_longitude``
+        
+        Returns a ``MATCH_DTYPE`` array ordered by chart row.
+        """
+        j = self._column(body)
+        points = {(transit_longitude + angle) % 360, (transit_longitude - angle) % 360}
+        slices = [s for p in points for s in self._slices(j, p - orb - EDGE_DEG, p + orb + EDGE_DEG)]
+        rows = np.concatenate([self._order[j][s] for s in slices])
+        natal = np.concatenate([self._sorted[j][s] for s in slices])
+        by_row = np.argsort(rows)
+        rows, natal = rows[by_row], natal[by_row]
+        if len(slices) > 1:
+            # Arcs of a small angle can overlap: keep each chart once
+            first = np.concatenate([[True], rows[1:] != rows[:-1]])
+            rows, natal = rows[first], natal[first]
+        
+        # Exact check, same arithmetic as find_aspects
+        diff = np.abs(transit_longitude - natal)
+        separation = np.where(diff > 180, 360 - diff, diff)
+        orbs = np.abs(separation - angle)
+        keep = orbs <= orb
+        
+        matches = np.empty(int(keep.sum()), dtype=MATCH_DTYPE)
+        matches['chart'] = rows[keep]
+        matches['separation'] = separation[keep]
+        matches['orb'] = orbs[keep]
+        return matches
+    
+    def aspects(self, transits: Mapping[str, float], table: AspectTable = TRANSIT_ASPECT_TABLE) -> np.ndarray:
+        """Every transit-natal aspect of the population as ``ASPECT_DTYPE`` hits
+        
+        ``transits`` maps body names to longitudes. Same hits, in the same
+        (chart, i, j, aspect) order, as ``find_aspects(transit_lons, natal_lons, table, sort=False)``.
+        """
+        parts = []
+        for i, t_lon in enumerate(transits.values()):
+            for j, body in enumerate(self.body_names):
+                for k in range(len(table)):
+                    matches = self.query(body, t_lon, table.angles[k], table.orbs[k])
+                    hits = np.empty(len(matches), dtype=ASPECT_DTYPE)
+                    hits['chart'] = matches['chart']
+                    hits['i'] = i
+                    hits['j'] = j
+                    hits['aspect'] = k
+                    hits['separation'] = matches['separation']
+                    hits['orb'] = matches['orb']
+                    parts.append(hits)
+        hits = np.concatenate(parts) if parts else np.empty(0, dtype=ASPECT_DTYPE)
+        return hits[np.lexsort((hits['aspect'], hits['j'], hits['i'], hits['chart']))]
@@ -0,0 +1,237 @@
+"""
+Month sweep
+Transit positions over a whole month on a 2-hour grid, and the events found on it
+
+``MonthSky`` samples every transit body once a day (``calc_longitude_speed``:
+shared ephemeris cache, else Swiss Ephemeris) and fills a 2-hour grid by
+cubic Hermite interpolation on positions and speeds, so a month costs a few
+hundred ephemeris calls whatever the grid step. Events that do not depend on
+the natal chart are found once per month:
+
+    ingresses     sign changes of every body except the Moon
+    moon_phases   New, First Quarter, Full and Last Quarter Moon
+
+``aspect_windows`` then scans the grid against one natal chart in array
+operations: for each transit-natal pair the runs of samples within orb of an
+aspect become windows, with the moment of perfection (sign change of the
+deviation from the exact angle) or, failing that, the closest approach.
+"""
+
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, List, Mapping, Optional
+
+import numpy as np
+import pytz
+
+from .aspect_engine import AspectTable
+from .ephemeris_cache import calc_longitude_speed
+from .transit_solver import SIGNS, TRANSIT_BODIES, _wrap180, datetime_to_jd, jd_to_datetime
+
+
+SWEEP_STEP_HOURS = 2
+
+# Ephemeris samples behind the grid, in days
+KNOT_DAYS = 1.0
+
+# Ingresses and aspect windows leave the Moon out (it changes sign every 2-3 days)
+MONTHLY_BODIES = [p for p in TRANSIT_BODIES if p != 'Moon']
+
+MOON_PHASES = {
+    0: {"en": "New Moon", "th": "จันทร์ดับ"},
+    1: {"en": "First Quarter", "th": "ขึ้น 8 ค่ำ"},
+    2: {"en": "Full Moon", "th": "จันทร์เต็มดวง"},
+    3: {"en": "Last Quarter", "th": "แรม 8 ค่ำ"},
+}
+
+
+def sample_positions(jds: np.ndarray, bodies: Mapping[str, int]) -> tuple:
+    """Longitudes and speeds (len(jds), bodies) from daily ephemeris knots"""
+    knots = np.arange(np.floor(jds[0]), np.ceil(jds[-1]) + KNOT_DAYS, KNOT_DAYS)
+    if len(knots) < 2:
+        knots = np.array([knots[0], knots[0] + KNOT_DAYS])
+    values = np.array([[calc_longitude_speed(jd, body) for body in bodies.values()] for jd in knots.tolist()])
+    lon, speed = values[..., 0], values[..., 1]
+    
+    i = np.minimum(((jds - knots[0]) / KNOT_DAYS).astype(int), len(knots) - 2)
+    t = ((jds - knots[i]) / KNOT_DAYS)[:, None]
+    h = KNOT_DAYS
+    lon0, lon1, speed0, speed1 = lon[i], lon[i + 1], speed[i], speed[i + 1]
+    delta = _wrap180(lon1 - lon0)
+    t2, t3 = t * t, t * t * t
+    grid_lon = lon0 + (t3 - 2 * t2 + t) * speed0 * h + (3 * t2 - 2 * t3) * delta + (t3 - t2) * speed1 * h
+    grid_speed = (3 * t2 - 4 * t + 1) * speed0 + (6 * t - 6 * t2) * delta / h + (3 * t2 - 2 * t) * speed1
+    return grid_lon % 360, grid_speed
+
+
+def _crossing(jd0: float, step: float, before: float, after: float) -> float:
+    """Linear interpolation of where a signed quantity crosses zero between two samples"""
+    return jd0 + step * before / (before - after) if before != after else jd0
+
+
+class MonthSky:
+    """Transit grid of one calendar month (local time) and its chart-independent events"""
+    
+    def __init__(self, year: int, month: int, timezone: str = "Asia/Bangkok",
+                 step_hours: float = SWEEP_STEP_HOURS):
+        self.year, self.month = year, month
+        self.tz = pytz.timezone(timezone)
+        start = self.tz.localize(datetime(year, month, 1))
+        end = self.tz.localize(datetime(year + month // 12, month % 12 + 1, 1))
+        self.step = step_hours / 24
+        start_jd, end_jd = datetime_to_jd(start), datetime_to_jd(end)
+        self.jds = start_jd + np.arange(int(round((end_jd - start_jd) / self.step))) * self.step
+        
+        self.names = list(TRANSIT_BODIES)
+        self.longitudes, self.speeds = sample_positions(self.jds, TRANSIT_BODIES)
+        
+        # Sample closest to the 15th at noon, for month-level sign themes
+        mid_jd = datetime_to_jd(self.tz.localize(datetime(year, month, 15, 12)))
+        self.mid = int(np.argmin(np.abs(self.jds - mid_jd)))
+        
+        # Local date of every sample, formatted once for all the charts of the month
+        self.dates = [self.local(jd).strftime("%Y-%m-%d") for jd in self.jds.tolist()]
+        
+        self.ingresses = self._ingresses()
+        self.phases = self._moon_phases()
+    
+    def local(self, jd: float) -> datetime:
+        """Local datetime of a Julian Day"""
+        return jd_to_datetime(jd).astimezone(self.tz)
+    
+    def index(self, jd: float) -> int:
+        """Grid sample nearest to a Julian Day"""
+        return min(max(int(round((jd - self.jds[0]) / self.step)), 0), len(self.jds) - 1)
+    
+    def date(self, jd: float) -> str:
+        """Local date (YYYY-MM-DD) of the grid sample nearest to a Julian Day"""
+        return self.dates[self.index(jd)]
+    
+    def time(self, jd: float) -> str:
+        """Local time of a Julian Day, to the minute"""
+        return self.local(jd).strftime("%Y-%m-%d %H:%M")
+    
+    def sign(self, planet: str, index: int) -> str:
+        """Sign of a body at a grid sample"""
+        return SIGNS[int(self.longitudes[index, self.names.index(planet)] / 30) % 12]
+    
+    def _ingresses(self) -> List[Dict]:
+        """Sign changes of the monthly bodies, in time order"""
+        cols = [self.names.index(p) for p in MONTHLY_BODIES]
+        signs = (self.longitudes[:, cols] // 30).astype(int) % 12
+        rows, bodies = np.nonzero(signs[1:] != signs[:-1])
+        
+        events = []
+        for i, b in zip(rows.tolist(), bodies.tolist()):
+            col = cols[b]
+            lon0, lon1 = self.longitudes[i, col], self.longitudes[i + 1, col]
+            forward = _wrap180(lon1 - lon0) > 0
+            boundary = 30.0 * (signs[i + 1, b] if forward else signs[i, b])
+            jd = _crossing(self.jds[i], self.step, _wrap180(lon0 - boundary), _wrap180(lon1 - boundary))
+            events.append({
+                'jd': jd,
+                'time': self.time(jd),
+                'planet': MONTHLY_BODIES[b],
+                'sign': SIGNS[signs[i + 1, b]],
+                'retrograde': not forward,
+            })
+        events.sort(key=lambda e: e['jd'])
+        return events
+    
+    def _moon_phases(self) -> List[Dict]:
+        """Quarter phases: the Moon-Sun elongation crossing 0, 90, 180 and 270 degrees"""
+        moon = self.longitudes[:, self.names.index('Moon')]
+        elongation = (moon - self.longitudes[:, self.names.index('Sun')]) % 360
+        quarter = (elongation // 90).astype(int)
+        
+        events = []
+        for i in np.nonzero(quarter[1:] != quarter[:-1])[0].tolist():
+            phase = int(quarter[i + 1])
+            jd = _crossing(self.jds[i], self.step, _wrap180(elongation[i] - 90 * phase),
+                           _wrap180(elongation[i + 1] - 90 * phase))
+            frac = (jd - self.jds[i]) / self.step
+            lon = (moon[i] + frac * _wrap180(moon[i + 1] - moon[i])) % 360
+            events.append({'jd': jd, 'time': self.time(jd), 'phase': phase, 'sign': SIGNS[int(lon / 30) % 12]})
+        return events
+
+
+@lru_cache(maxsize=32)
+def get_month_sky(year: int, month: int, timezone: str = "Asia/Bangkok") -> MonthSky:
+    """Shared MonthSky per (year, month, zone); every chart of the month reuses it"""
+    return MonthSky(year, month, timezone)
+
+
+def aspect_windows(sky: MonthSky, natal_planets: Mapping, table: AspectTable,
+                   bodies: Optional[List[str]] = None) -> List[Dict]:
+    """Every transit-natal aspect that is in orb during the month, in order of first contact
+    
+    Each window has the UT ``start``/``end``/``peak`` Julian Days, ``orb``
+    at the peak and ``exact`` when the aspect perfects inside the month.
+    """
+    bodies = [p for p in (bodies or MONTHLY_BODIES) if p in sky.names]
+    natal_names = list(natal_planets)
+    if not bodies or not natal_names:
+        return []
+    natal = np.array([natal_planets[p]['longitude'] for p in natal_names])
+    
+    # Nearest aspect of every sample (aspects are further apart than twice any orb), then the
+    # signed deviation on the side of the natal point the transit is on: it changes sign at
+    # perfection, conjunctions and oppositions included. Inputs are bounded, so the wraps
+    # are single +/-360 corrections rather than float modulo. Laid out (transit, natal, time)
+    # so each pair's samples are contiguous.
+    transit = sky.longitudes[:, [sky.names.index(p) for p in bodies]].T
+    signed = transit[:, None, :] - natal[None, :, None]
+    signed += np.where(signed >= 180, -360.0, np.where(signed < -180, 360.0, 0.0))
+    aspect = np.searchsorted((table.angles[1:] + table.angles[:-1]) / 2, np.abs(signed))
+    angle = table.angles[aspect]
+    ahead, behind = signed - angle, signed + angle
+    ahead[ahead < -180] += 360
+    behind[behind >= 180] -= 360
+    deviation = np.where(np.abs(ahead) <= np.abs(behind), ahead, behind)
+    in_orb = np.abs(deviation) <= table.orbs[aspect]
+    
+    # Runs of in-orb samples per (transit, natal) pair, along time
+    steps = len(sky.jds)
+    code = np.where(in_orb, aspect + 1, 0).reshape(-1, steps)
+    deviation = deviation.reshape(-1, steps)
+    padded = np.pad(code, ((0, 0), (1, 1)))
+    pair, pos = np.nonzero(padded[:, 1:] != padded[:, :-1])
+    # A boundary whose new value is non-zero starts a run; the next boundary of the pair ends it
+    starts = np.nonzero(padded[pair, pos + 1] != 0)[0]
+    run_pair, run_start, run_end = pair[starts], pos[starts], pos[starts + 1]
+    
+    # Perfection: the first sign change of the deviation between two samples of one run
+    same_run = (code[:, 1:] != 0) & (code[:, 1:] == code[:, :-1])
+    flip_pair, flip_pos = np.nonzero(same_run & (deviation[:, :-1] * deviation[:, 1:] <= 0))
+    flip_keys = flip_pair * steps + flip_pos
+    first = np.searchsorted(flip_keys, run_pair * steps + run_start)
+    exact = np.zeros(len(run_pair), dtype=bool)
+    if len(flip_keys):
+        exact = (first < len(flip_keys)) & (
+            flip_keys[np.minimum(first, len(flip_keys) - 1)] < run_pair * steps + run_end - 1)
+    
+    windows = []
+    jds = sky.jds
+    for p, start, end, f, is_exact in zip(run_pair.tolist(), run_start.tolist(), run_end.tolist(),
+                                          first.tolist(), exact.tolist()):
+        if is_exact:
+            i = int(flip_pos[f])
+            peak = _crossing(jds[i], sky.step, deviation[p, i], deviation[p, i + 1])
+            orb = 0.0
+        else:
+            i = start + int(np.argmin(np.abs(deviation[p, start:end])))
+            peak = float(jds[i])
+            orb = abs(float(deviation[p, i]))
+        t, n = divmod(p, len(natal_names))
+        windows.append({
+            'transiting': bodies[t],
+            'natal': natal_names[n],
+            'type': table.names[code[p, start] - 1],
+            'start': float(jds[start]),
+            'end': float(jds[end - 1]),
+            'peak': float(peak),
+            'orb': orb,
+            'exact': is_exact,
+        })
+    windows.sort(key=lambda w: (w['start'], w['peak']))
+    return windows
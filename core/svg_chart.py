@@ -0,0 +1,319 @@
+"""
+Chart Wheels as SVG
+Natal, transit overlay and synastry wheels rendered straight to SVG text, without matplotlib
+
+Same layout as core.chart_wheel (radii, PLANET_COLORS, SIGN_COLORS,
+ASPECT_CONFIG), built by string templating: a wheel takes about a
+millisecond and a few tens of KB. Output depends only on the inputs, so it
+can be cached by content. The matplotlib renderer remains the fallback for
+PNG output.
+
+    svg = natal_chart_svg(chart['planets'], chart['houses'], chart['ascendant'], chart['midheaven'],
+                          chart['aspects'])
+"""
+
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+from xml.sax.saxutils import escape
+
+import numpy as np
+
+from .wheel_data import (
+    ASPECT_CONFIG, BACKGROUND, PLANET_COLORS, PLANET_GLYPHS, SIGN_COLORS, SIGN_GLYPHS,
+    SYNASTRY_ASPECT_LETTERS, TRANSIT_ASPECT_COLORS, TRANSIT_OVERLAY_PLANETS,
+    calculate_synastry_aspects, find_transit_overlay_aspects
+)
+
+
+DEFAULT_SIZE = 720          # width in pixels
+TITLE_BAND = 0.08           # height of the title strip, as a fraction of the width
+POINTS_PER_UNIT = 340       # font points per unit of wheel radius, matching the matplotlib figures
+
+FONT_FAMILY = "DejaVu Sans, Segoe UI Symbol, Noto Sans Symbols, sans-serif"
+
+
+def _num(value: float) -> str:
+    """Compact coordinate"""
+    return f"{value:.1f}".rstrip('0').rstrip('.')
+
+
+class SvgWheel:
+    """Element buffer in wheel coordinates (radius 1.0 = outer edge of the sign ring)"""
+    
+    def __init__(self, size: int, limit: float, title_lines: int = 1):
+        self.width = size
+        self.band = size * TITLE_BAND * (1 + 0.6 * (title_lines - 1))
+        self.height = size + self.band
+        self.scale = size / (2 * limit)
+        self.cx = size / 2
+        self.cy = self.band + size / 2
+        self.parts: List[str] = []
+    
+    def xy(self, x: float, y: float) -> Tuple[float, float]:
+        """Wheel coordinates -> SVG pixels"""
+        return self.cx + x * self.scale, self.cy - y * self.scale
+    
+    def polar(self, longitude: float, radius: float) -> Tuple[float, float]:
+        """Zodiac longitude at a radius -> SVG pixels (0° Aries at 12 o'clock, like degree_to_chart_coords)"""
+        angle = np.radians(90 - longitude)
+        return self.xy(radius * np.cos(angle), radius * np.sin(angle))
+    
+    def pt(self, points: float) -> float:
+        """Font size or line width in points -> pixels"""
+        return points * self.scale / POINTS_PER_UNIT
+    
+    def line(self, p1: Tuple[float, float], p2: Tuple[float, float], color: str, width: float,
+             dashed: bool = False, opacity: float = 1.0):
+        dash = f' stroke-dasharray="{_num(self.pt(width) * 4)}"' if dashed else ''
+        alpha = f' stroke-opacity="{opacity}"' if opacity < 1 else ''
+        self.parts.append(
+            f'<line x1="{_num(p1[0])}" y1="{_num(p1[1])}" x2="{_num(p2[0])}" y2="{_num(p2[1])}" '
+            f'stroke="{color}" stroke-width="{_num(self.pt(width))}"{dash}{alpha}/>'
+        )
+    
+    def circle(self, center: Tuple[float, float], radius: float, fill: str = 'none', stroke: str = 'none',
+               width: float = 1.0, dashed: bool = False):
+        dash = f' stroke-dasharray="{_num(self.pt(width) * 4)}"' if dashed else ''
+        self.parts.append(
+            f'<circle cx="{_num(center[0])}" cy="{_num(center[1])}" r="{_num(radius * self.scale)}" '
+            f'fill="{fill}" stroke="{stroke}" stroke-width="{_num(self.pt(width))}"{dash}/>'
+        )
+    
+    def text(self, position: Tuple[float, float], content: str, points: float, color: str,
+             bold: bool = False, baseline: bool = False):
+        """Centered text; ``baseline`` sits it on the point instead (like matplotlib annotate)"""
+        weight = ' font-weight="bold"' if bold else ''
+        anchor = ' dominant-baseline="auto"' if baseline else ''
+        self.parts.append(
+            f'<text x="{_num(position[0])}" y="{_num(position[1])}" font-size="{_num(self.pt(points))}" '
+            f'fill="{color}"{weight}{anchor}>{escape(content)}</text>'
+        )
+    
+    def title(self, lines: List[str], points: float):
+        """Title lines centered in the band above the wheel"""
+        step = self.pt(points) * 1.25
+        top = self.band / 2 - step * (len(lines) - 1) / 2
+        for i, line in enumerate(lines):
+            self.text((self.cx, top + i * step), line, points, '#fff', bold=True)
+    
+    def render(self) -> str:
+        """The complete SVG document"""
+        w, h = _num(self.width), _num(self.height)
+        return (
+            f'<svg xmlns="http://www.w3.org/2000/svg" width="{w}" height="{h}" viewBox="0 0 {w} {h}" '
+            f'font-family="{FONT_FAMILY}">'
+            f'<style>text{{text-anchor:middle;dominant-baseline:central}}</style>'
+            f'<rect width="100%" height="100%" fill="{BACKGROUND}"/>'
+            + ''.join(self.parts) + '</svg>'
+        )
+
+
+@lru_cache(maxsize=32)
+def _sign_ring(size: int, limit: float, title_lines: int, inner_radius: float, glyph_radius: float,
+               glyph_points: float) -> str:
+    """The 12 sign wedges with their glyphs, rendered once per geometry"""
+    wheel = SvgWheel(size, limit, title_lines)
+    outer = wheel.scale
+    inner = inner_radius * wheel.scale
+    for i, (sign, glyph) in enumerate(SIGN_GLYPHS.items()):
+        (ox1, oy1), (ox2, oy2) = wheel.polar(i * 30, 1.0), wheel.polar(i * 30 + 30, 1.0)
+        (ix2, iy2), (ix1, iy1) = wheel.polar(i * 30 + 30, inner_radius), wheel.polar(i * 30, inner_radius)
+        # Longitude grows clockwise on screen: outer arc with sweep 1, inner arc back with sweep 0
+        wheel.parts.append(
+            f'<path d="M{_num(ox1)},{_num(oy1)} A{_num(outer)},{_num(outer)} 0 0 1 {_num(ox2)},{_num(oy2)} '
+            f'L{_num(ix2)},{_num(iy2)} A{_num(inner)},{_num(inner)} 0 0 0 {_num(ix1)},{_num(iy1)} Z" '
+            f'fill="{SIGN_COLORS.get(sign, "#333")}" stroke="#2d2d44" stroke-width="{_num(wheel.pt(1))}"/>'
+        )
+        wheel.text(wheel.polar(i * 30 + 15, glyph_radius), glyph, glyph_points, '#fff', bold=True)
+    return ''.join(wheel.parts)
+
+
+def _planet(wheel: SvgWheel, planet: str, longitude: float, radius: float, dot: float, ring_color: str,
+            ring_width: float, glyph_points: float):
+    """Colored disc with the planet glyph"""
+    position = wheel.polar(longitude, radius)
+    wheel.circle(position, dot, fill=PLANET_COLORS.get(planet, '#888'), stroke=ring_color, width=ring_width)
+    wheel.text(position, PLANET_GLYPHS.get(planet, '●'), glyph_points, '#000', bold=True)
+
+
+# ============== Natal Chart ==============
+
+def natal_chart_svg(
+    planets: Dict,
+    houses: Dict,
+    ascendant: Dict,
+    midheaven: Dict,
+    aspects: Optional[List[Dict]] = None,
+    show_aspects: bool = True,
+    show_houses: bool = True,
+    size: int = DEFAULT_SIZE
+) -> str:
+    """Natal chart wheel (SVG counterpart of create_chart_wheel)"""
+    outer_radius = 1.0
+    house_radius = 0.85
+    planet_radius = 0.55
+    
+    wheel = SvgWheel(size, 1.2)
+    wheel.title(['Natal Chart'], 14)
+    wheel.parts.append(_sign_ring(size, 1.2, 1, house_radius, outer_radius - 0.05, 8))
+    
+    if show_houses and houses:
+        for house_num in range(1, 13):
+            if house_num in houses:
+                long = houses[house_num]['longitude']
+                wheel.line(wheel.polar(long, house_radius), wheel.polar(long, outer_radius),
+                           '#4a4a6a', 1, opacity=0.7)
+                wheel.text(wheel.polar(long + 15, (house_radius + outer_radius) / 2), str(house_num),
+                           7, '#888', bold=True)
+        wheel.circle(wheel.xy(0, 0), house_radius, stroke='#3d3d5c', width=2)
+    
+    if show_aspects and aspects:
+        for aspect in aspects[:20]:
+            p1, p2 = aspect['p1'], aspect['p2']
+            if p1 in planets and p2 in planets:
+                config = ASPECT_CONFIG.get(aspect['type'], {'color': '#666', 'width': 1, 'style': '-'})
+                wheel.line(wheel.polar(planets[p1]['longitude'], planet_radius),
+                           wheel.polar(planets[p2]['longitude'], planet_radius),
+                           config['color'], config['width'], dashed=config['style'] == '--', opacity=0.6)
+    
+    for planet, data in planets.items():
+        wheel.text(wheel.polar(data['longitude'], planet_radius - 0.12), planet, 6, '#ccc')
+    for planet, data in planets.items():
+        _planet(wheel, planet, data['longitude'], planet_radius, 0.04, '#fff', 1, 10)
+    
+    if ascendant:
+        wheel.text(wheel.polar(ascendant['longitude'], house_radius - 0.08), 'ASC', 8, '#00FF00',
+                   bold=True, baseline=True)
+    if midheaven:
+        wheel.text(wheel.polar(midheaven['longitude'], house_radius - 0.08), 'MC', 8, '#FFD700',
+                   bold=True, baseline=True)
+    
+    return wheel.render()
+
+
+# ============== Transit Overlay ==============
+
+def transit_overlay_svg(
+    natal_planets: Dict,
+    natal_houses: Dict,
+    natal_ascendant: Dict,
+    natal_midheaven: Dict,
+    natal_aspects: List[Dict],
+    transit_planets: Dict,
+    show_aspects: bool = True,
+    show_houses: bool = True,
+    show_transit_aspects: bool = True,
+    size: int = DEFAULT_SIZE
+) -> str:
+    """Natal chart with transit overlay (SVG counterpart of create_transit_overlay_chart)"""
+    outer_radius = 1.0
+    natal_radius = 0.5
+    transit_radius = 0.75
+    
+    wheel = SvgWheel(size, 1.25, title_lines=2)
+    wheel.title(['Transit Overlay Chart', '(Natal: Inner | Transits: Outer)'], 12)
+    wheel.parts.append(_sign_ring(size, 1.25, 2, transit_radius, outer_radius - 0.03, 7))
+    
+    if show_houses and natal_houses:
+        for house_num in range(1, 13):
+            if house_num in natal_houses:
+                long = natal_houses[house_num]['longitude']
+                wheel.line(wheel.polar(long, natal_radius - 0.08), wheel.polar(long, natal_radius),
+                           '#4a4a6a', 0.8, opacity=0.5)
+    
+    wheel.circle(wheel.xy(0, 0), natal_radius, stroke='#666', width=1.5)
+    wheel.circle(wheel.xy(0, 0), transit_radius, stroke='#888', width=1, dashed=True)
+    
+    if show_transit_aspects:
+        for t_planet, n_planet, aspect_name in find_transit_overlay_aspects(natal_planets, transit_planets):
+            wheel.line(wheel.polar(transit_planets[t_planet]['longitude'], transit_radius),
+                       wheel.polar(natal_planets[n_planet]['longitude'], natal_radius),
+                       TRANSIT_ASPECT_COLORS.get(aspect_name, '#888'), 1.5, dashed=True, opacity=0.7)
+    
+    for planet in TRANSIT_OVERLAY_PLANETS:
+        if planet in transit_planets:
+            wheel.text(wheel.polar(transit_planets[planet]['longitude'], transit_radius + 0.06), planet,
+                       7, '#FFD700', bold=True)
+    for planet, data in natal_planets.items():
+        _planet(wheel, planet, data['longitude'], natal_radius, 0.035, '#fff', 1, 8)
+    for planet in TRANSIT_OVERLAY_PLANETS:
+        if planet in transit_planets:
+            _planet(wheel, planet, transit_planets[planet]['longitude'], transit_radius, 0.05, '#FFD700', 2, 10)
+    
+    if natal_ascendant:
+        wheel.text(wheel.polar(natal_ascendant['longitude'], natal_radius - 0.12), 'ASC', 7, '#00FF00',
+                   bold=True, baseline=True)
+    if natal_midheaven:
+        wheel.text(wheel.polar(natal_midheaven['longitude'], natal_radius - 0.12), 'MC', 7, '#FFD700',
+                   bold=True, baseline=True)
+    
+    return wheel.render()
+
+
+# ============== Synastry Chart ==============
+
+def synastry_chart_svg(
+    person1_planets: Dict,
+    person1_houses: Dict,
+    person1_ascendant: Dict,
+    person1_midheaven: Dict,
+    person2_planets: Dict,
+    person2_houses: Dict,
+    person2_ascendant: Dict,
+    person2_midheaven: Dict,
+    person1_name: str = "Person 1",
+    person2_name: str = "Person 2",
+    show_aspects: bool = True,
+    show_houses: bool = True,
+    size: int = DEFAULT_SIZE
+) -> str:
+    """Synastry chart, person 1 inner and person 2 outer (SVG counterpart of create_synastry_chart)"""
+    outer_radius = 1.0
+    person1_radius = 0.45
+    person2_radius = 0.72
+    
+    wheel = SvgWheel(size, 1.25)
+    wheel.title([f'Synastry Chart: {person1_name} & {person2_name}'], 12)
+    wheel.parts.append(_sign_ring(size, 1.25, 1, person2_radius, outer_radius - 0.03, 7))
+    
+    wheel.circle(wheel.xy(0, 0), person1_radius, stroke='#4169E1', width=2)
+    wheel.circle(wheel.xy(0, 0), person2_radius, stroke='#FF69B4', width=2)
+    
+    if show_houses and person1_houses:
+        for house_num in range(1, 13):
+            if house_num in person1_houses:
+                long = person1_houses[house_num]['longitude']
+                wheel.line(wheel.polar(long, person1_radius - 0.05), wheel.polar(long, person1_radius),
+                           '#4169E1', 0.8, opacity=0.5)
+    
+    letters = []
+    if show_aspects:
+        for asp in calculate_synastry_aspects(person1_planets, person2_planets)[:12]:
+            p1, p2 = asp['p1'], asp['p2']
+            if p1 in person1_planets and p2 in person2_planets:
+                config = ASPECT_CONFIG.get(asp['type'], {'color': '#888', 'width': 1})
+                start = wheel.polar(person1_planets[p1]['longitude'], person1_radius)
+                end = wheel.polar(person2_planets[p2]['longitude'], person2_radius)
+                wheel.line(start, end, config['color'], config['width'] + 0.5, opacity=0.8)
+                middle = ((start[0] + end[0]) / 2, (start[1] + end[1]) / 2)
+                letters.append((middle, SYNASTRY_ASPECT_LETTERS.get(asp['type'], '●'), config['color']))
+    
+    for planet, data in person2_planets.items():
+        wheel.text(wheel.polar(data['longitude'], person2_radius + 0.05), f"{planet}2", 6, '#FF69B4', bold=True)
+    for planet, data in person1_planets.items():
+        _planet(wheel, planet, data['longitude'], person1_radius, 0.03, '#4169E1', 1, 7)
+    for planet, data in person2_planets.items():
+        _planet(wheel, planet, data['longitude'], person2_radius, 0.04, '#FF69B4', 1.5, 9)
+    for position, letter, color in letters:
+        wheel.text(position, letter, 10, color, bold=True)
+    
+    if person1_ascendant:
+        wheel.text(wheel.polar(person1_ascendant['longitude'], person1_radius - 0.1), 'ASC1', 6, '#4169E1',
+                   bold=True, baseline=True)
+    if person2_ascendant:
+        wheel.text(wheel.polar(person2_ascendant['longitude'], person2_radius + 0.08), 'ASC2', 6, '#FF69B4',
+                   bold=True, baseline=True)
+    
+    wheel.text(wheel.xy(0, -1.15), f"🔵 {person1_name} (Inner)  |  🔴 {person2_name} (Outer)", 10, '#ccc')
+    
+    return wheel.render()
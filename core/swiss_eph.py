@@ -4,9 +4,13 @@ Core astrological calculations using pyswisseph (Swiss Ephemeris)
 
 import swisseph as swe
 from datetime import datetime, timedelta
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional, Sequence, Union
+import numpy as np
 import pytz
 
+from .aspect_engine import AspectTable, find_aspects
+from .chart_cache import ChartCache, chart_key
+
 
 # Planet constants (Swiss Ephemeris)
 PLANETS = {
@@ -44,20 +48,109 @@ ASPECTS = {
     180: ("Opposition", 12)
 }
 
+ASPECT_TABLE = AspectTable((deg, name, orb) for deg, (name, orb) in ASPECTS.items())
+
+
+def sign_position(longitude: float) -> Dict:
+    """Sign breakdown of an ecliptic longitude"""
+    sign_index = int(longitude / 30) % 12
+    return {
+        'longitude': longitude,
+        'sign': SIGNS[sign_index],
+        'sign_th': SIGNS_TH[sign_index],
+        'degree': longitude % 30,
+        'sign_num': sign_index
+    }
+
+
+_current_ephe_path = None
+
+
+def set_ephe_path(path: str):
+    """swe.set_ephe_path, skipped when the process already uses this path
+    
+    Re-setting the path closes and reopens the ephemeris files, so calculators
+    created per request would otherwise pay for it every time.
+    """
+    global _current_ephe_path
+    if path != _current_ephe_path:
+        swe.set_ephe_path(path)
+        _current_ephe_path = path
+
+
+class HouseFrame:
+    """House cusps and angles (ASC, MC, Vertex) from a single swe.houses call"""
+    
+    def __init__(self, jd: float, latitude: float, longitude: float, hsys: bytes = b'P'):
+        cusps, ascmc = swe.houses(jd, latitude, longitude, hsys)
+        
+        self.jd = jd
+        self.latitude = latitude
+        self.longitude = longitude
+        self.hsys = hsys
+        self.cusps = cusps[:12]
+        self.ascmc = ascmc
+    
+    @property
+    def ascendant(self) -> float:
+        """Ascendant longitude"""
+        return self.ascmc[0]
+    
+    @property
+    def midheaven(self) -> float:
+        """Midheaven (MC) longitude"""
+        return self.ascmc[1]
+    
+    @property
+    def vertex(self) -> float:
+        """Vertex longitude"""
+        return self.ascmc[3]
+    
+    def get_ascendant(self) -> Dict:
+        """Ascendant with sign details"""
+        return sign_position(self.ascendant)
+    
+    def get_midheaven(self) -> Dict:
+        """Midheaven with sign details"""
+        return sign_position(self.midheaven)
+    
+    def get_vertex(self) -> Dict:
+        """Vertex with sign details"""
+        return sign_position(self.vertex)
+    
+    def get_houses(self) -> Dict:
+        """All 12 house cusps with sign details, keyed 1-12"""
+        return {i + 1: sign_position(cusp) for i, cusp in enumerate(self.cusps)}
+
 
 class SwissEphemerisCalculator:
     """High-precision astrological calculations using Swiss Ephemeris"""
     
-    def __init__(self, ephe_path: str = None):
-        """Initialize calculator"""
-        if ephe_path:
-            swe.set_ephe_path(ephe_path)
-        else:
+    def __init__(self, ephe_path: str = None, chebyshev: Optional["ChebyshevEphemeris"] = None,
+                 cache: Optional[ChartCache] = None):
+        """Initialize calculator
+        
+        With ``chebyshev`` (a ``core.chebyshev_eph.ChebyshevEphemeris`` table) planet positions
+        inside the table's date range are interpolated instead of calling
+        swe.calc_ut; dates or bodies outside it fall back to Swiss Ephemeris.
+        
+        With ``cache`` (a ``core.chart_cache.ChartCache``) ``calculate_all``
+        results are memoized by UT time, rounded coordinates and settings.
+        """
+        if not ephe_path:
             # Try default path
-            swe.set_ephe_path('/Users/weeris/.openclaw/workspace/projects/swiss_horoscope/data/ephe')
+            ephe_path = '/Users/weeris/.openclaw/workspace/projects/swiss_horoscope/data/ephe'
+        set_ephe_path(ephe_path)
+        self.ephe_path = ephe_path
         
         # Set standard flags (high precision)
         self.flags = swe.FLG_SWIEPH | swe.FLG_SPEED
+        self.house_system = b'P'  # Placidus
+        
+        if chebyshev is not None and chebyshev.flags != self.flags:
+            raise ValueError("Chebyshev table was built with different calculation flags")
+        self.chebyshev = chebyshev
+        self.cache = cache
     
     def jd_from_datetime(self, dt: datetime) -> float:
         """Convert datetime to Julian Day"""
@@ -70,14 +163,39 @@ class SwissEphemerisCalculator:
         jd = 2440587.5 + unix / 86400.0
         return jd
     
-    def get_planet_position(self, jd: float, planet_id: int) -> Dict:
-        """Get position of a single planet"""
+    def calc_body(self, jd: float, planet_id: int) -> Tuple[float, float, float, float]:
+        """(longitude, latitude, distance, speed) of one body"""
+        if self.chebyshev is not None and self.chebyshev.covers(jd, planet_id):
+            return self.chebyshev.position(jd, planet_id)
         result = swe.calc_ut(jd, planet_id, self.flags)
         
         longitude = result[0][0]  # Ecliptic longitude
         latitude = result[0][1]  # Ecliptic latitude
         distance = result[0][2]   # Distance in AU
         speed = result[0][3]     # Speed in longitude
+        return longitude, latitude, distance, speed
+    
+    def birth_jd(self, year: int, month: int, day: int, hour: int, minute: int,
+                 timezone: str = "Asia/Bangkok") -> float:
+        """UT Julian Day of a local birth time"""
+        # Create datetime
+        dt = datetime(year, month, day, hour, minute)
+        
+        # Convert to UTC from timezone
+        try:
+            tz = pytz.timezone(timezone)
+            dt_local = tz.localize(dt)
+            dt_utc = dt_local.astimezone(pytz.utc)
+        except:
+            # Fallback: assume local = UTC offset
+            dt_utc = dt
+        
+        # Get Julian Day
+        return self.jd_from_datetime(dt_utc)
+    
+    def get_planet_position(self, jd: float, planet_id: int) -> Dict:
+        """Get position of a single planet"""
+        longitude, latitude, distance, speed = self.calc_body(jd, planet_id)
         
         # Determine sign
         sign_index = int(longitude / 30) % 12
@@ -98,94 +216,48 @@ class SwissEphemerisCalculator:
             'retrograde': retrograde
         }
     
-    def get_ascendant(self, jd: float, latitude: float, longitude: float) -> Dict:
+    def get_house_frame(self, jd: float, latitude: float, longitude: float) -> "HouseFrame":
+        """Compute house cusps and angles once for a moment and place"""
+        return HouseFrame(jd, latitude, longitude, self.house_system)
+    
+    def get_ascendant(self, jd: float, latitude: float, longitude: float,
+                      frame: Optional["HouseFrame"] = None) -> Dict:
         """Calculate Ascendant using house cusps"""
-        # Get house cusps
-        hsys = b'P'  # Placidus
-        cusps, ascmc = swe.houses(jd, latitude, longitude, hsys)
-        
-        asc_longitude = ascmc[0]  # Ascendant longitude
-        
-        sign_index = int(asc_longitude / 30) % 12
-        degree_in_sign = asc_longitude % 30
-        
-        return {
-            'longitude': asc_longitude,
-            'sign': SIGNS[sign_index],
-            'sign_th': SIGNS_TH[sign_index],
-            'degree': degree_in_sign,
-            'sign_num': sign_index
-        }
+        if frame is None:
+            frame = self.get_house_frame(jd, latitude, longitude)
+        return frame.get_ascendant()
     
-    def get_midheaven(self, jd: float, latitude: float, longitude: float) -> Dict:
+    def get_midheaven(self, jd: float, latitude: float, longitude: float,
+                      frame: Optional["HouseFrame"] = None) -> Dict:
         """Calculate Midheaven (MC) using house cusps"""
-        hsys = b'P'  # Placidus
-        cusps, ascmc = swe.houses(jd, latitude, longitude, hsys)
-        
-        mc_longitude = ascmc[1]  # Midheaven longitude
-        
-        sign_index = int(mc_longitude / 30) % 12
-        degree_in_sign = mc_longitude % 30
-        
-        return {
-            'longitude': mc_longitude,
-            'sign': SIGNS[sign_index],
-            'sign_th': SIGNS_TH[sign_index],
-            'degree': degree_in_sign,
-            'sign_num': sign_index
-        }
+        if frame is None:
+            frame = self.get_house_frame(jd, latitude, longitude)
+        return frame.get_midheaven()
     
-    def get_houses(self, jd: float, latitude: float, longitude: float) -> Dict:
+    def get_houses(self, jd: float, latitude: float, longitude: float,
+                   frame: Optional["HouseFrame"] = None) -> Dict:
         """Get all 12 house cusps"""
-        hsys = b'P'  # Placidus
-        cusps, ascmc = swe.houses(jd, latitude, longitude, hsys)
-        
-        houses = {}
-        for i in range(12):
-            cusp_longitude = cusps[i]
-            sign_index = int(cusp_longitude / 30) % 12
-            degree_in_sign = cusp_longitude % 30
-            
-            houses[i + 1] = {
-                'longitude': cusp_longitude,
-                'sign': SIGNS[sign_index],
-                'sign_th': SIGNS_TH[sign_index],
-                'degree': degree_in_sign,
-                'sign_num': sign_index
-            }
-        
-        return houses
+        if frame is None:
+            frame = self.get_house_frame(jd, latitude, longitude)
+        return frame.get_houses()
     
     def get_aspects(self, positions: Dict, orb_limit: float = 8.0) -> List[Dict]:
         """Calculate aspects between planets"""
-        aspects = []
         planets = list(positions.keys())
+        hits = find_aspects([positions[p]['longitude'] for p in planets], table=ASPECT_TABLE)
         
-        for i, p1 in enumerate(planets):
-            for p2 in planets[i+1:]:
-                long1 = positions[p1]['longitude']
-                long2 = positions[p2]['longitude']
-                
-                # Calculate angular distance
-                diff = abs(long1 - long2)
-                if diff > 180:
-                    diff = 360 - diff
-                
-                # Check each aspect
-                for aspect_deg, (aspect_name, max_orb) in ASPECTS.items():
-                    orb = abs(diff - aspect_deg)
-                    if orb <= max_orb:
-                        aspects.append({
-                            'p1': p1,
-                            'p2': p2,
-                            'type': aspect_name,
-                            'angle': aspect_deg,
-                            'orb': orb,
-                            'exact': orb < 1.0
-                        })
-        
-        # Sort by orb (most exact first)
-        aspects.sort(key=lambda x: x['orb'])
+        # Sorted by orb (most exact first)
+        aspects = []
+        for i, j, k, orb in zip(hits['i'].tolist(), hits['j'].tolist(),
+                                hits['aspect'].tolist(), hits['orb'].tolist()):
+            aspects.append({
+                'p1': planets[i],
+                'p2': planets[j],
+                'type': ASPECT_TABLE.names[k],
+                'angle': ASPECT_TABLE.raw_angles[k],
+                'orb': orb,
+                'exact': orb < 1.0
+            })
         
         return aspects
     
@@ -201,20 +273,23 @@ class SwissEphemerisCalculator:
         timezone: str = "Asia/Bangkok"
     ) -> Dict:
         """Calculate full birth chart"""
-        # Create datetime
-        dt = datetime(year, month, day, hour, minute)
+        jd = self.birth_jd(year, month, day, hour, minute, timezone)
         
-        # Convert to UTC from timezone
-        try:
-            tz = pytz.timezone(timezone)
-            dt_local = tz.localize(dt)
-            dt_utc = dt_local.astimezone(pytz.utc)
-        except:
-            # Fallback: assume local = UTC offset
-            dt_utc = dt
+        subject = {
+            'name': 'User',
+            'date_time': f"{year}-{month:02d}-{day:02d} {hour:02d}:{minute:02d}",
+            'latitude': latitude,
+            'longitude': longitude,
+            'timezone': timezone,
+            'jd': jd
+        }
         
-        # Get Julian Day
-        jd = self.jd_from_datetime(dt_utc)
+        key = None
+        if self.cache is not None:
+            key = self.chart_cache_key(jd, latitude, longitude)
+            cached = self.cache.get(key)
+            if cached is not None:
+                return {'subject': subject, **cached}
         
         # Calculate all planet positions
         positions = {}
@@ -234,29 +309,191 @@ class SwissEphemerisCalculator:
                 'retrograde': True
             }
         
-        # Calculate houses
-        asc = self.get_ascendant(jd, latitude, longitude)
-        mc = self.get_midheaven(jd, latitude, longitude)
-        houses = self.get_houses(jd, latitude, longitude)
+        # Calculate houses (one swe.houses call shared by ASC, MC and cusps)
+        frame = self.get_house_frame(jd, latitude, longitude)
+        asc = self.get_ascendant(jd, latitude, longitude, frame=frame)
+        mc = self.get_midheaven(jd, latitude, longitude, frame=frame)
+        houses = self.get_houses(jd, latitude, longitude, frame=frame)
         
         # Calculate aspects
         aspects = self.get_aspects(positions)
         
-        return {
-            'subject': {
-                'name': 'User',
-                'date_time': f"{year}-{month:02d}-{day:02d} {hour:02d}:{minute:02d}",
-                'latitude': latitude,
-                'longitude': longitude,
-                'timezone': timezone,
-                'jd': jd
-            },
+        chart = {
             'planets': positions,
             'ascendant': asc,
             'midheaven': mc,
             'houses': houses,
             'aspects': aspects
         }
+        if key is not None:
+            self.cache.put(key, chart)
+        
+        return {'subject': subject, **chart}
+    
+    def chart_cache_key(self, jd: float, latitude: float, longitude: float) -> str:
+        """Cache key of a chart under this calculator's settings"""
+        source = 'swe'
+        if self.chebyshev is not None and self.chebyshev.start_jd <= jd <= self.chebyshev.end_jd:
+            source = f"cheb:{self.chebyshev.start_jd}:{self.chebyshev.end_jd}"
+        return chart_key(jd, latitude, longitude, self.house_system, self.flags, self.ephe_path, source)
+    
+    def calculate_chart(
+        self,
+        year: int,
+        month: int,
+        day: int,
+        hour: int,
+        minute: int,
+        latitude: float,
+        longitude: float,
+        timezone: str = "Asia/Bangkok"
+    ) -> "Chart":
+        """Full birth chart as a compact ``core.chart.Chart``
+        
+        Same values as ``calculate_all``, held in NumPy arrays (about a tenth of
+        the memory); the result still reads like the ``calculate_all`` dict.
+        """
+        from .chart import BODY_NAMES, Chart
+        
+        jd = self.birth_jd(year, month, day, hour, minute, timezone)
+        subject = {
+            'name': 'User',
+            'date_time': f"{year}-{month:02d}-{day:02d} {hour:02d}:{minute:02d}",
+            'latitude': latitude,
+            'longitude': longitude,
+            'timezone': timezone,
+            'jd': jd
+        }
+        
+        key = None
+        if self.cache is not None:
+            key = self.chart_cache_key(jd, latitude, longitude) + ':chart'
+            cached = self.cache.get(key)
+            if cached is not None:
+                cached.set_subject(subject)
+                return cached
+        
+        bodies = []
+        for name in BODY_NAMES:
+            if name == 'South Node':
+                # Opposite the North Node, no latitude/distance/speed of its own
+                nan = float('nan')
+                bodies.append(((bodies[BODY_NAMES.index('North Node')][0] + 180) % 360, nan, nan, nan))
+            else:
+                bodies.append(self.calc_body(jd, PLANETS[name]))
+        bodies = np.array(bodies, dtype=np.float64)
+        
+        frame = self.get_house_frame(jd, latitude, longitude)
+        hits = find_aspects(bodies[:, 0], table=ASPECT_TABLE)
+        chart = Chart(subject, bodies, frame.cusps, (frame.ascendant, frame.midheaven), hits)
+        if key is not None:
+            self.cache.put(key, chart)
+        return chart
+    
+    def calculate_many(
+        self,
+        datetimes: Sequence[datetime],
+        latitudes: Sequence[float],
+        longitudes: Sequence[float],
+        timezones: Union[str, Sequence[str]] = "Asia/Bangkok"
+    ) -> Dict:
+        """Calculate many birth charts in one call (columnar in, columnar out)
+        
+        ``datetimes`` are local birth times interpreted exactly like the
+        arguments of ``calculate_all``; ``timezones`` is either one zone name
+        for every row or one name per row. Returns numpy arrays: ``jd``,
+        per-planet ``longitude``/``latitude``/``distance``/``speed``/
+        ``sign_num``/``retrograde``, ``ascendant``/``midheaven`` longitude and
+        sign, and ``cusps``/``cusp_sign_num`` with shape ``(n, 12)``.
+        Values are identical to the corresponding ``calculate_all`` fields.
+        """
+        def sign_nums(values: np.ndarray) -> np.ndarray:
+            return ((values / 30).astype(np.int64) % 12).astype(np.int8)
+        
+        n = len(datetimes)
+        if isinstance(timezones, str):
+            timezones = [timezones] * n
+        if not (len(latitudes) == len(longitudes) == len(timezones) == n):
+            raise ValueError("datetimes, latitudes, longitudes and timezones must have the same length")
+        
+        # Julian Days (same conversion as calculate_all / jd_from_datetime)
+        tz_cache = {}
+        timestamps = np.empty(n)
+        for i, (dt, tz_name) in enumerate(zip(datetimes, timezones)):
+            if dt.tzinfo is None:
+                try:
+                    tz = tz_cache.get(tz_name)
+                    if tz is None:
+                        tz = tz_cache[tz_name] = pytz.timezone(tz_name)
+                    dt = tz.localize(dt)
+                except:
+                    dt = pytz.utc.localize(dt)
+            timestamps[i] = dt.timestamp()
+        jds = 2440587.5 + timestamps / 86400.0
+        
+        # Planets: bodies covered by the Chebyshev table are evaluated in one vectorized
+        # lookup, the rest need one swe call per row (visited in time order so
+        # consecutive calls stay close together). The South Node is derived from the North Node.
+        bodies = [(name, planet_id) for name, planet_id in PLANETS.items() if name != 'South Node']
+        raw = np.empty((len(bodies), n, 4))
+        calc_ut = swe.calc_ut
+        flags = self.flags
+        order = np.argsort(jds, kind='stable').tolist()
+        jd_list = jds.tolist()
+        live = []
+        for b, (_, planet_id) in enumerate(bodies):
+            if self.chebyshev is not None and self.chebyshev.covers(jds, planet_id):
+                raw[b] = self.chebyshev.evaluate(planet_id, jds)
+            else:
+                live.append((b, planet_id))
+        if live:
+            for i in order:
+                jd = jd_list[i]
+                for b, planet_id in live:
+                    raw[b, i] = calc_ut(jd, planet_id, flags)[0][:4]
+        
+        planets = {}
+        for b, (name, _) in enumerate(bodies):
+            lon = raw[b, :, 0]
+            planets[name] = {
+                'longitude': lon,
+                'latitude': raw[b, :, 1],
+                'distance': raw[b, :, 2],
+                'speed': raw[b, :, 3],
+                'sign_num': sign_nums(lon),
+                'retrograde': raw[b, :, 3] < 0
+            }
+        
+        if 'North Node' in planets:
+            nn = planets['North Node']
+            shifted = nn['longitude'] + 180
+            planets['South Node'] = {
+                'longitude': shifted % 360,
+                'latitude': -nn['latitude'],
+                'distance': nn['distance'],
+                'speed': nn['speed'],
+                'sign_num': sign_nums(shifted),
+                'retrograde': np.ones(n, dtype=bool)
+            }
+        
+        # Houses
+        cusps = np.empty((n, 12))
+        angles = np.empty((n, 2))
+        lats = np.asarray(latitudes, dtype=float).tolist()
+        lons = np.asarray(longitudes, dtype=float).tolist()
+        for i in order:
+            frame = self.get_house_frame(jd_list[i], lats[i], lons[i])
+            cusps[i] = frame.cusps
+            angles[i] = (frame.ascendant, frame.midheaven)
+        
+        return {
+            'jd': jds,
+            'planets': planets,
+            'ascendant': {'longitude': angles[:, 0], 'sign_num': sign_nums(angles[:, 0])},
+            'midheaven': {'longitude': angles[:, 1], 'sign_num': sign_nums(angles[:, 1])},
+            'cusps': cusps,
+            'cusp_sign_num': sign_nums(cusps)
+        }
     
     def get_zodiac_sign(self, month: int, day: int) -> Tuple[str, str]:
         """Quick Western zodiac lookup (for simple sun sign)"""
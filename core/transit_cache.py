@@ -0,0 +1,142 @@
+"""
+Process-wide transit cache
+Current planet positions are the same for every user within a minute, so they are computed once per time bucket
+
+Entries are keyed by (time bucket, swe flags, body set) and hold raw
+(longitude, speed) pairs; callers build their own dicts from them, so cached
+values are never shared mutable state. Positions are computed at the start of
+the bucket, which keeps results independent of which request arrived first.
+
+The default bucket is 60 s, matching the minute resolution the transit
+functions already use, so cached and uncached results agree.
+"""
+
+import math
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Tuple
+
+import swisseph as swe
+
+from .ephemeris_cache import calc_longitude_speed
+
+
+DEFAULT_BUCKET_SECONDS = 60
+DEFAULT_MAXSIZE = 256
+DEFAULT_TTL = 600.0
+
+ENV_BUCKET = 'SWISS_HOROSCOPE_TRANSIT_BUCKET'
+
+
+class TransitCache:
+    """Thread-safe LRU + TTL cache of planet positions per UT time bucket"""
+    
+    def __init__(self, bucket_seconds: int = DEFAULT_BUCKET_SECONDS,
+                 maxsize: int = DEFAULT_MAXSIZE, ttl: Optional[float] = DEFAULT_TTL):
+        """Positions are shared within ``bucket_seconds``; ``ttl`` of None never expires"""
+        if bucket_seconds <= 0:
+            raise ValueError("bucket_seconds must be positive")
+        self.bucket_seconds = bucket_seconds
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def bucket(self, jd: float) -> int:
+        """Time bucket index of a Julian Day"""
+        # The epsilon keeps minute-aligned Julian Days out of the previous bucket
+        return math.floor(jd * 86400.0 / self.bucket_seconds + 1e-6)
+    
+    def bucket_jd(self, bucket: int) -> float:
+        """Julian Day at the start of a bucket"""
+        return bucket * self.bucket_seconds / 86400.0
+    
+    def positions(
+        self,
+        jd: float,
+        bodies: Dict[str, int],
+        flags: int,
+        compute: Optional[Callable[[float, int, int], Tuple[float, float]]] = None
+    ) -> Dict[str, Tuple[float, float]]:
+        """(longitude, speed) per body name for the bucket containing ``jd``"""
+        bucket = self.bucket(jd)
+        key = (bucket, flags, tuple(bodies.items()))
+        now = time.monotonic()
+        
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (self.ttl is None or now - entry[0] < self.ttl):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return dict(entry[1])
+            self.misses += 1
+        
+        # Computed outside the lock; a concurrent miss on the same key just recomputes
+        compute = compute or calc_longitude_speed
+        bucket_jd = self.bucket_jd(bucket)
+        value = {name: compute(bucket_jd, body, flags) for name, body in bodies.items()}
+        
+        with self._lock:
+            self._entries[key] = (now, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return dict(value)
+    
+    def clear(self):
+        """Drop every entry and reset the counters"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+    
+    def stats(self) -> Dict:
+        """Hit/miss counters and current size"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'size': len(self._entries),
+                'hit_rate': self.hits / total if total else 0.0,
+                'bucket_seconds': self.bucket_seconds
+            }
+
+
+# ============== Shared Instance ==============
+
+_shared_cache = None
+_shared_lock = threading.Lock()
+
+
+def get_transit_cache() -> TransitCache:
+    """Process-wide cache (bucket size from $SWISS_HOROSCOPE_TRANSIT_BUCKET, default 60 s)"""
+    global _shared_cache
+    if _shared_cache is None:
+        with _shared_lock:
+            if _shared_cache is None:
+                bucket = int(os.environ.get(ENV_BUCKET, DEFAULT_BUCKET_SECONDS))
+                _shared_cache = TransitCache(bucket_seconds=bucket)
+    return _shared_cache
+
+
+def configure_transit_cache(bucket_seconds: int = DEFAULT_BUCKET_SECONDS,
+                            maxsize: int = DEFAULT_MAXSIZE,
+                            ttl: Optional[float] = DEFAULT_TTL) -> TransitCache:
+    """Replace the process-wide cache with new settings"""
+    global _shared_cache
+    with _shared_lock:
+        _shared_cache = TransitCache(bucket_seconds, maxsize, ttl)
+    return _shared_cache
+
+
+def transit_positions(jd: float, bodies: Dict[str, int],
+                      flags: int = swe.FLG_SWIEPH | swe.FLG_SPEED) -> Dict[str, Tuple[float, float]]:
+    """(longitude, speed) per body from the process-wide cache"""
+    return get_transit_cache().positions(jd, bodies, flags)
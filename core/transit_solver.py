@@ -0,0 +1,327 @@
+"""
+Exact-time transit solver
+Finds the UT moments of transit-to-natal aspects, sign ingresses and retrograde stations
+
+Each body is sampled once over the range with ``swe.calc_ut`` + ``FLG_SPEED``
+at a step matched to its speed. Speed sign changes bracket the stations, which
+split the samples into monotone stretches; inside a stretch a target longitude
+is crossed at most once. Crossings are first located on the cubic Hermite
+curve through the samples (positions + speeds) and then polished with one or
+two Newton steps on Swiss Ephemeris itself, so most events cost 1-2 extra
+ephemeris calls.
+"""
+
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+import pytz
+import swisseph as swe
+
+from .aspect_engine import AspectTable
+
+
+TRANSIT_BODIES = {
+    'Sun': swe.SUN, 'Moon': swe.MOON, 'Mercury': swe.MERCURY,
+    'Venus': swe.VENUS, 'Mars': swe.MARS, 'Jupiter': swe.JUPITER,
+    'Saturn': swe.SATURN, 'Uranus': swe.URANUS, 'Neptune': swe.NEPTUNE,
+    'Pluto': swe.PLUTO
+}
+
+# Sampling step in days: small enough that no body can station twice between samples
+SAMPLE_STEPS = {
+    swe.SUN: 4.0, swe.MOON: 0.5, swe.MERCURY: 1.0, swe.VENUS: 2.0, swe.MARS: 3.0,
+    swe.JUPITER: 5.0, swe.SATURN: 5.0, swe.URANUS: 8.0, swe.NEPTUNE: 8.0, swe.PLUTO: 8.0,
+    swe.TRUE_NODE: 0.5
+}
+
+# Typical daily motion in degrees, used to size search windows around "now"
+MEAN_SPEEDS = {
+    swe.SUN: 0.986, swe.MOON: 13.18, swe.MERCURY: 1.38, swe.VENUS: 1.2, swe.MARS: 0.52,
+    swe.JUPITER: 0.083, swe.SATURN: 0.034, swe.URANUS: 0.012, swe.NEPTUNE: 0.006, swe.PLUTO: 0.004
+}
+MAX_WINDOW_DAYS = 400.0
+
+ASPECT_TABLE = AspectTable([
+    (0, "Conjunction", 0),
+    (60, "Sextile", 0),
+    (90, "Square", 0),
+    (120, "Trine", 0),
+    (180, "Opposition", 0)
+])
+
+SIGNS = ["Aries", "Taurus", "Gemini", "Cancer", "Leo", "Virgo",
+         "Libra", "Scorpio", "Sagittarius", "Capricorn", "Aquarius", "Pisces"]
+
+FLAGS = swe.FLG_SWIEPH | swe.FLG_SPEED
+TOL_DEG = 1e-6      # ~0.004 arcsec
+TOL_DAYS = 1e-6     # ~0.1 s
+MAX_ITER = 20
+
+UNIX_EPOCH_JD = 2440587.5
+
+
+def jd_to_datetime(jd: float) -> datetime:
+    """UT Julian Day to an aware UTC datetime, rounded to the millisecond
+    
+    A float JD near 2.46e6 only resolves ~40 microseconds; without rounding,
+    midnight can come back as 23:59:59.99998 of the previous day.
+    """
+    ms = round((jd - UNIX_EPOCH_JD) * 86400000.0)
+    return datetime(1970, 1, 1, tzinfo=pytz.utc) + timedelta(milliseconds=ms)
+
+
+def datetime_to_jd(dt: datetime) -> float:
+    """Datetime (naive = UTC) to UT Julian Day"""
+    if dt.tzinfo is None:
+        dt = pytz.utc.localize(dt)
+    return UNIX_EPOCH_JD + dt.timestamp() / 86400.0
+
+
+def _wrap180(angle):
+    """Signed angle in [-180, 180)"""
+    return (angle + 180) % 360 - 180
+
+
+def _calc(jd: float, body: int):
+    """(longitude, speed) straight from Swiss Ephemeris"""
+    result = swe.calc_ut(jd, body, FLAGS)
+    return result[0][0], result[0][3]
+
+
+class BodyTrack:
+    """Samples of one body over a range, split into monotone stretches at stations"""
+    
+    def __init__(self, body: int, start_jd: float, end_jd: float, step: Optional[float] = None):
+        """Sample the body and locate its stations"""
+        self.body = body
+        self.start_jd = start_jd
+        self.end_jd = end_jd
+        step = step or SAMPLE_STEPS.get(body, 1.0)
+        
+        n = max(int(np.ceil((end_jd - start_jd) / step)), 1) + 1
+        jds = np.linspace(start_jd, end_jd, n)
+        samples = np.array([_calc(jd, body) for jd in jds.tolist()])
+        lon, speed = samples[:, 0], samples[:, 1]
+        
+        # Stations: speed changes sign between two samples
+        self.stations = []
+        flips = np.nonzero(np.sign(speed[:-1]) * np.sign(speed[1:]) < 0)[0]
+        points = [(jds[i], lon[i], speed[i]) for i in range(n)]
+        inserted = 0
+        for i in flips.tolist():
+            jd = self._refine_station(*map(float, (jds[i], jds[i + 1], speed[i], speed[i + 1])))
+            s_lon, s_speed = _calc(jd, body)
+            self.stations.append({
+                'jd': jd,
+                'longitude': s_lon,
+                'type': 'retrograde' if speed[i] > 0 else 'direct'
+            })
+            points.insert(i + 1 + inserted, (jd, s_lon, 0.0))
+            inserted += 1
+        
+        pts = np.array(points)
+        self.jd0, self.jd1 = pts[:-1, 0], pts[1:, 0]
+        self.lon0, self.lon1 = pts[:-1, 1], pts[1:, 1]
+        self.speed0, self.speed1 = pts[:-1, 2], pts[1:, 2]
+        self.motion = _wrap180(self.lon1 - self.lon0)
+    
+    def _refine_station(self, lo: float, hi: float, f_lo: float, f_hi: float) -> float:
+        """Root of speed inside [lo, hi] (Illinois false position)"""
+        side = 0
+        for _ in range(60):
+            t = hi - f_hi * (hi - lo) / (f_hi - f_lo)
+            _, f = _calc(t, self.body)
+            if f == 0 or hi - lo < TOL_DAYS:
+                return t
+            if (f > 0) == (f_hi > 0):
+                hi, f_hi = t, f
+                if side == -1:
+                    f_lo /= 2
+                side = -1
+            else:
+                lo, f_lo = t, f
+                if side == 1:
+                    f_hi /= 2
+                side = 1
+        return t
+    
+    def crossings(self, targets) -> List[tuple]:
+        """Exact moments the body reaches each target longitude
+        
+        Returns (jd, target index, longitude, speed) tuples in time order.
+        """
+        targets = np.atleast_1d(np.asarray(targets, dtype=float))
+        if not len(targets) or not len(self.jd0):
+            return []
+        
+        d0 = _wrap180(self.lon0[:, None] - targets[None, :])
+        d1 = d0 + self.motion[:, None]
+        hit = ((d0 < 0) & (d1 >= 0)) | ((d0 > 0) & (d1 <= 0))
+        seg, idx = np.nonzero(hit)
+        if not len(seg):
+            return []
+        
+        # Initial guess from the cubic Hermite curve through the two samples
+        h = self.jd1[seg] - self.jd0[seg]
+        y0, y1 = d0[seg, idx], d1[seg, idx]
+        m0, m1 = self.speed0[seg] * h, self.speed1[seg] * h
+        u = np.clip(y0 / (y0 - y1), 0.0, 1.0)
+        for _ in range(4):
+            u2, u3 = u * u, u * u * u
+            value = (2 * u3 - 3 * u2 + 1) * y0 + (u3 - 2 * u2 + u) * m0 + (3 * u2 - 2 * u3) * y1 + (u3 - u2) * m1
+            slope = (6 * u2 - 6 * u) * y0 + (3 * u2 - 4 * u + 1) * m0 + (6 * u - 6 * u2) * y1 + (3 * u2 - 2 * u) * m1
+            u = np.clip(u - value / np.where(slope == 0, np.inf, slope), 0.0, 1.0)
+        guesses = self.jd0[seg] + u * h
+        
+        events = []
+        for s, k, guess, start_sign in zip(seg.tolist(), idx.tolist(), guesses.tolist(), np.sign(y0).tolist()):
+            jd, lon, speed = self._polish(float(targets[k]), float(self.jd0[s]), float(self.jd1[s]),
+                                          guess, start_sign)
+            events.append((jd, k, lon, speed))
+        events.sort()
+        return events
+    
+    def _polish(self, target: float, lo: float, hi: float, t: float, start_sign: float):
+        """Safeguarded Newton iteration on Swiss Ephemeris longitude"""
+        for _ in range(MAX_ITER):
+            lon, speed = _calc(t, self.body)
+            f = _wrap180(lon - target)
+            if abs(f) < TOL_DEG:
+                break
+            if (f > 0) == (start_sign > 0):
+                lo = t
+            else:
+                hi = t
+            t_new = t - f / speed if speed else (lo + hi) / 2
+            if not lo <= t_new <= hi:
+                t_new = (lo + hi) / 2
+            if abs(t_new - t) < TOL_DAYS:
+                t = t_new
+                lon, speed = _calc(t, self.body)
+                break
+            t = t_new
+        return t, lon, speed
+
+
+# ============== Event Finders ==============
+
+def find_stations(body: int, start_jd: float, end_jd: float, name: Optional[str] = None,
+                  track: Optional[BodyTrack] = None) -> List[Dict]:
+    """Retrograde and direct stations of one body"""
+    track = track or BodyTrack(body, start_jd, end_jd)
+    events = []
+    for st in track.stations:
+        sign_num = int(st['longitude'] / 30) % 12
+        events.append({
+            'event': 'station',
+            'jd': st['jd'],
+            'datetime': jd_to_datetime(st['jd']),
+            'planet': name or swe.get_planet_name(body),
+            'type': st['type'],
+            'longitude': st['longitude'],
+            'sign': SIGNS[sign_num],
+            'degree': st['longitude'] % 30
+        })
+    return events
+
+
+def find_ingresses(body: int, start_jd: float, end_jd: float, name: Optional[str] = None,
+                   track: Optional[BodyTrack] = None) -> List[Dict]:
+    """Sign ingresses (including retrograde re-entries) of one body"""
+    track = track or BodyTrack(body, start_jd, end_jd)
+    events = []
+    for jd, k, lon, speed in track.crossings(np.arange(12) * 30.0):
+        sign_num = k if speed >= 0 else (k - 1) % 12
+        events.append({
+            'event': 'ingress',
+            'jd': jd,
+            'datetime': jd_to_datetime(jd),
+            'planet': name or swe.get_planet_name(body),
+            'sign': SIGNS[sign_num],
+            'from_sign': SIGNS[(sign_num - 1) % 12 if speed >= 0 else (sign_num + 1) % 12],
+            'retrograde': speed < 0
+        })
+    return events
+
+
+def find_aspect_times(body: int, natal_planets: Dict, start_jd: float, end_jd: float,
+                      name: Optional[str] = None, table: AspectTable = ASPECT_TABLE,
+                      track: Optional[BodyTrack] = None) -> List[Dict]:
+    """Exact moments a transiting body perfects each aspect to each natal point"""
+    track = track or BodyTrack(body, start_jd, end_jd)
+    
+    # Every aspect is two target longitudes (natal +/- angle), one for 0 and 180
+    targets, meta = [], []
+    for natal_name, data in natal_planets.items():
+        n_lon = data['longitude']
+        for k, angle in enumerate(table.angles.tolist()):
+            offsets = [angle] if angle in (0.0, 180.0) else [angle, -angle]
+            for offset in offsets:
+                targets.append((n_lon + offset) % 360)
+                meta.append((natal_name, k))
+    
+    events = []
+    for jd, t, lon, speed in track.crossings(targets):
+        natal_name, k = meta[t]
+        events.append({
+            'event': 'aspect',
+            'jd': jd,
+            'datetime': jd_to_datetime(jd),
+            'transiting': name or swe.get_planet_name(body),
+            'natal': natal_name,
+            'type': table.names[k],
+            'angle': table.raw_angles[k],
+            'transit_longitude': lon,
+            'retrograde': speed < 0
+        })
+    return events
+
+
+def find_transit_events(
+    natal_planets: Dict,
+    start_jd: float,
+    end_jd: float,
+    bodies: Optional[Dict[str, int]] = None,
+    kinds: Iterable[str] = ('aspect', 'ingress', 'station')
+) -> List[Dict]:
+    """All aspect perfections, ingresses and stations in [start_jd, end_jd], in time order"""
+    bodies = bodies or TRANSIT_BODIES
+    kinds = set(kinds)
+    
+    events = []
+    for name, body in bodies.items():
+        track = BodyTrack(body, start_jd, end_jd)
+        if 'station' in kinds:
+            events.extend(find_stations(body, start_jd, end_jd, name, track))
+        if 'ingress' in kinds:
+            events.extend(find_ingresses(body, start_jd, end_jd, name, track))
+        if 'aspect' in kinds and natal_planets:
+            events.extend(find_aspect_times(body, natal_planets, start_jd, end_jd, name, track=track))
+    
+    events.sort(key=lambda e: e['jd'])
+    return events
+
+
+def find_nearest_perfection(body: int, target_longitude: float, around_jd: float,
+                            window_days: float) -> Optional[float]:
+    """Exact moment closest to ``around_jd`` when the body reaches a longitude"""
+    track = BodyTrack(body, around_jd - window_days, around_jd + window_days)
+    hits = track.crossings([target_longitude])
+    if not hits:
+        return None
+    return min((h[0] for h in hits), key=lambda jd: abs(jd - around_jd))
+
+
+def find_aspect_perfection(body: int, transit_longitude: float, natal_longitude: float,
+                           angle: float, orb: float, around_jd: float) -> Optional[float]:
+    """Exact moment of the perfection of a transit aspect that is currently in orb
+    
+    Picks the side of the natal point (natal +/- angle) the body is nearest to and
+    searches a window sized from the orb and the body's typical speed, so slow
+    outer planets and retrograde loops are still bracketed.
+    """
+    candidates = [(natal_longitude + angle) % 360, (natal_longitude - angle) % 360]
+    target = min(candidates, key=lambda t: abs(_wrap180(transit_longitude - t)))
+    window = min((orb + 1) / MEAN_SPEEDS.get(body, 1.0) * 1.5 + 1, MAX_WINDOW_DAYS)
+    return find_nearest_perfection(body, target, around_jd, window)
@@ -0,0 +1,171 @@
+"""
+Chart wheel data shared by the renderers
+Glyphs, palettes, aspect tables and the transit / synastry lookups used by
+core.chart_wheel (matplotlib) and core.svg_chart, kept free of any plotting
+library so the SVG renderer and the API never import one
+"""
+
+import numpy as np
+from typing import Dict, List, Tuple
+from datetime import datetime
+import swisseph as swe
+import pytz
+
+from .aspect_engine import AspectTable, find_aspects
+from .transit_cache import transit_positions
+
+# Planet glyphs and colors
+PLANET_GLYPHS = {
+    'Sun': '☉', 'Moon': '☽', 'Mercury': '☿', 'Venus': '♀', 'Mars': '♂',
+    'Jupiter': '♃', 'Saturn': '♄', 'Uranus': '⛢', 'Neptune': '♆',
+    'Pluto': '♇', 'North Node': '☊', 'South Node': '☋',
+    'Chiron': '⚷', 'Ceres': '⚵', 'Pallas': '⚶', 'Juno': '⚳', 'Vesta': '⚴'
+}
+
+PLANET_COLORS = {
+    'Sun': '#FFD700', 'Moon': '#C0C0C0', 'Mercury': '#A9A9A9', 'Venus': '#FFA500',
+    'Mars': '#FF4500', 'Jupiter': '#DAA520', 'Saturn': '#D2691E', 'Uranus': '#40E0D0',
+    'Neptune': '#4169E1', 'Pluto': '#8B4513', 'North Node': '#FF69B4', 'South Node': '#FFB6C1',
+    'Chiron': '#9370DB', 'Ceres': '#98FB98', 'Pallas': '#DDA0DD', 'Juno': '#F0E68C', 'Vesta': '#E6E6FA'
+}
+
+# Sign colors
+SIGN_COLORS = {
+    'Aries': '#FF6B6B', 'Taurus': '#4ECDC4', 'Gemini': '#FFE66D', 'Cancer': '#95E1D3',
+    'Leo': '#F38181', 'Virgo': '#AA96DA', 'Libra': '#FCBAD3', 'Scorpio': '#A8D8EA',
+    'Sagittarius': '#FF9F43', 'Capricorn': '#6C5CE7', 'Aquarius': '#74B9FF', 'Pisces': '#DFE6E9'
+}
+
+ELEMENT_COLORS = {
+    'Fire': '#FF6B6B', 'Earth': '#4ECDC4', 'Air': '#FFE66D', 'Water': '#74B9FF'
+}
+
+SIGN_GLYPHS = {'Aries': '♈', 'Taurus': '♉', 'Gemini': '♊', 'Cancer': '♋',
+               'Leo': '♌', 'Virgo': '♍', 'Libra': '♎', 'Scorpio': '♏',
+               'Sagittarius': '♐', 'Capricorn': '♑', 'Aquarius': '♒', 'Pisces': '♓'}
+
+BACKGROUND = '#1a1a2e'
+
+# Aspect colors and line styles
+ASPECT_CONFIG = {
+    'Conjunction': {'color': '#FFFFFF', 'width': 2, 'style': '-'},
+    'Opposition': {'color': '#FF6B6B', 'width': 1.5, 'style': '-'},
+    'Square': {'color': '#FF4500', 'width': 1.5, 'style': '-'},
+    'Trine': {'color': '#4ECDC4', 'width': 1.5, 'style': '-'},
+    'Sextile': {'color': '#95E1D3', 'width': 1, 'style': '--'},
+}
+
+
+def normalize_angle(angle: float) -> float:
+    """Normalize angle to 0-360 degrees"""
+    return angle % 360
+
+
+def degree_to_chart_coords(longitude: float, radius: float) -> tuple:
+    """Convert zodiac longitude to chart coordinates."""
+    angle = np.radians(90 - longitude)
+    x = radius * np.cos(angle)
+    y = radius * np.sin(angle)
+    return x, y
+
+
+# ============== Transit Overlay ==============
+
+TRANSIT_PLANETS = {
+    'Sun': swe.SUN, 'Moon': swe.MOON, 'Mercury': swe.MERCURY, 'Venus': swe.VENUS,
+    'Mars': swe.MARS, 'Jupiter': swe.JUPITER, 'Saturn': swe.SATURN,
+    'Uranus': swe.URANUS, 'Neptune': swe.NEPTUNE, 'Pluto': swe.PLUTO
+}
+
+SIGNS = ["Aries", "Taurus", "Gemini", "Cancer", "Leo", "Virgo",
+         "Libra", "Scorpio", "Sagittarius", "Capricorn", "Aquarius", "Pisces"]
+
+
+def get_current_transits(timezone: str = "Asia/Bangkok") -> Dict:
+    """Calculate current planetary positions (transits)"""
+    now = datetime.now(pytz.timezone(timezone))
+    jd = swe.julday(now.year, now.month, now.day, now.hour + now.minute/60.0)
+    flags = swe.FLG_SWIEPH | swe.FLG_SPEED
+    
+    transits = {}
+    for name, (longitude, speed) in transit_positions(jd, TRANSIT_PLANETS, flags).items():
+        sign_num = int(longitude / 30) % 12
+        degree = longitude % 30
+        
+        transits[name] = {
+            'longitude': longitude,
+            'sign': SIGNS[sign_num],
+            'degree': degree,
+            'sign_num': sign_num,
+            'speed': speed
+        }
+    
+    return transits
+
+
+TRANSIT_OVERLAY_PLANETS = ['Sun', 'Moon', 'Mercury', 'Venus', 'Mars', 'Jupiter', 
+                           'Saturn', 'Uranus', 'Neptune', 'Pluto']
+
+# Major aspects drawn between transit and natal planets: (angle, name, orb)
+TRANSIT_OVERLAY_ASPECTS = [(0, 'Conjunction', 2), (180, 'Opposition', 2), (90, 'Square', 2), (120, 'Trine', 2)]
+
+TRANSIT_ASPECT_COLORS = {'Conjunction': '#FF00FF', 'Opposition': '#FF6B6B',
+                         'Square': '#FF4500', 'Trine': '#4ECDC4'}
+
+
+def find_transit_overlay_aspects(natal_planets: Dict, transit_planets: Dict) -> List[Tuple[str, str, str]]:
+    """(transit planet, natal planet, aspect name) for every aspect line of the overlay"""
+    pairs = []
+    for t_planet in TRANSIT_OVERLAY_PLANETS:
+        if t_planet not in transit_planets:
+            continue
+        t_long = transit_planets[t_planet]['longitude']
+        for n_planet, n_data in natal_planets.items():
+            diff = abs(t_long - n_data['longitude'])
+            if diff > 180:
+                diff = 360 - diff
+            for aspect_deg, aspect_name, max_orb in TRANSIT_OVERLAY_ASPECTS:
+                if abs(diff - aspect_deg) <= max_orb:
+                    pairs.append((t_planet, n_planet, aspect_name))
+    return pairs
+
+
+# ============== Synastry ==============
+
+SYNASTRY_PLANETS = ['Sun', 'Moon', 'Mercury', 'Venus', 'Mars', 'Jupiter', 'Saturn', 'Uranus', 'Neptune', 'Pluto']
+
+SYNASTRY_ASPECT_TABLE = AspectTable([
+    (0, "Conjunction", 8),
+    (60, "Sextile", 6),
+    (90, "Square", 8),
+    (120, "Trine", 8),
+    (180, "Opposition", 8)
+])
+
+
+SYNASTRY_ASPECT_LETTERS = {'Conjunction': 'C', 'Opposition': 'O', 'Square': 'X',
+                           'Trine': 'T', 'Sextile': 'S'}
+
+
+def calculate_synastry_aspects(person1_planets: Dict, person2_planets: Dict) -> List[Dict]:
+    """Calculate synastry aspects between two people's planets"""
+    planets1 = [p for p in SYNASTRY_PLANETS if p in person1_planets]
+    planets2 = [p for p in SYNASTRY_PLANETS if p in person2_planets]
+    hits = find_aspects(
+        [person1_planets[p]['longitude'] for p in planets1],
+        [person2_planets[p]['longitude'] for p in planets2],
+        table=SYNASTRY_ASPECT_TABLE
+    )
+    
+    aspects = []
+    for i, j, k, orb in zip(hits['i'].tolist(), hits['j'].tolist(),
+                            hits['aspect'].tolist(), hits['orb'].tolist()):
+        aspects.append({
+            'p1': planets1[i],
+            'p2': planets2[j],
+            'type': SYNASTRY_ASPECT_TABLE.names[k],
+            'orb': orb,
+            'exact': orb < 1.0
+        })
+    
+    return aspects
@@ -0,0 +1,333 @@
+"""
+Annual event calendar
+Ingresses, stations, lunations and eclipses of one year, computed once and kept on disk
+
+None of these events depend on the natal chart, so they are found once per
+year for everybody and stored as one structured array (``EVENT_DTYPE``,
+sorted by time):
+
+    ingress          sign changes of every body except the Moon
+    station          retrograde and direct stations, Mercury to Pluto
+    new_moon         Sun-Moon conjunctions
+    full_moon        Sun-Moon oppositions
+    solar_eclipse    a New Moon that is a solar eclipse (``detail`` = type)
+    lunar_eclipse    a Full Moon that is a lunar eclipse (``detail`` = type)
+
+The calendar spans the UT year plus ``MARGIN_DAYS`` on either side, so it
+covers the local calendar year of every time zone. ``get_year_calendar``
+loads ``year_calendar_<year>.npz`` from ``$SWISS_HOROSCOPE_CALENDAR_DIR`` (or
+``~/.cache/swiss-horoscope/calendars``), building and saving it on first use
+(once per year and process; a file that cannot be read is rebuilt). A personal
+yearly report is then ``natal_contacts``: bisections and array comparisons
+against the natal points, with no ephemeris calls. Files record the format and
+pyswisseph versions and are rebuilt when either changes.
+
+Build ahead of time:
+
+    python -m core.year_calendar build --start 2024 --end 2030
+"""
+
+import argparse
+import os
+import tempfile
+import threading
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Dict, List, Mapping, Optional
+
+import numpy as np
+import swisseph as swe
+
+from .aspect_engine import AspectTable, find_aspects
+from .ephemeris_cache import calc_longitude_speed
+from .month_sweep import MONTHLY_BODIES, MOON_PHASES
+from .transit_solver import (
+    MAX_ITER, SIGNS, TOL_DEG, TRANSIT_BODIES, BodyTrack, _calc, _wrap180,
+    find_ingresses, find_stations,
+)
+
+
+FORMAT_VERSION = 1
+
+# Extra days on either side of the UT year (local years start up to 14 h off)
+MARGIN_DAYS = 1.0
+
+EVENT_DTYPE = np.dtype([
+    ('jd', np.float64),
+    ('kind', 'U13'),
+    ('planet', 'U8'),
+    ('longitude', np.float64),
+    ('sign', 'U11'),
+    ('detail', 'U10'),
+])
+
+STATION_BODIES = [p for p in MONTHLY_BODIES if p != 'Sun']
+
+# Slow bodies whose ingresses are read as a change of natal house
+SLOW_BODIES = ['Jupiter', 'Saturn', 'Uranus', 'Neptune', 'Pluto']
+
+SOLAR_ECLIPSE_TYPES = [
+    (swe.ECL_TOTAL, 'total'), (swe.ECL_ANNULAR, 'annular'),
+    (swe.ECL_ANNULAR_TOTAL, 'hybrid'), (swe.ECL_PARTIAL, 'partial'),
+]
+LUNAR_ECLIPSE_TYPES = [
+    (swe.ECL_TOTAL, 'total'), (swe.ECL_PARTIAL, 'partial'), (swe.ECL_PENUMBRAL, 'penumbral'),
+]
+
+# Natal contacts per event kind: tight orbs, only the hard aspects for stations
+CONTACT_TABLES = {
+    'station': AspectTable([(0, "Conjunction", 2), (90, "Square", 2), (180, "Opposition", 2)]),
+    'new_moon': AspectTable([(0, "Conjunction", 3)]),
+    'full_moon': AspectTable([(0, "Conjunction", 3)]),
+    'solar_eclipse': AspectTable([(0, "Conjunction", 5), (180, "Opposition", 5)]),
+    'lunar_eclipse': AspectTable([(0, "Conjunction", 5), (180, "Opposition", 5)]),
+}
+
+EVENT_LABELS = {
+    'ingress': {"en": "enters", "th": "ย้ายเข้า"},
+    'retrograde': {"en": "stations retrograde", "th": "เริ่มเดินถอยหลัง"},
+    'direct': {"en": "stations direct", "th": "กลับมาเดินหน้า"},
+    'new_moon': MOON_PHASES[0],
+    'full_moon': MOON_PHASES[2],
+    'solar_eclipse': {"en": "Solar Eclipse", "th": "สุริยุปราคา"},
+    'lunar_eclipse': {"en": "Lunar Eclipse", "th": "จันทรุปราคา"},
+}
+
+ENV_DIR = 'SWISS_HOROSCOPE_CALENDAR_DIR'
+# Per-user cache directory, never the source tree
+DEFAULT_DIR = os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'),
+                           'swiss-horoscope', 'calendars')
+
+
+def year_range(year: int) -> tuple:
+    """UT Julian Days covered by a year's calendar"""
+    return swe.julday(year, 1, 1, 0.0) - MARGIN_DAYS, swe.julday(year + 1, 1, 1, 0.0) + MARGIN_DAYS
+
+
+def _lunations(start_jd: float, end_jd: float) -> List[tuple]:
+    """(jd, 'new_moon' | 'full_moon', Moon longitude) from daily samples, polished on Swiss Ephemeris"""
+    jds = np.arange(start_jd, end_jd + 1.0, 1.0)
+    sun = np.array([calc_longitude_speed(jd, swe.SUN)[0] for jd in jds.tolist()])
+    moon = np.array([calc_longitude_speed(jd, swe.MOON)[0] for jd in jds.tolist()])
+    elongation = (moon - sun) % 360
+    half = (elongation // 180).astype(int)
+    
+    events = []
+    for i in np.nonzero(half[1:] != half[:-1])[0].tolist():
+        target = 180.0 * half[i + 1]
+        before, after = _wrap180(elongation[i] - target), _wrap180(elongation[i + 1] - target)
+        t = jds[i] + before / (before - after)
+        for _ in range(MAX_ITER):
+            moon_lon, moon_speed = _calc(t, swe.MOON)
+            sun_lon, sun_speed = _calc(t, swe.SUN)
+            f = _wrap180(moon_lon - sun_lon - target)
+            if abs(f) < TOL_DEG:
+                break
+            t -= f / (moon_speed - sun_speed)
+        if start_jd <= t < end_jd:
+            events.append((t, 'full_moon' if half[i + 1] else 'new_moon', moon_lon % 360))
+    return events
+
+
+def _eclipses(start_jd: float, end_jd: float, when, types) -> List[tuple]:
+    """(jd of maximum, type) of every eclipse found by a Swiss Ephemeris search function"""
+    eclipses = []
+    jd = start_jd
+    while True:
+        flags, times = when(jd, swe.FLG_SWIEPH, 0, False)
+        if times[0] >= end_jd:
+            return eclipses
+        eclipses.append((times[0], next((name for bit, name in types if flags & bit), 'partial')))
+        jd = times[0] + 20
+
+
+class YearCalendar:
+    """Chart-independent events of one year, as a time-ordered ``EVENT_DTYPE`` array"""
+    
+    def __init__(self, year: int, events: np.ndarray, start_longitudes: Mapping[str, float]):
+        """Wrap built or loaded events; ``start_longitudes`` are the bodies at the start of the range"""
+        self.year = year
+        self.start_jd, self.end_jd = year_range(year)
+        self.events = events
+        self.start_longitudes = dict(start_longitudes)
+        
+        # Ingress times and signs per body, for sign lookups by bisection
+        self._ingresses: Dict[str, tuple] = {}
+        ingresses = events[events['kind'] == 'ingress']
+        for planet in self.start_longitudes:
+            rows = ingresses[ingresses['planet'] == planet]
+            self._ingresses[planet] = (rows['jd'].tolist(), rows['sign'].tolist())
+    
+    def __len__(self) -> int:
+        return len(self.events)
+    
+    @classmethod
+    def build(cls, year: int) -> "YearCalendar":
+        """Find every event of the year with the exact-time solver and Swiss Ephemeris"""
+        start_jd, end_jd = year_range(year)
+        rows = []
+        for name in MONTHLY_BODIES:
+            body = TRANSIT_BODIES[name]
+            track = BodyTrack(body, start_jd, end_jd)
+            for e in find_ingresses(body, start_jd, end_jd, name, track):
+                # Longitude of the sign boundary crossed
+                lon = (SIGNS.index(e['sign']) + e['retrograde']) * 30.0 % 360
+                rows.append((e['jd'], 'ingress', name, lon, e['sign'], 'retrograde' if e['retrograde'] else ''))
+            if name in STATION_BODIES:
+                for e in find_stations(body, start_jd, end_jd, name, track):
+                    rows.append((e['jd'], 'station', name, e['longitude'], e['sign'], e['type']))
+        
+        # Eclipses are marked on the lunation they fall on
+        eclipses = {
+            'new_moon': _eclipses(start_jd, end_jd, swe.sol_eclipse_when_glob, SOLAR_ECLIPSE_TYPES),
+            'full_moon': _eclipses(start_jd, end_jd, swe.lun_eclipse_when, LUNAR_ECLIPSE_TYPES),
+        }
+        for jd, kind, lon in _lunations(start_jd, end_jd):
+            detail = next((t for e_jd, t in eclipses[kind] if abs(e_jd - jd) < 1.0), '')
+            if detail:
+                kind = 'solar_eclipse' if kind == 'new_moon' else 'lunar_eclipse'
+            rows.append((jd, kind, 'Moon', lon, SIGNS[int(lon / 30) % 12], detail))
+        
+        events = np.array(rows, dtype=EVENT_DTYPE)
+        events = events[np.argsort(events['jd'], kind='stable')]
+        start_longitudes = {name: _calc(start_jd, TRANSIT_BODIES[name])[0] for name in TRANSIT_BODIES}
+        return cls(year, events, start_longitudes)
+    
+    # ============== Lookups ==============
+    
+    def between(self, start_jd: float, end_jd: float) -> np.ndarray:
+        """Events with start_jd <= jd < end_jd"""
+        jds = self.events['jd']
+        return self.events[np.searchsorted(jds, start_jd, 'left'):np.searchsorted(jds, end_jd, 'left')]
+    
+    def sign_at(self, planet: str, jd: float) -> str:
+        """Sign of a body at a Julian Day inside the calendar"""
+        jds, signs = self._ingresses[planet]
+        i = bisect_right(jds, jd)
+        return signs[i - 1] if i else SIGNS[int(self.start_longitudes[planet] / 30) % 12]
+    
+    # ============== Persistence ==============
+    
+    def save(self, path: str):
+        """Write the calendar to a .npz file atomically"""
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        # A unique temporary file per writer, so concurrent saves never share one
+        with tempfile.NamedTemporaryFile(dir=directory, suffix='.npz', delete=False) as f:
+            tmp_path = f.name
+            try:
+                np.savez(
+                    f,
+                    meta=np.array([FORMAT_VERSION, self.year], dtype=np.int64),
+                    swe_version=np.array(swe.version),
+                    events=self.events,
+                    bodies=np.array(list(self.start_longitudes)),
+                    start_longitudes=np.array(list(self.start_longitudes.values())),
+                )
+            except BaseException:
+                f.close()
+                os.unlink(tmp_path)
+                raise
+        os.replace(tmp_path, path)
+    
+    @classmethod
+    def load(cls, path: str) -> "YearCalendar":
+        """Read a calendar written by ``save``"""
+        with np.load(path) as data:
+            version, year = data['meta'].tolist()
+            if version != FORMAT_VERSION or str(data['swe_version']) != swe.version:
+                raise ValueError(f"Calendar {path} was built by another format or pyswisseph version")
+            start_longitudes = dict(zip(data['bodies'].tolist(), data['start_longitudes'].tolist()))
+            return cls(year, data['events'], start_longitudes)
+
+
+def calendar_path(year: int, directory: Optional[str] = None) -> str:
+    """File of a year's calendar"""
+    directory = directory or os.environ.get(ENV_DIR, DEFAULT_DIR)
+    return os.path.join(directory, f"year_calendar_{year}.npz")
+
+
+_year_locks: Dict[int, threading.Lock] = {}
+_year_locks_guard = threading.Lock()
+
+
+@lru_cache(maxsize=8)
+def get_year_calendar(year: int) -> YearCalendar:
+    """Shared calendar of a year: loaded from disk, else built and saved for the next process"""
+    with _year_locks_guard:
+        lock = _year_locks.setdefault(year, threading.Lock())
+    # Threads that miss the lru_cache together wait here; the first one builds and saves
+    with lock:
+        path = calendar_path(year)
+        if os.path.exists(path):
+            try:
+                return YearCalendar.load(path)
+            except Exception:
+                # Truncated, corrupt or stale: rebuild it
+                pass
+        calendar = YearCalendar.build(year)
+        try:
+            calendar.save(path)
+        except OSError:
+            # Read-only deployments still work, the calendar just lives in memory
+            pass
+        return calendar
+
+
+def natal_contacts(events: np.ndarray, natal_points: Mapping[str, float]) -> List[Dict]:
+    """Calendar events that touch a natal chart, in time order
+    
+    ``natal_points`` maps names to longitudes. Stations, lunations and
+    eclipses count when they aspect a natal point (``CONTACT_TABLES``); with
+    an 'Ascendant' point, ingresses of the slow bodies count as a change of
+    house, counted in whole signs from the Ascendant. Each contact is the
+    event's fields plus ``natal``, ``aspect`` and ``orb`` (or ``house``).
+    """
+    names = list(natal_points)
+    natal = np.array([natal_points[n] for n in names], dtype=float)
+    contacts = []
+    
+    for kind, table in CONTACT_TABLES.items():
+        rows = events[events['kind'] == kind]
+        if not len(rows):
+            continue
+        hits = find_aspects(rows['longitude'], natal, table, sort=False)
+        for h in hits.tolist():
+            event = rows[h[1]]
+            contacts.append({
+                'jd': float(event['jd']), 'kind': kind, 'planet': str(event['planet']),
+                'sign': str(event['sign']), 'detail': str(event['detail']),
+                'natal': names[h[2]], 'aspect': table.names[h[3]], 'orb': float(h[5]),
+            })
+    
+    if 'Ascendant' in natal_points:
+        ascendant_sign = int(natal_points['Ascendant'] / 30) % 12
+        slow = events[(events['kind'] == 'ingress') & np.isin(events['planet'], SLOW_BODIES)]
+        for jd, kind, planet, _, sign, detail in slow.tolist():
+            contacts.append({
+                'jd': jd, 'kind': kind, 'planet': planet, 'sign': sign, 'detail': detail,
+                'house': (SIGNS.index(sign) - ascendant_sign) % 12 + 1,
+            })
+    
+    contacts.sort(key=lambda c: c['jd'])
+    return contacts
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build annual event calendars")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    build_parser = subparsers.add_parser("build", help="compute and save one calendar per year")
+    build_parser.add_argument("--start", type=int, required=True, help="first year (inclusive)")
+    build_parser.add_argument("--end", type=int, required=True, help="last year (exclusive)")
+    build_parser.add_argument("--output-dir", default=None, help=f"default ${ENV_DIR} or ~/.cache/swiss-horoscope/calendars")
+    build_parser.add_argument("--ephe-path", default=None, help="Swiss Ephemeris data directory")
+    args = parser.parse_args()
+    
+    if args.ephe_path:
+        swe.set_ephe_path(args.ephe_path)
+    
+    for year in range(args.start, args.end):
+        path = calendar_path(year, args.output_dir)
+        calendar = YearCalendar.build(year)
+        calendar.save(path)
+        print(f"Saved {path} ({len(calendar)} events)")